@@ -14,3 +14,9 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_asgi_application()
+
+# 무거운 모듈 임포트, 템플릿/프롬프트 준비, LLM 클라이언트 생성을 서버 시작 시 마쳐 첫 요청이
+# 그 비용을 떠안지 않게 함 (gunicorn preload_app이면 마스터에서 한 번, 관리 명령에서는 실행 안 함)
+from evaluator.startup import warm_up_server  # noqa: E402
+
+warm_up_server()
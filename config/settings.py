@@ -58,7 +58,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # 가장 바깥에서 전체 요청 시간을 재도록 맨 앞에 둠
+    "evaluator.metrics.metrics_middleware",
     "django.middleware.security.SecurityMiddleware",
+    # 정적 파일을 압축/해시된 파일명과 장기 캐시 헤더로 직접 제공 (collectstatic 필요)
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    # HTML/JSON 응답 압축 (SSE 스트림은 제외)
+    "evaluator.middleware.StreamSafeGZipMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -90,12 +96,58 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+# DB_ENGINE=sqlite(기본값) 또는 postgresql
+
+DB_ENGINE = os.getenv("DB_ENGINE", "sqlite").lower()
+
+if DB_ENGINE in ("postgres", "postgresql"):
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.getenv("DB_NAME", "fitup"),
+            "USER": os.getenv("DB_USER", "fitup"),
+            "PASSWORD": os.getenv("DB_PASSWORD", ""),
+            "HOST": os.getenv("DB_HOST", "localhost"),
+            "PORT": os.getenv("DB_PORT", "5432"),
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {},
+        }
     }
-}
+    if os.getenv("DB_POOL", "False").lower() in ("true", "1", "yes"):
+        # psycopg 연결 풀 (psycopg[pool] 필요). 풀은 영구 연결(CONN_MAX_AGE)과 함께 쓸 수 없음
+        DATABASES["default"]["OPTIONS"]["pool"] = {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", 2)),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", 10)),
+            "timeout": int(os.getenv("DB_POOL_TIMEOUT", 10)),
+        }
+    else:
+        # 요청마다 새로 연결하지 않고 워커별 연결을 재사용
+        DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", 60))
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.getenv("SQLITE_PATH", BASE_DIR / "db.sqlite3"),
+            "OPTIONS": {},
+        }
+    }
+    if os.getenv("SQLITE_TUNING", "True").lower() in ("true", "1", "yes"):
+        # 여러 워커가 동시에 기록해도 "database is locked"가 나지 않도록 설정
+        # - WAL: 읽기와 쓰기가 서로 막지 않음
+        # - timeout: 잠금 대기 시간(busy_timeout, 초)
+        # - IMMEDIATE: 트랜잭션 시작 시 쓰기 잠금을 잡아 읽기→쓰기 승격 중 충돌 방지
+        DATABASES["default"]["OPTIONS"].update(
+            {
+                "init_command": (
+                    "PRAGMA journal_mode=WAL;"
+                    "PRAGMA synchronous=NORMAL;"
+                    f"PRAGMA mmap_size={int(os.getenv('SQLITE_MMAP_SIZE', 128 * 1024 * 1024))};"
+                    "PRAGMA temp_store=MEMORY;"
+                ),
+                "timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT", 20)),
+                "transaction_mode": "IMMEDIATE",
+            }
+        )
 
 
 # Password validation
@@ -135,5 +187,143 @@ USE_TZ = True
 STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# collectstatic 시 파일명에 내용 해시를 붙이고 .gz/.br로 미리 압축 (brotli 패키지가 있으면 .br 생성)
+# 해시된 파일은 WhiteNoise가 Cache-Control: max-age=315360000, immutable로 제공
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+}
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+# 서버 시작 시(config/wsgi.py, config/asgi.py) LLM 클라이언트(연결 풀) 미리 생성
+# 연결 풀 크기/타임아웃은 LLM_HTTP_* 환경변수로 조정 (README 참고)
+LLM_WARMUP = os.getenv("LLM_WARMUP", "True").lower() in ("true", "1", "yes")
+
+# 서버 시작 시 SDK/PyMuPDF/markdown 임포트, 템플릿·정적 파일 매니페스트 준비
+# (관리 명령은 서버 진입점을 거치지 않으므로 영향 없음)
+STARTUP_PRELOAD = os.getenv("STARTUP_PRELOAD", "True").lower() in ("true", "1", "yes")
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# 요청 한도를 CacheRateLimiter로 처리하려면 Redis 등 공유 캐시를 지정하세요.
+# 예: DJANGO_CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+#     DJANGO_CACHE_LOCATION=redis://127.0.0.1:6379/0
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", ""),
+    }
+}
+
+
+# IP별 일일 분석 요청 한도
+# 기본값은 DB 카운터로 모든 gunicorn/분석 워커 프로세스가 한도를 공유합니다.
+# CacheRateLimiter는 공유 캐시(Redis 등)에서만 동작합니다 (LocMemCache면 시작 시 거부).
+RATE_LIMIT = {
+    "BACKEND": os.getenv(
+        "RATE_LIMIT_BACKEND", "evaluator.ratelimit.DatabaseCounterRateLimiter"
+    ),
+    "DAILY_LIMIT": int(os.getenv("RATE_LIMIT_DAILY_LIMIT", 3)),
+    "CACHE_ALIAS": "default",
+    "FLUSH_INTERVAL": 2.0,  # RequestLog 일괄 저장 주기(초)
+    # 페이지에 표시할 남은 횟수를 캐시에 보관하는 시간(초, 0이면 매번 DB 조회)
+    "USAGE_CACHE_TTL": int(os.getenv("RATE_LIMIT_USAGE_CACHE_TTL", 30)),
+    # 단일 프로세스(runserver 등)에서 LocMemCache로 CacheRateLimiter를 쓸 때만 True
+    "ALLOW_LOCAL_CACHE": os.getenv("RATE_LIMIT_ALLOW_LOCAL_CACHE", "False").lower()
+    in ("true", "1", "yes"),
+}
+
+
+# RequestLog 원본 보존 일수 (이후 prune_request_logs 명령으로 일별 집계 후 삭제)
+REQUEST_LOG_RETENTION_DAYS = int(os.getenv("REQUEST_LOG_RETENTION_DAYS", 30))
+
+
+# 분석 결과 캐시 (동일 JD + 이력서 재제출 시 LLM 호출 생략)
+RESULT_CACHE = {
+    "ENABLED": os.getenv("RESULT_CACHE_ENABLED", "True").lower() in ("true", "1", "yes"),
+    "TTL": int(os.getenv("RESULT_CACHE_TTL", 7 * 24 * 60 * 60)),  # 초
+    "MAX_ENTRIES": int(os.getenv("RESULT_CACHE_MAX_ENTRIES", 1000)),
+}
+
+
+# 분석 결과 저장과 고유 주소(/e/<id>/): POST 후 결과 페이지로 리다이렉트 (POST-redirect-GET)
+PERMALINK = {
+    "ENABLED": os.getenv("PERMALINK_ENABLED", "True").lower() in ("true", "1", "yes"),
+    # 결과 페이지를 처음 볼 때 렌더링한 HTML을 저장해 두고 재사용
+    "PRERENDER": os.getenv("PERMALINK_PRERENDER", "True").lower() in ("true", "1", "yes"),
+    # 브라우저가 재검증 없이 사용할 시간(초), 이후에는 ETag로 조건부 요청
+    "MAX_AGE": int(os.getenv("PERMALINK_MAX_AGE", 300)),
+}
+
+
+# 업로드 파일 파싱 결과 캐시 (같은 파일 재업로드 시 PDF 파싱 생략)
+DOCUMENT_CACHE = {
+    "ENABLED": os.getenv("DOCUMENT_CACHE_ENABLED", "True").lower() in ("true", "1", "yes"),
+    "MAX_ENTRIES": int(os.getenv("DOCUMENT_CACHE_MAX_ENTRIES", 500)),
+    # 저장된 추출 텍스트 총 글자 수 예산 (초과 시 오래된 항목부터 제거)
+    "MAX_CHARS": int(os.getenv("DOCUMENT_CACHE_MAX_CHARS", 20_000_000)),
+}
+
+
+# LLM 입력 압축 (공백/머리글 정리, 중복 제거, 토큰 예산 초과 시 섹션 우선순위로 자르기)
+INPUT_COMPACTION = {
+    "ENABLED": os.getenv("INPUT_COMPACTION_ENABLED", "True").lower() in ("true", "1", "yes"),
+    # 시스템 프롬프트 포함 전체 입력 토큰 예산
+    "MAX_INPUT_TOKENS": int(os.getenv("LLM_MAX_INPUT_TOKENS", 24000)),
+    # 예산 초과 시에도 섹션별로 남길 최소 토큰 수
+    "MIN_SECTION_TOKENS": int(os.getenv("LLM_MIN_SECTION_TOKENS", 500)),
+}
+
+# 구조화(JSON) 출력: 점수 카테고리를 JSON Schema/도구 호출로 받아 마크다운은 서버에서 생성
+STRUCTURED_OUTPUT = {
+    "ENABLED": os.getenv("LLM_STRUCTURED_OUTPUT", "False").lower() in ("true", "1", "yes"),
+}
+
+# LLM 호출 전 로컬 키워드/기술 스택 매칭 (커버리지 점수 즉시 표시, 배치 사전 정렬)
+KEYWORD_MATCH = {
+    "ENABLED": os.getenv("KEYWORD_MATCH_ENABLED", "True").lower() in ("true", "1", "yes"),
+    # 매칭 결과를 LLM 입력에 참고 정보로 덧붙임 (입력이 달라지므로 기본값은 꺼짐)
+    "HINTS": os.getenv("LLM_KEYWORD_HINTS", "False").lower() in ("true", "1", "yes"),
+    # 추가 동의어 JSON 파일 ({"표준 이름": ["별칭", ...]})
+    "SYNONYMS_PATH": os.getenv("KEYWORD_SYNONYMS_PATH", ""),
+}
+
+# 배치 분석의 JD-이력서 로컬 관련도 (TF-IDF/BM25, numpy/scipy 필요)
+SIMILARITY = {
+    "ENABLED": os.getenv("SIMILARITY_RANKING", "False").lower() in ("true", "1", "yes"),
+    # tfidf(코사인 유사도) 또는 bm25
+    "METHOD": os.getenv("SIMILARITY_METHOD", "tfidf"),
+}
+
+# 2단계 분석: 소형 모델의 빠른 평가 점수가 기준 이상일 때만 상세 분석
+TRIAGE = {
+    "ENABLED": os.getenv("LLM_TRIAGE", "False").lower() in ("true", "1", "yes"),
+    "THRESHOLD": int(os.getenv("LLM_TRIAGE_THRESHOLD", 60)),
+}
+
+# 배치 분석 (evaluate_batch 명령, /batch/ 엔드포인트)
+BATCH_EVALUATION = {
+    # 한 번에 분석할 수 있는 최대 이력서 수
+    "MAX_FILES": int(os.getenv("BATCH_MAX_FILES", 200)),
+    # 이력서 파싱 스레드 수
+    "PARSE_WORKERS": int(os.getenv("BATCH_PARSE_WORKERS", 4)),
+    # evaluate_batch의 기본 동시 LLM 호출 수
+    "CONCURRENCY": int(os.getenv("BATCH_CONCURRENCY", 8)),
+}
+
+# 단계별 지연 측정과 /metrics (Prometheus 텍스트 형식)
+METRICS = {
+    "ENABLED": os.getenv("METRICS_ENABLED", "True").lower() in ("true", "1", "yes"),
+    # 응답에 Server-Timing 헤더 추가 (브라우저 개발자 도구에서 단계별 시간 확인)
+    "SERVER_TIMING": os.getenv("METRICS_SERVER_TIMING", "False").lower() in ("true", "1", "yes"),
+    # /metrics는 스태프 로그인 또는 Authorization: Bearer <token> 필요
+    # (토큰이 없으면 스태프만, DEBUG 모드에서는 누구나)
+    "TOKEN": os.getenv("METRICS_TOKEN", ""),
+}
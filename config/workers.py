@@ -0,0 +1,20 @@
+"""Gunicorn worker classes for the ASGI profile (see gunicorn.conf.py)."""
+
+try:
+    from uvicorn_worker import UvicornWorker
+except ImportError:
+    # uvicorn 0.30 이전에는 uvicorn에 포함되어 있음 (이후 버전에서는 deprecated)
+    from uvicorn.workers import UvicornWorker
+
+
+class DrainingUvicornWorker(UvicornWorker):
+    """gunicorn 설정을 uvicorn의 동시 연결 제한과 종료 대기 시간에 연결한 워커.
+
+    - ``worker_connections``: 워커당 최대 동시 연결 (초과 시 503으로 거절해 메모리 보호)
+    - ``graceful_timeout``: 종료/재시작 시 진행 중인 분석(SSE 스트림 포함)을 기다리는 시간
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.config.limit_concurrency = self.cfg.worker_connections
+        self.config.timeout_graceful_shutdown = self.cfg.graceful_timeout
@@ -0,0 +1,588 @@
+"""Batch evaluation of one JD against many resumes.
+
+채용 담당자가 JD 하나에 수십~수백 개의 이력서를 한 번에 분석할 수 있도록,
+zip 파일이나 디렉터리의 이력서를 동시에 파싱하고 제한된 동시성으로 LLM을 호출합니다.
+결과는 끝나는 순서대로 JSONL로 기록하고, 마지막에 총점 순위 요약을 만듭니다.
+"""
+
+import json
+import re
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path, PurePosixPath
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import close_old_connections
+
+from .compaction import compact_inputs
+from .document_cache import parse_file_cached
+from .forms import EvaluationForm
+from .keyword_match import SkillIndex
+from .keyword_match import get_config as get_keyword_config
+from .result_cache import get_cached_result, make_cache_key, set_cached_result
+from .similarity import get_config as get_similarity_config
+from .similarity import similarity_scores
+from .structured import (
+    load_evaluation,
+    output_options,
+    parse_result,
+    to_markdown,
+    total_score,
+)
+from .triage import TriageResult, run_triage
+
+SUPPORTED_EXTENSIONS = tuple(EvaluationForm.ALLOWED_EXTENSIONS)
+
+# "**총점**: 78/100점", "- **총점: 78/100**" 등
+TOTAL_SCORE_RE = re.compile(r"총점\s*\**\s*[:：]?\s*\**\s*(\d{1,3})\s*/\s*100")
+
+
+class BatchInputError(ValueError):
+    """Raised when the batch input (zip/directory) cannot be used."""
+
+
+def get_config() -> dict:
+    """settings.BATCH_EVALUATION 값을 기본값과 합쳐 반환합니다."""
+    config = {"MAX_FILES": 200, "PARSE_WORKERS": 4, "CONCURRENCY": 8}
+    config.update(getattr(settings, "BATCH_EVALUATION", {}))
+    return config
+
+
+@dataclass
+class BatchItem:
+    """배치 안의 이력서 한 건."""
+
+    name: str
+    user_message: str = ""
+    cache_key: str = ""
+    cached_result: str | None = None
+    score: int | None = None
+    error: str = ""
+    # 로컬 키워드 매칭 결과 (KeywordMatch.to_dict())
+    keywords: dict | None = None
+    # JD와의 TF-IDF/BM25 관련도 (0~100, SIMILARITY 비활성화 시 None)
+    similarity: int | None = None
+
+
+def extract_total_score(result: str) -> int | None:
+    """분석 결과에서 총점(0~100)을 찾습니다.
+
+    구조화(JSON) 결과는 total_score 필드를 읽고, 마크다운 결과는 '총점' 줄을 찾습니다.
+    """
+    data = parse_result(result)
+    if data is not None:
+        return total_score(data)
+    match = TOTAL_SCORE_RE.search(result or "")
+    if match is None:
+        return None
+    return min(100, int(match.group(1)))
+
+
+def _is_resume(name: str) -> bool:
+    path = PurePosixPath(name)
+    if any(part.startswith((".", "__MACOSX")) for part in path.parts):
+        return False
+    return path.suffix.lower() in SUPPORTED_EXTENSIONS
+
+
+def iter_resume_files(source):
+    """zip 파일(경로 또는 업로드) 또는 디렉터리에서 이력서 파일을 꺼냅니다.
+
+    Yields:
+        tuple: (파일 이름, 업로드 파일 객체/경로 또는 None, 오류 메시지)
+
+    Raises:
+        BatchInputError: zip이 아니거나 파일 수가 MAX_FILES를 넘는 경우
+    """
+    max_files = get_config()["MAX_FILES"]
+    max_size = EvaluationForm.MAX_FILE_SIZE
+
+    if isinstance(source, (str, Path)) and Path(source).is_dir():
+        paths = sorted(
+            path
+            for path in Path(source).rglob("*")
+            if path.is_file() and _is_resume(path.relative_to(source).as_posix())
+        )
+        if len(paths) > max_files:
+            raise BatchInputError(f"이력서는 최대 {max_files}개까지 분석할 수 있습니다.")
+        for path in paths:
+            name = path.relative_to(source).as_posix()
+            if path.stat().st_size > max_size:
+                yield name, None, "파일 크기가 너무 큽니다."
+                continue
+            # 디렉터리의 파일은 파싱하는 스레드에서 열도록 경로로 전달
+            yield name, path, ""
+        return
+
+    try:
+        archive = zipfile.ZipFile(source)
+    except (zipfile.BadZipFile, OSError) as e:
+        raise BatchInputError(f"zip 파일을 열 수 없습니다: {e}")
+
+    with archive:
+        entries = [
+            info
+            for info in archive.infolist()
+            if not info.is_dir() and _is_resume(info.filename)
+        ]
+        if len(entries) > max_files:
+            raise BatchInputError(f"이력서는 최대 {max_files}개까지 분석할 수 있습니다.")
+        for info in entries:
+            # 압축 해제 전 크기로 확인하여 압축 폭탄을 메모리에 풀지 않음
+            if info.file_size > max_size:
+                yield info.filename, None, "파일 크기가 너무 큽니다."
+                continue
+            data = archive.read(info)
+            yield (
+                info.filename,
+                SimpleUploadedFile(PurePosixPath(info.filename).name, data),
+                "",
+            )
+
+
+def _parse_one(name: str, file) -> tuple[str, str | None, str]:
+    close_old_connections()
+    try:
+        if isinstance(file, Path):
+            with file.open("rb") as handle:
+                return name, parse_file_cached(File(handle, name=file.name)), ""
+        return name, parse_file_cached(file), ""
+    except Exception as e:
+        return name, None, f"파일 파싱 오류: {str(e)}"
+    finally:
+        close_old_connections()
+
+
+def prepare_batch(
+    jd: str,
+    source,
+    provider: str,
+    model: str,
+    system_prompt: str,
+    use_cache: bool = True,
+    similarity_method: str = None,
+) -> list[BatchItem]:
+    """이력서를 동시에 파싱하고 이력서별 LLM 입력과 캐시 결과를 준비합니다.
+
+    similarity_method("tfidf"/"bm25")를 지정하거나 SIMILARITY가 활성화되어 있으면
+    JD와의 로컬 관련도도 함께 계산합니다.
+
+    Returns:
+        파일 이름 순으로 정렬된 BatchItem 목록
+    """
+    from .views import build_user_message
+
+    config = get_config()
+    keyword_config = get_keyword_config()
+    # 구조화 출력 모드에서는 캐시 키도 구조화 프롬프트 기준
+    system_prompt, _ = output_options(system_prompt, provider)
+    items = []
+    parsed = []
+    with ThreadPoolExecutor(max_workers=config["PARSE_WORKERS"]) as executor:
+        futures = []
+        for name, file, error in iter_resume_files(source):
+            if error:
+                items.append(BatchItem(name=name, error=error))
+                continue
+            futures.append(executor.submit(_parse_one, name, file))
+
+        for future in as_completed(futures):
+            name, text, error = future.result()
+            if error:
+                items.append(BatchItem(name=name, error=error))
+            else:
+                parsed.append((name, text))
+
+    # 모든 이력서의 키워드를 역색인에 넣고 JD 키워드 커버리지를 한 번에 계산
+    matches = [None] * len(parsed)
+    if keyword_config["ENABLED"]:
+        index = SkillIndex()
+        for _, text in parsed:
+            index.add(text)
+        matches = index.match(jd)
+
+    # 모든 이력서의 JD 관련도를 희소 행렬 곱 한 번으로 계산
+    similarity_config = get_similarity_config()
+    if similarity_method is None and similarity_config["ENABLED"]:
+        similarity_method = similarity_config["METHOD"]
+    similarities = [None] * len(parsed)
+    if parsed and similarity_method:
+        similarities = similarity_scores(jd, [text for _, text in parsed], similarity_method)
+
+    for (name, text), match, similarity in zip(parsed, matches, similarities):
+        compacted = compact_inputs(jd, text, None, provider, model, system_prompt)
+        hints = match.to_hints() if match is not None and keyword_config["HINTS"] else ""
+        # JD가 이력서보다 앞에 오므로 배치 안에서는 시스템 프롬프트와 JD까지가
+        # 공통 prefix가 되어 provider 프롬프트 캐시에 적중함
+        item = BatchItem(
+            name=name,
+            user_message=build_user_message(compacted.jd, compacted.resume, hints=hints),
+            cache_key=make_cache_key(
+                provider, model, system_prompt, compacted.jd, compacted.resume, hints=hints
+            ),
+            keywords=match.to_dict() if match is not None else None,
+            similarity=similarity,
+        )
+        if use_cache:
+            item.cached_result = get_cached_result(item.cache_key)
+            item.score = extract_total_score(item.cached_result)
+        items.append(item)
+
+    if not items:
+        raise BatchInputError("분석할 이력서(.pdf, .md, .txt)가 없습니다.")
+    return sorted(items, key=lambda item: item.name)
+
+
+def make_record(
+    item: BatchItem,
+    provider: str,
+    model: str,
+    result: str = None,
+    error: str = "",
+    triage: TriageResult = None,
+    keywords_only: bool = False,
+) -> dict:
+    """JSONL 한 줄에 쓸 결과를 만듭니다 (request_id/title/body 형식).
+
+    result를 넘기지 않으면 캐시된 결과(또는 파싱 오류)로 기록합니다.
+    상세 분석 없이 빠른 평가로 끝난 항목은 빠른 평가 점수를, LLM을 호출하지 않은
+    항목(keywords_only)은 키워드 커버리지 점수를 score로 사용합니다.
+    """
+    cached = result is None and item.cached_result is not None
+    if result is None:
+        result = item.cached_result
+    error = error or item.error
+    score = extract_total_score(result)
+    evaluation = parse_result(result)
+    triage_only = triage is not None and score is None and not error
+    if triage_only:
+        score = triage.score
+    keywords_only = (
+        keywords_only
+        and not cached
+        and not error
+        and (item.keywords is not None or item.similarity is not None)
+    )
+    if keywords_only:
+        score = item.keywords["score"] if item.keywords is not None else None
+        result = "\n".join(
+            line
+            for line in (
+                item.keywords["summary"] if item.keywords is not None else "",
+                f"JD 유사도 {item.similarity}점" if item.similarity is not None else "",
+            )
+            if line
+        )
+
+    if error:
+        title = f"{item.name} - 실패"
+    elif triage_only:
+        title = f"{item.name} - 빠른 평가 {score}/100"
+    elif keywords_only:
+        title = f"{item.name} - 키워드 커버리지 {score if score is not None else '-'}/100"
+    elif score is None:
+        title = f"{item.name} - 총점 미확인"
+    else:
+        title = f"{item.name} - 총점 {score}/100"
+    return {
+        "request_id": item.name,
+        "title": title,
+        "body": (result if keywords_only else to_markdown(result)) if result else "",
+        "status": "failed" if error else "succeeded",
+        "score": score,
+        "provider": provider,
+        "model": model,
+        "cached": cached,
+        "error": error,
+        "evaluation": evaluation,
+        # LLM 없이 키워드 매칭만 했으면 "keywords", 빠른 평가로 끝났으면 "triage"
+        "stage": "keywords" if keywords_only else "triage" if triage_only else "full",
+        "triage": triage.to_dict() if triage is not None else None,
+        "keywords": item.keywords,
+        "similarity": item.similarity,
+    }
+
+
+def record_from_job(job, model: str) -> dict:
+    """배치 작업(EvaluationJob)을 JSONL 결과 형식으로 변환합니다."""
+    item = BatchItem(name=job.name, error=job.error)
+    if job.status != job.Status.SUCCEEDED:
+        return make_record(item, job.provider, model)
+    record = make_record(item, job.provider, model, result=job.result)
+    if job.stage == job.Stage.TRIAGE:
+        # 빠른 평가로 끝난 작업은 워커가 빠른 평가 점수를 저장함
+        record["score"] = job.score
+        record["stage"] = "triage"
+        record["title"] = f"{job.name} - 빠른 평가 {job.score}/100"
+    return record
+
+
+class JsonlWriter:
+    """Append records to a JSONL file as soon as they are available."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file = self.path.open("w", encoding="utf-8")
+
+    def write(self, record: dict):
+        with self._lock:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+def run_batch(
+    items: list[BatchItem],
+    provider: str,
+    model: str,
+    system_prompt: str,
+    on_record,
+    concurrency: int = None,
+    triage_threshold: int = None,
+    min_keyword_score: int = None,
+    top: int = None,
+) -> list[dict]:
+    """캐시에 없는 항목을 최대 concurrency개씩 동시에 LLM으로 분석합니다.
+
+    Args:
+        on_record: 각 항목이 끝날 때마다 결과 dict로 호출되는 콜백 (JSONL 기록 등)
+        triage_threshold: 지정하면 소형 모델로 먼저 빠른 평가를 하고, 점수가 이 값
+            이상인 항목만 상세 분석합니다.
+        min_keyword_score: 지정하면 키워드 커버리지가 이 값 미만인 항목은 LLM을
+            호출하지 않고 키워드 매칭 결과로 기록합니다.
+        top: 지정하면 로컬 관련도(유사도, 키워드 커버리지 순) 상위 top개만 LLM으로
+            분석합니다.
+
+    Returns:
+        모든 항목의 결과 dict 목록
+    """
+    from llm_client import get_client
+
+    concurrency = concurrency or get_config()["CONCURRENCY"]
+    system_prompt, response_schema = output_options(system_prompt, provider)
+    records = []
+
+    def finish(record):
+        records.append(record)
+        on_record(record)
+
+    def evaluate(item: BatchItem) -> dict:
+        close_old_connections()
+        try:
+            triage = None
+            if triage_threshold is not None:
+                triage = run_triage(provider, item.user_message)
+                if not triage.passed(triage_threshold):
+                    return make_record(
+                        item,
+                        provider,
+                        triage.model,
+                        result=triage.to_markdown(triage_threshold),
+                        triage=triage,
+                    )
+            client = get_client(provider, model)
+            result = client.generate(system_prompt, item.user_message, response_schema)
+            if response_schema is not None:
+                load_evaluation(result)
+            # 장애 조치로 다른 provider가 응답했으면 그 provider로 기록하고 캐시하지 않음
+            served = (client.served_provider or provider, client.served_model or model)
+            if served == (provider, model):
+                set_cached_result(item.cache_key, provider, model, result)
+            return make_record(item, *served, result=result, triage=triage)
+        except Exception as e:
+            return make_record(
+                item, provider, model, error=f"분석 중 오류가 발생했습니다: {str(e)}"
+            )
+        finally:
+            close_old_connections()
+
+    pending = []
+    for item in items:
+        if item.error or item.cached_result is not None:
+            finish(make_record(item, provider, model))
+        elif min_keyword_score is not None and keyword_score(item) < min_keyword_score:
+            finish(make_record(item, provider, model, keywords_only=True))
+        else:
+            pending.append(item)
+
+    if top is not None:
+        pending.sort(key=local_relevance, reverse=True)
+        for item in pending[top:]:
+            finish(make_record(item, provider, model, keywords_only=True))
+        pending = pending[:top]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(evaluate, item) for item in pending]
+        for future in as_completed(futures):
+            finish(future.result())
+    return records
+
+
+def keyword_score(item: BatchItem) -> int:
+    """항목의 키워드 커버리지 점수 (JD에서 키워드를 찾지 못했으면 100으로 간주)."""
+    if item.keywords is None or item.keywords["score"] is None:
+        return 100
+    return item.keywords["score"]
+
+
+def local_relevance(item: BatchItem) -> tuple:
+    """LLM 없이 계산한 관련도 정렬 키 (유사도, 키워드 커버리지)."""
+    similarity = item.similarity if item.similarity is not None else -1
+    return similarity, keyword_score(item)
+
+
+def keyword_records(items: list[BatchItem], provider: str, model: str, on_record) -> list[dict]:
+    """LLM을 호출하지 않고 캐시된 결과나 키워드 커버리지만으로 결과를 만듭니다."""
+    records = []
+    for item in items:
+        record = make_record(item, provider, model, keywords_only=True)
+        records.append(record)
+        on_record(record)
+    return records
+
+
+def rank_records(records: list[dict]) -> list[dict]:
+    """총점 높은 순으로 정렬합니다 (점수가 없거나 실패한 항목은 뒤로).
+
+    LLM을 호출하지 않은 항목(stage="keywords")은 LLM으로 분석한 항목 뒤에 두고,
+    점수가 같으면 키워드 커버리지, 유사도가 높은 항목이 앞에 옵니다.
+    """
+
+    def coverage(record):
+        keywords = record.get("keywords") or {}
+        return keywords.get("score") or 0
+
+    return sorted(
+        records,
+        key=lambda record: (
+            record["score"] is None,
+            record.get("stage") == "keywords",
+            -(record["score"] or 0),
+            -coverage(record),
+            -(record.get("similarity") or 0),
+        ),
+    )
+
+
+def format_ranking(records: list[dict]) -> str:
+    """순위 요약을 마크다운 표로 만듭니다."""
+    lines = [
+        "| 순위 | 이력서 | 총점 | 키워드 | 유사도 | 상태 |",
+        "|------|--------|------|--------|--------|------|",
+    ]
+    for rank, record in enumerate(rank_records(records), start=1):
+        score = f"{record['score']}/100" if record["score"] is not None else "-"
+        keywords = record.get("keywords") or {}
+        coverage = f"{keywords['score']}/100" if keywords.get("score") is not None else "-"
+        similarity = record.get("similarity")
+        similarity = f"{similarity}/100" if similarity is not None else "-"
+        if record["error"]:
+            status = record["error"]
+        elif record["cached"]:
+            status = "캐시"
+        elif record["stage"] == "triage":
+            status = "빠른 평가"
+        elif record["stage"] == "keywords":
+            status = "키워드 매칭"
+        else:
+            status = "완료"
+        lines.append(
+            f"| {rank} | {record['request_id']} | {score} | {coverage} | {similarity} | {status} |"
+        )
+    return "\n".join(lines)
+
+
+def submit_offline_batch(
+    items: list[BatchItem],
+    provider: str,
+    model: str,
+    system_prompt: str,
+    manifest_path,
+) -> str:
+    """캐시에 없는 항목을 provider Batches API로 제출하고 매니페스트를 저장합니다.
+
+    매니페스트에는 배치 ID와 custom_id별 이력서 정보가 저장되어, 나중에
+    collect_offline_batch()로 결과를 받을 수 있습니다.
+
+    Returns:
+        provider의 배치 ID (제출할 항목이 없으면 빈 문자열)
+    """
+    from llm_client import create_provider_batch
+
+    system_prompt, response_schema = output_options(system_prompt, provider)
+    pending = []
+    entries = []
+    for index, item in enumerate(items):
+        custom_id = ""
+        if not item.error and item.cached_result is None:
+            custom_id = f"resume-{index}"
+            pending.append((custom_id, item.user_message))
+        # 결과를 받을 때는 필요 없는 큰 입력은 저장하지 않음
+        entries.append({**asdict(item), "custom_id": custom_id, "user_message": ""})
+
+    batch_id = ""
+    if pending:
+        batch_id = create_provider_batch(
+            provider, model, system_prompt, pending, response_schema
+        )
+
+    manifest = {
+        "provider": provider,
+        "model": model,
+        "batch_id": batch_id,
+        "items": entries,
+    }
+    Path(manifest_path).write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    return batch_id
+
+
+def collect_offline_batch(manifest_path, on_record) -> list[dict] | None:
+    """제출한 배치가 끝났으면 결과를 기록하고 반환합니다. 진행 중이면 None을 반환합니다."""
+    from llm_client import get_provider_batch_status, iter_provider_batch_results
+
+    manifest = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+    provider, model = manifest["provider"], manifest["model"]
+    items = {}
+    for entry in manifest["items"]:
+        custom_id = entry.pop("custom_id")
+        items[custom_id or entry["name"]] = BatchItem(**entry)
+
+    results = {}
+    if manifest["batch_id"]:
+        status = get_provider_batch_status(provider, manifest["batch_id"])
+        if status == "in_progress":
+            return None
+        if status == "failed":
+            raise BatchInputError(f"provider 배치가 실패했습니다: {manifest['batch_id']}")
+        for custom_id, text, error in iter_provider_batch_results(
+            provider, manifest["batch_id"], model
+        ):
+            results[custom_id] = (text, error)
+
+    records = []
+    for custom_id, item in items.items():
+        if custom_id not in results:
+            if not item.error and item.cached_result is None:
+                item.error = "배치 결과에 포함되지 않았습니다 (만료 또는 취소)."
+            record = make_record(item, provider, model)
+        else:
+            text, error = results[custom_id]
+            if text is not None:
+                set_cached_result(item.cache_key, provider, model, text)
+                record = make_record(item, provider, model, result=text)
+            else:
+                record = make_record(
+                    item, provider, model, error=f"분석 중 오류가 발생했습니다: {error}"
+                )
+        records.append(record)
+        on_record(record)
+    return records
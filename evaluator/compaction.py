@@ -0,0 +1,305 @@
+"""Token-aware compaction of evaluation inputs before the LLM call.
+
+JD, 이력서, 경력기술서를 그대로 이어 붙이면 큰 업로드가 컨텍스트 창을 넘기거나
+비용과 지연을 키우므로, LLM 호출 전에 다음 순서로 입력을 줄입니다.
+
+1. 공백 정리, 여러 페이지 PDF에서 페이지마다 반복되는 머리글/바닥글과 페이지 번호 제거
+2. 이력서와 똑같은 경력기술서 줄 제거
+3. provider별 토큰 수를 추정하고, 예산을 넘으면 우선순위가 낮은 섹션부터 잘라냄
+"""
+
+import logging
+import math
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from django.conf import settings
+
+from .file_parser import PAGE_BREAK
+
+logger = logging.getLogger(__name__)
+
+# 섹션 우선순위 (앞쪽일수록 마지막에 잘림)
+SECTION_PRIORITY = ("jd", "resume", "career")
+SECTION_LABELS = {"jd": "채용공고", "resume": "이력서", "career": "경력기술서"}
+
+# 토큰당 평균 글자 수 추정치 (ASCII / 그 외 문자)
+# 한글은 두 토크나이저 모두 대략 한 글자가 한 토큰 안팎으로 나뉨
+CHARS_PER_TOKEN = {
+    "openai": (4.0, 1.1),
+    "claude": (3.5, 0.9),
+}
+
+TRUNCATION_MARKER = "\n...(입력 길이 제한으로 이하 생략)"
+
+PAGE_NUMBER_RE = re.compile(
+    # "3", "- 3 -", "3 / 5", "Page 3 of 5", "3 페이지" 형태의 줄
+    r"^\s*(?:[-–—]\s*)?(?:page\s*)?\d{1,3}(?:\s*(?:/|of)\s*\d{1,3})?"
+    r"(?:\s*(?:페이지|쪽|p\.?))?(?:\s*[-–—])?\s*$",
+    re.IGNORECASE,
+)
+
+
+def get_config() -> dict:
+    """settings.INPUT_COMPACTION 값을 기본값과 합쳐 반환합니다."""
+    config = {"ENABLED": True, "MAX_INPUT_TOKENS": 24000, "MIN_SECTION_TOKENS": 500}
+    config.update(getattr(settings, "INPUT_COMPACTION", {}))
+    return config
+
+
+@lru_cache(maxsize=8)
+def _tiktoken_encoding(model: str):
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def estimate_tokens(text: str, provider: str, model: str = "") -> int:
+    """provider/model 기준 입력 토큰 수를 추정합니다.
+
+    OpenAI는 tiktoken이 설치되어 있으면 실제 토크나이저를 사용하고, 그 외에는
+    문자 종류별 평균 글자 수로 추정합니다. 여러 provider를 쓰는 모드(auto, compare)는
+    가장 큰 추정치를 사용합니다.
+    """
+    if not text:
+        return 0
+    if provider not in CHARS_PER_TOKEN:
+        return max(estimate_tokens(text, name) for name in CHARS_PER_TOKEN)
+
+    if provider == "openai":
+        encoding = _tiktoken_encoding(model or "gpt-4o")
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+
+    ascii_chars = sum(1 for char in text if char.isascii())
+    ascii_ratio, other_ratio = CHARS_PER_TOKEN[provider]
+    return math.ceil(
+        ascii_chars / ascii_ratio + (len(text) - ascii_chars) / other_ratio
+    )
+
+
+def normalize_whitespace(text: str) -> str:
+    """줄 안의 연속 공백을 하나로 줄이고 빈 줄은 최대 한 줄만 남깁니다."""
+    text = unicodedata.normalize("NFC", text)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = [
+        re.sub(r"[ \t\u00a0\u3000]+", " ", line).strip() for line in text.split("\n")
+    ]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def _normalize_line(line: str) -> str:
+    return re.sub(r"\s+", " ", line.strip().lower())
+
+
+def _edge_indexes(lines: list, edge_lines: int) -> set:
+    """빈 줄을 제외한 페이지 앞/뒤 edge_lines 줄의 위치."""
+    content = [index for index, line in enumerate(lines) if line.strip()]
+    return set(content[:edge_lines] + content[-edge_lines:])
+
+
+def strip_page_artifacts(text: str, edge_lines: int = 2) -> str:
+    """PDF 페이지마다 반복되는 머리글/바닥글과 페이지 번호 줄을 제거합니다.
+
+    페이지 구분자(PAGE_BREAK)로 나뉜 여러 페이지 PDF 텍스트에만 적용하며, 페이지의
+    앞/뒤 edge_lines 줄만 봅니다. 본문 중간의 숫자 줄("모집 인원\n3")은 남깁니다.
+    머리글/바닥글은 공백·대소문자를 빼고 똑같이 반복되는 줄만 인정하므로, 숫자만 다른
+    경력 기간이나 성과 수치 줄("2021.03 - 2023.05 ...")은 페이지 끝에 있어도 남습니다.
+    """
+    pages = [page.split("\n") for page in text.split(PAGE_BREAK)]
+    if len(pages) < 2:
+        return text
+
+    # 각 페이지의 앞/뒤 몇 줄 중 절반 이상의 페이지에 나오는 줄을 머리글/바닥글로 판단
+    counts = Counter()
+    for lines in pages:
+        edges = _edge_indexes(lines, edge_lines)
+        counts.update({_normalize_line(lines[index]) for index in edges})
+    threshold = max(2, math.ceil(len(pages) / 2))
+    repeated = {
+        line
+        for line, count in counts.items()
+        if count >= threshold and len(line) <= 120
+    }
+
+    cleaned = []
+    for lines in pages:
+        edges = _edge_indexes(lines, edge_lines)
+        cleaned.append(
+            "\n".join(
+                line
+                for index, line in enumerate(lines)
+                if index not in edges
+                or not (
+                    PAGE_NUMBER_RE.match(line) or _normalize_line(line) in repeated
+                )
+            )
+        )
+    return "\n".join(cleaned)
+
+
+def remove_overlap(text: str, reference: str, min_length: int = 15) -> str:
+    """reference에 똑같이 있는 줄(min_length 글자 이상)을 text에서 제거합니다.
+
+    날짜와 수치가 다른 줄은 서로 다른 근거이므로 공백과 대소문자만 무시하고 비교합니다.
+    """
+    seen = {
+        _normalize_line(line)
+        for line in reference.split("\n")
+        if len(line.strip()) >= min_length
+    }
+    lines = [
+        line
+        for line in text.split("\n")
+        if len(line.strip()) < min_length or _normalize_line(line) not in seen
+    ]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def truncate_to_tokens(
+    text: str, max_tokens: int, provider: str, model: str = ""
+) -> str:
+    """max_tokens 이내가 되도록 줄 단위로 뒤쪽을 잘라냅니다."""
+    if estimate_tokens(text, provider, model) <= max_tokens:
+        return text
+
+    budget = max_tokens - estimate_tokens(TRUNCATION_MARKER, provider, model)
+    if budget <= 0:
+        return ""
+    kept = []
+    used = 0
+    for line in text.split("\n"):
+        cost = estimate_tokens(line + "\n", provider, model)
+        if used + cost > budget:
+            # 남은 예산만큼 마지막 줄의 앞부분을 글자 수 비율로 남김
+            remaining = budget - used
+            if remaining > 0:
+                kept.append(line[: int(len(line) * remaining / cost)])
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join(kept).rstrip() + TRUNCATION_MARKER
+
+
+@dataclass
+class CompactionReport:
+    """입력 압축 결과 요약."""
+
+    original_tokens: int = 0
+    compacted_tokens: int = 0
+    budget: int = 0
+    # 단계별로 줄어든 토큰 수 (normalize, dedupe, trim)
+    saved_tokens: dict = field(default_factory=dict)
+    # 예산 때문에 잘린 섹션별 토큰 수
+    trimmed_sections: dict = field(default_factory=dict)
+
+    @property
+    def over_budget(self) -> bool:
+        return self.compacted_tokens > self.budget
+
+    def summary(self) -> str:
+        """잘린 섹션이 있으면 사용자에게 보여줄 안내 문구를 반환합니다."""
+        if not self.trimmed_sections:
+            return ""
+        parts = ", ".join(
+            f"{SECTION_LABELS[name]} 약 {tokens:,}토큰"
+            for name, tokens in self.trimmed_sections.items()
+        )
+        return (
+            f"입력이 길어 {parts}을 생략하고 분석했습니다 "
+            f"(입력 약 {self.original_tokens:,} → {self.compacted_tokens:,}토큰)."
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "original_tokens": self.original_tokens,
+            "compacted_tokens": self.compacted_tokens,
+            "budget": self.budget,
+            "saved_tokens": self.saved_tokens,
+            "trimmed_sections": self.trimmed_sections,
+        }
+
+
+@dataclass
+class CompactedInput:
+    jd: str
+    resume: str
+    career: str | None
+    report: CompactionReport
+
+
+def compact_inputs(
+    jd: str,
+    resume: str,
+    career: str = None,
+    provider: str = "openai",
+    model: str = "",
+    system_prompt: str = "",
+) -> CompactedInput:
+    """JD/이력서/경력기술서를 정리하고 토큰 예산에 맞게 줄입니다.
+
+    예산(MAX_INPUT_TOKENS)은 시스템 프롬프트를 포함한 전체 입력 기준이며, 넘으면
+    경력기술서 → 이력서 → 채용공고 순으로 MIN_SECTION_TOKENS까지 잘라냅니다.
+    """
+    config = get_config()
+    sections = {"jd": jd or "", "resume": resume or "", "career": career or ""}
+
+    def count(texts: dict) -> dict:
+        return {
+            name: estimate_tokens(text, provider, model) for name, text in texts.items()
+        }
+
+    original = count(sections)
+    report = CompactionReport(
+        original_tokens=sum(original.values()), budget=config["MAX_INPUT_TOKENS"]
+    )
+    if not config["ENABLED"]:
+        report.compacted_tokens = report.original_tokens
+        return CompactedInput(jd, resume, career, report)
+
+    # 1. 공백 정리 및 페이지 머리글/바닥글 제거 (채용공고는 붙여넣은 텍스트이므로 공백만 정리)
+    sections = {
+        name: normalize_whitespace(text if name == "jd" else strip_page_artifacts(text))
+        for name, text in sections.items()
+    }
+    normalized = count(sections)
+    report.saved_tokens["normalize"] = sum(original.values()) - sum(normalized.values())
+
+    # 2. 이력서와 겹치는 경력기술서 내용 제거
+    if sections["career"]:
+        sections["career"] = remove_overlap(sections["career"], sections["resume"])
+    deduped = count(sections)
+    report.saved_tokens["dedupe"] = sum(normalized.values()) - sum(deduped.values())
+
+    # 3. 우선순위가 낮은 섹션부터 예산에 맞게 자르기
+    overhead = estimate_tokens(system_prompt, provider, model) + 100
+    excess = overhead + sum(deduped.values()) - config["MAX_INPUT_TOKENS"]
+    tokens = dict(deduped)
+    for name in reversed(SECTION_PRIORITY):
+        if excess <= 0:
+            break
+        floor = min(tokens[name], config["MIN_SECTION_TOKENS"])
+        target = max(floor, tokens[name] - excess)
+        if target >= tokens[name]:
+            continue
+        sections[name] = truncate_to_tokens(sections[name], target, provider, model)
+        trimmed = estimate_tokens(sections[name], provider, model)
+        report.trimmed_sections[name] = tokens[name] - trimmed
+        excess -= tokens[name] - trimmed
+        tokens[name] = trimmed
+    report.saved_tokens["trim"] = sum(deduped.values()) - sum(tokens.values())
+    report.compacted_tokens = sum(tokens.values())
+
+    if report.original_tokens != report.compacted_tokens:
+        logger.info("입력 압축: %s", report.to_dict())
+    return CompactedInput(
+        sections["jd"], sections["resume"], sections["career"] or None, report
+    )
@@ -0,0 +1,148 @@
+"""Content-addressed cache for text extracted from uploaded files.
+
+같은 이력서 파일이 JD마다 반복해서 업로드되므로, 파일 내용의 해시로 추출 결과를
+DB에 저장해 두고 적중 시 PyMuPDF 파싱을 건너뜁니다. DB를 사용하므로 모든
+gunicorn 워커가 같은 캐시를 공유합니다.
+"""
+
+import hashlib
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import F
+from django.db.models.functions import Length
+from django.utils import timezone
+
+from .file_parser import (
+    PARSER_VERSION,
+    get_file_kind,
+    get_pdf_limits,
+    parse_file_with_pages,
+)
+from .models import ParsedDocument
+
+# 추출 결과(거부 여부, 잘림)를 바꾸는 PDF 제한값 — 환경변수로 바꾸면 다른 캐시 항목을 사용
+PDF_KEY_LIMITS = ("max_bytes", "max_pages", "max_chars")
+
+# 프로세스 단위 적중/미스 카운터
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def _record(outcome: str):
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def get_stats() -> dict:
+    """현재 프로세스의 파싱 캐시 적중/미스 횟수를 반환합니다."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def get_config() -> dict:
+    """settings.DOCUMENT_CACHE 값을 기본값과 합쳐 반환합니다."""
+    config = {"ENABLED": True, "MAX_ENTRIES": 500, "MAX_CHARS": 20_000_000}
+    config.update(getattr(settings, "DOCUMENT_CACHE", {}))
+    return config
+
+
+def hash_upload(uploaded_file) -> str:
+    """업로드 파일을 청크 단위로 읽어 BLAKE2b 해시를 반환합니다."""
+    digest = hashlib.blake2b(digest_size=32)
+    if hasattr(uploaded_file, "chunks"):
+        for chunk in uploaded_file.chunks():
+            digest.update(chunk)
+    else:
+        digest.update(uploaded_file.read())
+    # 이후 파서가 처음부터 읽을 수 있도록 파일 포인터 리셋
+    uploaded_file.seek(0)
+    return digest.hexdigest()
+
+
+def cache_key(content_hash: str, kind: str) -> str:
+    """파일 내용 해시, 파일 종류, PDF 제한값을 합친 캐시 키를 반환합니다.
+
+    같은 바이트라도 .md와 .txt는 파서가 달라 결과가 다르므로 종류별로 따로 저장합니다.
+    """
+    parts = [content_hash, kind]
+    if kind == "pdf":
+        limits = get_pdf_limits()
+        parts += [f"{name}={limits[name]}" for name in PDF_KEY_LIMITS]
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=32).hexdigest()
+
+
+def parse_file_cached(uploaded_file) -> str:
+    """파싱 캐시를 거쳐 업로드 파일의 텍스트를 반환합니다.
+
+    캐시에 없거나 파서 버전이 다르면 parse_file로 추출한 뒤 저장합니다.
+    """
+    config = get_config()
+    if not config["ENABLED"]:
+        return parse_file_with_pages(uploaded_file)[0]
+
+    kind = get_file_kind(uploaded_file.name)
+    key = cache_key(hash_upload(uploaded_file), kind)
+
+    entry = (
+        ParsedDocument.objects.filter(
+            key=key, kind=kind, parser_version=PARSER_VERSION
+        )
+        .only("text")
+        .first()
+    )
+    if entry is not None:
+        # LRU 순서를 위해 마지막 사용 시간 갱신
+        ParsedDocument.objects.filter(key=key).update(
+            last_accessed_at=timezone.now(), hit_count=F("hit_count") + 1
+        )
+        _record("hits")
+        return entry.text
+
+    _record("misses")
+    text, page_count = parse_file_with_pages(uploaded_file)
+    ParsedDocument.objects.update_or_create(
+        key=key,
+        defaults={
+            "kind": kind,
+            "parser_version": PARSER_VERSION,
+            "text": text,
+            "page_count": page_count,
+            "file_size": getattr(uploaded_file, "size", None) or 0,
+            "hit_count": 0,
+            "created_at": timezone.now(),
+            "last_accessed_at": timezone.now(),
+        },
+    )
+    evict(config["MAX_ENTRIES"], config["MAX_CHARS"])
+    return text
+
+
+def evict(max_entries: int, max_chars: int = None) -> int:
+    """최근 사용 순으로 항목 수와 저장된 텍스트 총량 안에 드는 항목만 남깁니다 (LRU).
+
+    항목 크기는 원본 파일 크기가 아닌 실제로 저장된 추출 텍스트 길이로 계산합니다.
+    스캔 PDF처럼 큰 파일도 텍스트가 짧으면 적게 차지하고, 텍스트가 긴 문서 몇 개가
+    예산을 모두 차지하면 오래된 항목부터 지웁니다. 가장 최근 항목은 항상 남깁니다.
+    """
+    entries = (
+        ParsedDocument.objects.order_by("-last_accessed_at")
+        .annotate(size=Length("text"))
+        .values_list("key", "size")
+    )
+    stale_keys = []
+    total = 0
+    for index, (key, size) in enumerate(entries.iterator()):
+        total += size or 0
+        if index >= max_entries or (
+            index and max_chars is not None and total > max_chars
+        ):
+            stale_keys.append(key)
+    if not stale_keys:
+        return 0
+    deleted, _ = ParsedDocument.objects.filter(key__in=stale_keys).delete()
+    return deleted
+
+
+aparse_file_cached = sync_to_async(parse_file_cached)
@@ -1,29 +1,448 @@
 """File parser module for extracting text from various file formats."""
 
+import atexit
 import io
+import math
+import mmap
+import multiprocessing
+import multiprocessing.connection
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
 
 
-def parse_pdf(file) -> str:
-    """Extract text from a PDF file."""
+# 추출 결과가 달라지는 변경(추출 방식, 기본 제한값 등)이 있으면 올려서 파싱 캐시를 무효화
+PARSER_VERSION = "3"
+
+# PDF 페이지 구분자 (입력 압축 단계에서 페이지별 머리글/바닥글을 찾는 데 사용)
+PAGE_BREAK = "\f"
+
+
+class PDFLimitError(ValueError):
+    """Raised when a PDF exceeds the configured size, page or time limits."""
+
+
+def get_pdf_limits() -> dict:
+    """PDF 추출 제한값을 환경변수에서 읽어 반환합니다."""
+    return {
+        # 업로드 파일 최대 크기(바이트)
+        "max_bytes": int(os.getenv("PDF_MAX_BYTES", 20 * 1024 * 1024)),
+        # 최대 페이지 수 (초과 시 오류)
+        "max_pages": int(os.getenv("PDF_MAX_PAGES", 100)),
+        # 최대 추출 글자 수 (초과분은 잘라냄)
+        "max_chars": int(os.getenv("PDF_MAX_CHARS", 200_000)),
+        # 문서 하나의 전체 추출 제한 시간(초)
+        "timeout": float(os.getenv("PDF_PARSE_TIMEOUT", 20)),
+        # 이 페이지 수 이상일 때만 여러 추출 워커로 병렬 추출
+        "parallel_min_pages": int(os.getenv("PDF_PARALLEL_MIN_PAGES", 32)),
+        "workers": int(os.getenv("PDF_WORKERS", min(4, os.cpu_count() or 1))),
+    }
+
+
+@contextmanager
+def _pdf_source(file):
+    """파일 내용을 복사하지 않고 PyMuPDF에 넘길 수 있는 형태로 제공합니다.
+
+    Yields:
+        tuple: (경로 또는 None, 버퍼 또는 None) - 둘 중 하나만 값을 가짐
+    """
+    # 디스크에 임시 저장된 업로드 (Django TemporaryUploadedFile)
+    if hasattr(file, "temporary_file_path"):
+        yield file.temporary_file_path(), None
+        return
+
+    if isinstance(file, (str, Path)):
+        yield str(file), None
+        return
+
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        yield None, file
+        return
+
+    # 메모리에 있는 업로드 (Django InMemoryUploadedFile → BytesIO)
+    raw = getattr(file, "file", file)
+    if isinstance(raw, io.BytesIO):
+        view = raw.getbuffer()
+        try:
+            yield None, view
+        finally:
+            view.release()
+        return
+
+    # 실제 파일이면 mmap으로 필요한 부분만 페이지 캐시에서 읽음
+    try:
+        fileno = raw.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        fileno = None
+    if fileno is not None:
+        # 길이가 0인 파일은 mmap할 수 없음
+        if os.fstat(fileno).st_size == 0:
+            yield None, b""
+            return
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            yield None, view
+        finally:
+            view.release()
+            mapped.close()
+        return
+
+    pdf_bytes = file.read()
+    if hasattr(file, "seek"):
+        file.seek(0)  # 파일 포인터 리셋
+    yield None, pdf_bytes
+
+
+def _open_pdf(path, buffer):
     import fitz  # PyMuPDF
 
-    # 파일 객체에서 바이트 읽기
-    if hasattr(file, 'read'):
-        pdf_bytes = file.read()
-        if hasattr(file, 'seek'):
-            file.seek(0)  # 파일 포인터 리셋
-    else:
-        pdf_bytes = file
+    if path is not None:
+        return fitz.open(path, filetype="pdf")
+    return fitz.open(stream=buffer, filetype="pdf")
+
+
+def _extract_page_range(path, start: int, stop: int, max_chars: int) -> list[str]:
+    """[start, stop) 페이지의 텍스트를 추출합니다 (추출 워커 프로세스에서 실행)."""
+    doc = _open_pdf(path, None)
+    try:
+        texts = []
+        chars = 0
+        for number in range(start, stop):
+            text = doc[number].get_text()
+            texts.append(text)
+            chars += len(text)
+            # 이 구간만으로 글자 수 제한을 넘으면 나머지는 추출할 필요가 없음
+            if chars >= max_chars:
+                break
+        return texts
+    finally:
+        doc.close()
 
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    text_parts = []
 
-    for page in doc:
-        text_parts.append(page.get_text())
+def _count_pages(path) -> int:
+    """페이지 수를 반환합니다 (워커에서 실행해 문서 열기도 제한 시간 안에 둠)."""
+    doc = _open_pdf(path, None)
+    try:
+        return doc.page_count
+    finally:
+        doc.close()
 
-    doc.close()
-    return "\n".join(text_parts)
+
+def _worker_main(conn):
+    """추출 워커 프로세스: 작업을 하나씩 받아 실행하고 결과를 돌려줌."""
+    while True:
+        try:
+            func, args = conn.recv()
+        except (EOFError, OSError):
+            return
+        try:
+            conn.send((True, func(*args)))
+        except Exception as e:
+            conn.send((False, e))
+
+
+class _ExtractionTimeout(Exception):
+    pass
+
+
+class _Worker:
+    """전용 파이프로 작업을 주고받는 추출 프로세스 하나.
+
+    ProcessPoolExecutor는 워커 하나가 죽으면 풀 전체가 깨져 다른 요청의 추출도
+    실패하므로, 워커마다 따로 두고 제한 시간을 넘긴 작업의 워커만 종료합니다.
+    """
+
+    def __init__(self, context):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def submit(self, func, *args):
+        self.conn.send((func, args))
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+_workers_lock = threading.Condition()
+_idle_workers = []
+_live_workers = 0
+_context = None
+
+
+def _reset_workers():
+    # fork된 자식(gunicorn 워커 등)은 부모의 추출 프로세스를 물려받지 않음
+    global _idle_workers, _live_workers, _workers_lock
+    _workers_lock = threading.Condition()
+    _idle_workers = []
+    _live_workers = 0
+
+
+os.register_at_fork(after_in_child=_reset_workers)
+
+
+def _get_context():
+    global _context
+    if _context is None:
+        # 스레드를 사용하는 서버 프로세스에서 fork하지 않도록 forkserver 사용
+        methods = multiprocessing.get_all_start_methods()
+        method = "forkserver" if "forkserver" in methods else "spawn"
+        _context = multiprocessing.get_context(method)
+        if method == "forkserver":
+            # 워커가 PyMuPDF를 다시 임포트하지 않고 forkserver에서 물려받음
+            _context.set_forkserver_preload(["pymupdf"])
+    return _context
+
+
+def _checkout(limit: int, deadline: float | None, block: bool = True) -> "_Worker | None":
+    """쉬고 있는 워커를 꺼내거나 새로 시작합니다 (프로세스 수는 limit까지).
+
+    block이 False이면 바로 쓸 수 있는 워커가 없을 때 None을 반환합니다.
+    """
+    global _live_workers
+    with _workers_lock:
+        while True:
+            while _idle_workers:
+                worker = _idle_workers.pop()
+                if worker.process.is_alive():
+                    return worker
+                _live_workers -= 1
+            if _live_workers < max(1, limit):
+                _live_workers += 1
+                break
+            if not block:
+                return None
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                raise _ExtractionTimeout
+            _workers_lock.wait(remaining)
+    try:
+        return _Worker(_get_context())
+    except BaseException:
+        with _workers_lock:
+            _live_workers -= 1
+            _workers_lock.notify()
+        raise
+
+
+def _checkin(worker: _Worker):
+    with _workers_lock:
+        _idle_workers.append(worker)
+        _workers_lock.notify()
+
+
+def _discard(worker: _Worker):
+    """작업 도중인 워커를 종료합니다 (다른 워커는 영향 없음)."""
+    global _live_workers
+    worker.kill()
+    with _workers_lock:
+        _live_workers -= 1
+        _workers_lock.notify()
+
+
+def shutdown_workers():
+    """쉬고 있는 추출 워커를 모두 종료합니다 (테스트 정리, 프로세스 종료 시)."""
+    with _workers_lock:
+        workers = list(_idle_workers)
+        _idle_workers.clear()
+    for worker in workers:
+        _discard(worker)
+
+
+atexit.register(shutdown_workers)
+
+
+@contextmanager
+def _spill_to_path(path, buffer):
+    """워커가 경로로 열 수 있도록 메모리의 PDF를 임시 파일에 한 번 기록합니다.
+
+    버퍼를 bytes로 복사해 워커마다 파이프로 보내지 않고 mmap/memoryview를 그대로 씁니다.
+    """
+    if path is not None:
+        yield path
+        return
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as spilled:
+        spilled.write(buffer)
+        spilled.flush()
+        yield spilled.name
+
+
+def _extract_isolated(path, config, deadline) -> Iterator[list[str]]:
+    """워커 프로세스에서 페이지 수를 확인하고 구간별 텍스트 목록을 순서대로 반환합니다.
+
+    작업 중인 워커는 제한 시간 초과, 비정상 종료, 생성기 조기 종료 시 그 워커만 종료하고,
+    끝난 워커는 다음 요청을 위해 되돌려 놓습니다.
+
+    Raises:
+        _ExtractionTimeout: deadline까지 끝나지 않은 경우
+    """
+    running = {}  # 작업 중인 워커 -> 구간 번호 (페이지 수 확인은 None)
+
+    def submit(worker, index, func, *args):
+        worker.submit(func, *args)
+        running[worker] = index
+
+    def wait_any() -> list:
+        remaining = max(0, deadline - time.monotonic()) if deadline is not None else None
+        ready = multiprocessing.connection.wait(
+            [worker.conn for worker in running], remaining
+        )
+        if not ready:
+            raise _ExtractionTimeout
+        return [worker for worker in running if worker.conn in ready]
+
+    def collect(worker):
+        try:
+            ok, value = worker.conn.recv()
+        except (EOFError, OSError):
+            # 메모리 부족 등으로 워커가 죽음 (running에 남겨 두어 정리 시 종료)
+            raise ValueError("PDF 텍스트 추출 중 워커가 종료되었습니다.") from None
+        index = running.pop(worker)
+        if not ok:
+            raise value
+        return index, value
+
+    workers = [_checkout(config["workers"], deadline)]
+    try:
+        # 손상되거나 악의적인 PDF는 문서를 여는 단계에서 멈출 수 있으므로 이것도 워커에서 실행
+        submit(workers[0], None, _count_pages, path)
+        _, page_count = collect(wait_any()[0])
+        if page_count > config["max_pages"]:
+            raise PDFLimitError(
+                f"PDF 페이지 수가 너무 많습니다 ({page_count}쪽, 최대 {config['max_pages']}쪽)."
+            )
+        if page_count == 0:
+            return
+
+        # 페이지가 많으면 구간을 워커 수의 2배로 나눠 느린 구간이 있어도 고르게 분배하고,
+        # 적으면 워커 하나에서 한 번에 추출
+        if page_count >= config["parallel_min_pages"] and config["workers"] > 1:
+            chunk_size = math.ceil(page_count / (config["workers"] * 2))
+            # 다른 요청이 쓰지 않는 워커만 더 빌려 씀 (자리가 없으면 기다리지 않음)
+            while len(workers) < config["workers"]:
+                worker = _checkout(config["workers"], deadline, block=False)
+                if worker is None:
+                    break
+                workers.append(worker)
+        else:
+            chunk_size = page_count
+        chunks = [
+            (start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)
+        ]
+
+        results = {}
+        next_chunk = next_yield = 0
+        while next_yield < len(chunks):
+            for worker in workers:
+                if worker not in running and next_chunk < len(chunks):
+                    submit(
+                        worker,
+                        next_chunk,
+                        _extract_page_range,
+                        path,
+                        *chunks[next_chunk],
+                        config["max_chars"],
+                    )
+                    next_chunk += 1
+            for worker in wait_any():
+                index, texts = collect(worker)
+                results[index] = texts
+            while next_yield in results:
+                yield results.pop(next_yield)
+                next_yield += 1
+    finally:
+        for worker in workers:
+            if worker in running:
+                _discard(worker)
+            else:
+                _checkin(worker)
+
+
+def iter_pdf_pages(file, **limits) -> Iterator[str]:
+    """Yield the text of each PDF page in order, enforcing the extraction limits.
+
+    업로드를 임시 파일 경로나 mmap에서 직접 읽습니다. 제한 시간이 있으면 문서 열기부터
+    페이지 추출까지 추출 워커 프로세스에서 실행해, 멈추더라도 제한 시간에 그 작업의 워커만
+    종료하고 요청 스레드를 돌려받습니다 (메모리에 있는 업로드는 임시 파일에 한 번 기록해
+    워커가 경로로 엶). 페이지가 많으면 페이지 구간별로 나눠 병렬 추출합니다.
+    글자 수 제한에 도달하면 마지막 페이지를 잘라서 반환하고 추출을 멈춥니다.
+
+    Args:
+        file: 업로드 파일, 파일 경로, 바이트
+        **limits: get_pdf_limits()의 값을 덮어쓸 제한값 (timeout이 0 이하이면
+            제한 시간 없이 요청 프로세스에서 직접 추출)
+
+    Raises:
+        PDFLimitError: 파일 크기, 페이지 수, 제한 시간을 초과한 경우
+    """
+    config = {**get_pdf_limits(), **limits}
+    size = getattr(file, "size", None)
+    if size is not None and size > config["max_bytes"]:
+        raise PDFLimitError(
+            f"PDF 파일이 너무 큽니다 (최대 {config['max_bytes'] // (1024 * 1024)}MB)."
+        )
+
+    timeout = config["timeout"] if config["timeout"] > 0 else None
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    remaining_chars = config["max_chars"]
+
+    with _pdf_source(file) as (path, buffer):
+        if path is None and len(buffer) == 0:
+            raise ValueError("PDF 파일이 비어 있습니다.")
+
+        if timeout is None:
+            doc = _open_pdf(path, buffer)
+            try:
+                page_count = doc.page_count
+                if page_count > config["max_pages"]:
+                    raise PDFLimitError(
+                        f"PDF 페이지 수가 너무 많습니다 ({page_count}쪽, 최대 {config['max_pages']}쪽)."
+                    )
+                for number in range(page_count):
+                    text = doc[number].get_text()
+                    yield text[:remaining_chars]
+                    remaining_chars -= len(text)
+                    if remaining_chars <= 0:
+                        return
+            finally:
+                doc.close()
+            return
+
+        with _spill_to_path(path, buffer) as pdf_path:
+            chunks = _extract_isolated(pdf_path, config, deadline)
+            try:
+                for texts in chunks:
+                    for text in texts:
+                        yield text[:remaining_chars]
+                        remaining_chars -= len(text)
+                        if remaining_chars <= 0:
+                            return
+            except _ExtractionTimeout:
+                raise PDFLimitError(
+                    f"PDF 텍스트 추출 시간이 {timeout:g}초를 초과했습니다."
+                ) from None
+            finally:
+                chunks.close()
+
+
+def parse_pdf(file, **limits) -> str:
+    """Extract text from a PDF file."""
+    return PAGE_BREAK.join(iter_pdf_pages(file, **limits))
+
+
+def parse_pdf_with_pages(file, **limits) -> tuple[str, int]:
+    """Extract text and the number of extracted pages from a PDF file."""
+    pages = list(iter_pdf_pages(file, **limits))
+    return PAGE_BREAK.join(pages), len(pages)
 
 
 def parse_markdown(file) -> str:
@@ -50,6 +469,26 @@ def parse_text(file) -> str:
     return file.decode('utf-8') if isinstance(file, bytes) else file
 
 
+def get_file_kind(filename: str) -> str:
+    """파일 이름으로 파서 종류(pdf, markdown, text)를 판별합니다."""
+    filename = filename.lower()
+    if filename.endswith('.pdf'):
+        return "pdf"
+    if filename.endswith('.md') or filename.endswith('.markdown'):
+        return "markdown"
+    return "text"
+
+
+def parse_file_with_pages(uploaded_file) -> tuple[str, int]:
+    """Parse an uploaded file and return (text, page count).
+
+    PDF가 아닌 파일은 1페이지로 취급합니다.
+    """
+    if get_file_kind(uploaded_file.name) == "pdf":
+        return parse_pdf_with_pages(uploaded_file)
+    return parse_file(uploaded_file), 1
+
+
 def parse_file(uploaded_file) -> str:
     """Parse an uploaded file and extract text content.
 
@@ -9,6 +9,7 @@ class EvaluationForm(forms.Form):
     PROVIDER_CHOICES = [
         ("openai", "OpenAI (GPT-4o)"),
         ("claude", "Anthropic (Claude)"),
+        ("auto", "자동 (더 빠른 응답 우선)"),
     ]
 
     ALLOWED_EXTENSIONS = ['.pdf', '.md', '.markdown', '.txt']
@@ -49,6 +50,18 @@ class EvaluationForm(forms.Form):
         required=False,
     )
 
+    bypass_cache = forms.BooleanField(
+        widget=forms.CheckboxInput(attrs={"class": "form-check-input"}),
+        label="저장된 결과를 사용하지 않고 새로 분석",
+        required=False,
+    )
+
+    full_analysis = forms.BooleanField(
+        widget=forms.CheckboxInput(attrs={"class": "form-check-input"}),
+        label="상세 분석 요청 (빠른 평가 점수와 관계없이 전체 분석)",
+        required=False,
+    )
+
     def clean_resume(self):
         """Validate resume file."""
         resume = self.cleaned_data.get('resume')
@@ -75,3 +88,40 @@ class EvaluationForm(forms.Form):
             raise forms.ValidationError(
                 f"{field_name} 파일 크기가 {max_mb}MB를 초과합니다."
             )
+
+
+class BatchEvaluationForm(forms.Form):
+    """Form for evaluating many resumes (zip) against one JD."""
+
+    MAX_ZIP_SIZE = 100 * 1024 * 1024  # 100MB
+
+    provider = forms.ChoiceField(
+        choices=EvaluationForm.PROVIDER_CHOICES,
+        initial="openai",
+        label="AI 모델",
+    )
+
+    jd = forms.CharField(widget=forms.Textarea, label="채용공고 (JD)")
+
+    resumes = forms.FileField(
+        label="이력서 묶음 (zip)",
+        help_text="PDF, Markdown, TXT 이력서를 묶은 zip 파일을 업로드하세요.",
+    )
+
+    bypass_cache = forms.BooleanField(
+        label="저장된 결과를 사용하지 않고 새로 분석",
+        required=False,
+    )
+
+    def clean_resumes(self):
+        """Validate the zip file."""
+        resumes = self.cleaned_data.get('resumes')
+        if resumes:
+            if not resumes.name.lower().endswith('.zip'):
+                raise forms.ValidationError("이력서 묶음은 zip 파일만 업로드 가능합니다.")
+            if resumes.size > self.MAX_ZIP_SIZE:
+                max_mb = self.MAX_ZIP_SIZE // (1024 * 1024)
+                raise forms.ValidationError(
+                    f"이력서 묶음 파일 크기가 {max_mb}MB를 초과합니다."
+                )
+        return resumes
@@ -0,0 +1,409 @@
+"""Local keyword/skill pre-matching between a JD and resumes.
+
+LLM을 호출하기 전에 JD의 기술 스택/요구사항 키워드를 사전(동의어 포함)으로 추출하고
+이력서에 있는지 대조하여 즉시 커버리지 점수를 보여줍니다. 외부 호출이 없으므로
+요청당 수 ms 안에 끝나며, 배치 분석에서는 API 호출 없이 수백 개의 이력서를 먼저
+정렬할 수 있습니다.
+
+- 별칭 색인: 별칭의 첫 토큰 → (별칭 토큰열, 표준 이름) 목록 ("k8s" → "Kubernetes")
+- 역색인(SkillIndex): 표준 이름 → 그 기술이 나오는 문서 번호 집합
+"""
+
+import json
+import re
+import time
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+
+# 표준 이름 → 별칭 (한글 표기, 약어 등)
+# 표준 이름 자체는 별칭으로 쓰지 않음 ("Go", "C", "R"처럼 일반 단어와 겹치는 이름 때문)
+SKILL_ALIASES = {
+    # 언어
+    "Python": ("python", "python3", "파이썬"),
+    "Java": ("java", "자바"),
+    "Kotlin": ("kotlin", "코틀린"),
+    "JavaScript": ("javascript", "js", "ecmascript", "es6", "자바스크립트"),
+    "TypeScript": ("typescript", "타입스크립트"),
+    "Go": ("golang", "go lang", "고랭"),
+    "Rust": ("rust", "러스트"),
+    "C": ("c language", "c언어"),
+    "C++": ("c++", "cpp"),
+    "C#": ("c#", "csharp", "c sharp"),
+    "Swift": ("swift", "스위프트"),
+    "Objective-C": ("objective-c", "objective c", "objc"),
+    "Ruby": ("ruby", "루비"),
+    "PHP": ("php",),
+    "Scala": ("scala", "스칼라"),
+    "Dart": ("dart",),
+    "R": ("r language", "r언어"),
+    "SQL": ("sql",),
+    # 프레임워크/라이브러리
+    "Spring": ("spring", "spring framework", "스프링"),
+    "Spring Boot": ("spring boot", "springboot", "스프링부트", "스프링 부트"),
+    "JPA": ("jpa", "hibernate"),
+    "Django": ("django", "장고"),
+    "Flask": ("flask", "플라스크"),
+    "FastAPI": ("fastapi", "fast api"),
+    "Node.js": ("node.js", "nodejs", "node"),
+    "NestJS": ("nestjs", "nest.js"),
+    "Express": ("express", "express.js", "expressjs"),
+    "React": ("react", "react.js", "reactjs", "리액트"),
+    "React Native": ("react native", "리액트 네이티브"),
+    "Vue.js": ("vue", "vue.js", "vuejs"),
+    "Next.js": ("next.js", "nextjs"),
+    "Angular": ("angular", "angularjs"),
+    "Flutter": ("flutter", "플러터"),
+    "Android": ("android", "안드로이드"),
+    "iOS": ("ios",),
+    "Pandas": ("pandas", "판다스"),
+    "NumPy": ("numpy", "넘파이"),
+    "PyTorch": ("pytorch", "torch", "파이토치"),
+    "TensorFlow": ("tensorflow", "텐서플로"),
+    "scikit-learn": ("scikit-learn", "sklearn", "scikit learn"),
+    "LangChain": ("langchain", "랭체인"),
+    # 데이터/인프라
+    "MySQL": ("mysql",),
+    "PostgreSQL": ("postgresql", "postgres", "포스트그레스"),
+    "Oracle": ("oracle", "오라클"),
+    "MongoDB": ("mongodb", "mongo", "몽고디비"),
+    "Redis": ("redis", "레디스"),
+    "Elasticsearch": ("elasticsearch", "elastic search", "elk", "엘라스틱서치"),
+    "Kafka": ("kafka", "apache kafka", "카프카"),
+    "RabbitMQ": ("rabbitmq", "rabbit mq"),
+    "Spark": ("spark", "apache spark", "pyspark", "스파크"),
+    "Hadoop": ("hadoop", "하둡"),
+    "Airflow": ("airflow", "apache airflow", "에어플로우"),
+    "Docker": ("docker", "도커"),
+    "Kubernetes": ("kubernetes", "k8s", "쿠버네티스", "eks", "gke", "aks"),
+    "Terraform": ("terraform", "테라폼"),
+    "AWS": ("aws", "amazon web services", "아마존 웹 서비스"),
+    "GCP": ("gcp", "google cloud", "google cloud platform"),
+    "Azure": ("azure", "애저"),
+    "Linux": ("linux", "리눅스", "ubuntu", "centos"),
+    "Git": ("git", "github", "gitlab"),
+    "CI/CD": ("ci/cd", "ci cd", "cicd", "jenkins", "github actions", "gitlab ci", "argocd"),
+    "Nginx": ("nginx",),
+    "GraphQL": ("graphql",),
+    "gRPC": ("grpc",),
+    "REST API": ("rest api", "restful", "restful api"),
+    "MSA": ("msa", "microservice", "microservices", "마이크로서비스"),
+    # 분야
+    "Machine Learning": ("machine learning", "ml", "머신러닝", "기계학습"),
+    "Deep Learning": ("deep learning", "딥러닝"),
+    "LLM": ("llm", "large language model", "대규모 언어 모델", "거대 언어 모델"),
+    "NLP": ("nlp", "자연어처리", "자연어 처리"),
+    "Computer Vision": ("computer vision", "컴퓨터 비전", "컴퓨터비전"),
+    "Data Analysis": ("data analysis", "데이터 분석", "데이터분석"),
+    "Figma": ("figma", "피그마"),
+    "Jira": ("jira", "지라"),
+}
+
+# JD 섹션 제목 키워드 → 중요도 (structured.IMPORTANCE와 같은 값)
+# 자격요건/우대사항이 아닌 섹션(업무 소개, 기술 스택 등)의 키워드는 Low
+SECTION_IMPORTANCE = (
+    ("High", ("자격요건", "자격 요건", "필수", "지원자격", "지원 자격", "required", "requirements",
+              "qualifications", "must have")),
+    ("Medium", ("우대", "preferred", "nice to have", "plus", "bonus")),
+    ("Low", ("업무", "기술 스택", "기술스택", "tech stack", "responsibilities", "소개", "복지",
+             "혜택", "전형", "절차", "근무")),
+)
+DEFAULT_IMPORTANCE = "Low"
+IMPORTANCE_WEIGHTS = {"High": 3, "Medium": 2, "Low": 1}
+
+# 영문 토큰은 "c++", "c#", "node.js"를 한 덩어리로, 한글은 음절 연속으로 자름
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*|[가-힣]+", re.IGNORECASE)
+
+# 한글 토큰 끝의 조사 ("쿠버네티스를", "파이썬으로") - 긴 것부터 확인
+PARTICLES = tuple(
+    sorted(
+        ("으로", "에서", "까지", "부터", "이나", "처럼", "보다", "으로의", "에서의",
+         "을", "를", "이", "가", "은", "는", "로", "와", "과", "의", "에", "도"),
+        key=len,
+        reverse=True,
+    )
+)
+
+# 일반 영어 단어와 겹치는 별칭 ("spring festival", "express train", "swift response")
+# 대문자로 쓰였거나("Spring", "ML") 같은 줄에 다른 기술 키워드가 있을 때만 인정
+AMBIGUOUS_ALIASES = frozenset(
+    ("spring", "express", "node", "rust", "swift", "ml", "react", "spark", "oracle",
+     "torch", "flask", "ruby", "dart")
+)
+
+# 이력서에 있으면 함께 있는 것으로 보는 기술 ("Spring Boot" 경험 → "Spring" 요건 충족)
+IMPLIED_SKILLS = {
+    "Spring Boot": ("Spring",),
+    "React Native": ("React",),
+    "Next.js": ("React",),
+    "NestJS": ("Node.js",),
+}
+
+# 섹션 제목 줄로 볼 최대 길이 (목록 항목 "- Python 필수"는 제목이 아님)
+MAX_HEADING_LENGTH = 20
+BULLET_RE = re.compile(r"^\s*(?:[-•·]|\d+[.)])\s")
+
+
+def get_config() -> dict:
+    """settings.KEYWORD_MATCH 값을 기본값과 합쳐 반환합니다."""
+    config = {"ENABLED": True, "HINTS": False, "SYNONYMS_PATH": ""}
+    config.update(getattr(settings, "KEYWORD_MATCH", {}))
+    return config
+
+
+def _particle_stems(token: str) -> list[str]:
+    """한글 토큰 끝의 조사를 뗀 후보 ("파이썬으로" → ["파이썬", "파이썬으"])."""
+    if not "가" <= token[0] <= "힣":
+        return []
+    return [
+        token[: -len(particle)]
+        for particle in PARTICLES
+        if token.endswith(particle) and len(token) - len(particle) >= 2
+    ]
+
+
+def tokenize(text: str, keep_case: bool = False) -> list[str]:
+    """NFKC 정규화 후 토큰으로 나눕니다 (keep_case가 아니면 소문자).
+
+    조사는 떼지 않습니다. 별칭 자체가 조사처럼 끝날 수 있어("텐서플로") 매칭할 때
+    텍스트 쪽 토큰에서만 조사를 뗀 후보를 함께 비교합니다.
+    """
+    tokens = TOKEN_RE.findall(unicodedata.normalize("NFKC", text or ""))
+    return tokens if keep_case else [token.lower() for token in tokens]
+
+
+def _token_matches(token: str, alias_token: str) -> bool:
+    return token == alias_token or alias_token in _particle_stems(token)
+
+
+def _is_cased(alias: tuple, original: list[str]) -> bool:
+    """모호한 별칭이 고유명사처럼 대문자로 쓰였는지 ("ml"은 "ML"만 인정)."""
+    if alias == ("ml",):
+        return original == ["ML"]
+    return any(token != token.lower() for token in original)
+
+
+class AliasIndex:
+    """별칭 토큰열을 표준 기술 이름으로 찾는 색인.
+
+    별칭의 첫 토큰을 키로 후보를 모아 두어, 텍스트의 각 위치에서 후보만 비교합니다.
+    """
+
+    def __init__(self, aliases: dict, implied: dict = None):
+        self._index = defaultdict(list)
+        for canonical, names in aliases.items():
+            for name in names:
+                tokens = tuple(tokenize(name))
+                if tokens:
+                    self._index[tokens[0]].append((tokens, canonical))
+        # 긴 별칭 먼저 ("spring boot"가 "spring"보다 우선)
+        for candidates in self._index.values():
+            candidates.sort(key=lambda candidate: len(candidate[0]), reverse=True)
+        self.implied = implied or {}
+
+    def _match_at(self, tokens: list[str], position: int):
+        token = tokens[position]
+        for key in (token, *_particle_stems(token)):
+            for alias, canonical in self._index.get(key, ()):
+                window = tokens[position : position + len(alias)]
+                if len(window) == len(alias) and all(map(_token_matches, window, alias)):
+                    return alias, canonical
+        return None
+
+    def find_line(self, line: str) -> list[str]:
+        """한 줄에서 찾은 기술의 표준 이름을 나온 순서대로 반환합니다."""
+        original = tokenize(line, keep_case=True)
+        tokens = [token.lower() for token in original]
+        found = []
+        position = 0
+        while position < len(tokens):
+            match = self._match_at(tokens, position)
+            if match is None:
+                position += 1
+                continue
+            alias, canonical = match
+            ambiguous = " ".join(alias) in AMBIGUOUS_ALIASES
+            cased = ambiguous and _is_cased(alias, original[position : position + len(alias)])
+            found.append((canonical, ambiguous and not cased))
+            position += len(alias)
+        # 모호한 별칭은 같은 줄에 다른 기술 키워드가 있으면 기술 목록으로 보고 인정
+        context = any(not uncertain for _, uncertain in found)
+        return [canonical for canonical, uncertain in found if context or not uncertain]
+
+    def find(self, text: str):
+        """텍스트에서 찾은 기술의 표준 이름을 나온 순서대로 반환합니다."""
+        for line in (text or "").splitlines():
+            yield from self.find_line(line)
+
+    def skills(self, text: str) -> set[str]:
+        """텍스트에 나오는 기술 (포함 관계로 함께 인정되는 기술 포함)."""
+        skills = set(self.find(text))
+        for canonical in list(skills):
+            skills.update(self.implied.get(canonical, ()))
+        return skills
+
+
+def _load_synonyms(path: str) -> dict:
+    """추가 동의어 JSON 파일({"표준 이름": ["별칭", ...]})을 읽습니다."""
+    if not path:
+        return {}
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {canonical: tuple(names) for canonical, names in data.items()}
+
+
+@lru_cache(maxsize=1)
+def get_alias_index() -> AliasIndex:
+    """기본 사전과 SYNONYMS_PATH의 동의어로 만든 색인 (프로세스당 한 번 생성)."""
+    aliases = {canonical: tuple(names) for canonical, names in SKILL_ALIASES.items()}
+    for canonical, names in _load_synonyms(get_config()["SYNONYMS_PATH"]).items():
+        aliases[canonical] = aliases.get(canonical, ()) + names
+    return AliasIndex(aliases, IMPLIED_SKILLS)
+
+
+def _heading_importance(line: str) -> str | None:
+    """섹션 제목 줄이면 해당 섹션의 중요도를 반환합니다."""
+    if BULLET_RE.match(line):
+        return None
+    stripped = line.strip().strip("#*■□▶●◆[]【】<>:： ").lower()
+    if not stripped or len(stripped) > MAX_HEADING_LENGTH:
+        return None
+    for importance, keywords in SECTION_IMPORTANCE:
+        if any(keyword in stripped for keyword in keywords):
+            return importance
+    return None
+
+
+def extract_requirements(jd: str) -> dict[str, str]:
+    """JD에서 기술 키워드와 중요도(High/Medium/Low)를 추출합니다.
+
+    자격요건/필수 섹션의 키워드는 High, 우대사항은 Medium, 그 외는 Low이며,
+    여러 섹션에 나오면 높은 중요도를 사용합니다.
+    """
+    index = get_alias_index()
+    requirements = {}
+    section = DEFAULT_IMPORTANCE
+    for line in (jd or "").splitlines():
+        heading = _heading_importance(line)
+        if heading is not None:
+            section = heading
+        for canonical in index.find_line(line):
+            current = requirements.get(canonical)
+            if current is None or IMPORTANCE_WEIGHTS[section] > IMPORTANCE_WEIGHTS[current]:
+                requirements[canonical] = section
+    return requirements
+
+
+@dataclass
+class KeywordMatch:
+    """JD 키워드가 이력서에 얼마나 나오는지에 대한 결과."""
+
+    # 가중 커버리지 점수 (0~100, JD에서 키워드를 찾지 못하면 None)
+    score: int | None
+    matched: list = field(default_factory=list)
+    missing: list = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @classmethod
+    def from_skills(cls, requirements: dict[str, str], skills: set[str], elapsed_ms: float = 0.0):
+        matched, missing = [], []
+        for canonical, importance in sorted(
+            requirements.items(), key=lambda item: (-IMPORTANCE_WEIGHTS[item[1]], item[0])
+        ):
+            entry = {"skill": canonical, "importance": importance}
+            (matched if canonical in skills else missing).append(entry)
+
+        total = sum(IMPORTANCE_WEIGHTS[importance] for importance in requirements.values())
+        score = None
+        if total:
+            weight = sum(IMPORTANCE_WEIGHTS[entry["importance"]] for entry in matched)
+            score = round(100 * weight / total)
+        return cls(score=score, matched=matched, missing=missing, elapsed_ms=elapsed_ms)
+
+    def summary(self) -> str:
+        """화면에 표시할 한 줄 요약."""
+        if self.score is None:
+            return ""
+        required = [entry for entry in self.matched + self.missing if entry["importance"] == "High"]
+        required_matched = sum(1 for entry in self.matched if entry["importance"] == "High")
+        text = (
+            f"키워드 커버리지 {self.score}점: JD 키워드 "
+            f"{len(self.matched)}/{len(self.matched) + len(self.missing)}개 일치"
+        )
+        if required:
+            text += f" (필수 {required_matched}/{len(required)}개)"
+        if self.missing:
+            text += ", 미확인: " + ", ".join(entry["skill"] for entry in self.missing[:5])
+        return text
+
+    def to_hints(self) -> str:
+        """LLM 입력에 덧붙일 참고 정보 (키워드 일치 여부만이며 판정 근거가 아님)."""
+        if self.score is None:
+            return ""
+
+        def names(entries):
+            return ", ".join(f"{entry['skill']}({entry['importance']})" for entry in entries) or "없음"
+
+        return (
+            f"- 이력서에서 확인된 JD 키워드: {names(self.matched)}\n"
+            f"- 이력서에서 찾지 못한 JD 키워드: {names(self.missing)}\n"
+            "- 단순 키워드 일치 결과이므로 판정은 반드시 원문 근거로 하세요."
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "score": self.score,
+            "matched": self.matched,
+            "missing": self.missing,
+            "elapsed_ms": round(self.elapsed_ms, 2),
+            "summary": self.summary(),
+        }
+
+
+def match_keywords(jd: str, resume: str, career_description: str = None) -> KeywordMatch:
+    """JD 키워드를 이력서(와 경력기술서)에서 찾아 커버리지를 계산합니다."""
+    started = time.perf_counter()
+    requirements = extract_requirements(jd)
+    skills = get_alias_index().skills(resume or "")
+    if career_description:
+        skills |= get_alias_index().skills(career_description)
+    return KeywordMatch.from_skills(
+        requirements, skills, (time.perf_counter() - started) * 1000
+    )
+
+
+class SkillIndex:
+    """여러 이력서의 기술 키워드 역색인 (표준 이름 → 문서 번호 집합).
+
+    배치 분석에서 이력서를 한 번씩만 토큰화해 두고, JD 키워드별 posting으로
+    모든 이력서의 커버리지를 한 번에 계산합니다.
+    """
+
+    def __init__(self):
+        self.postings = defaultdict(set)
+        self.size = 0
+
+    def add(self, text: str) -> int:
+        """문서를 색인하고 문서 번호를 반환합니다."""
+        doc_id = self.size
+        self.size += 1
+        for canonical in get_alias_index().skills(text):
+            self.postings[canonical].add(doc_id)
+        return doc_id
+
+    def match(self, jd: str) -> list[KeywordMatch]:
+        """문서 번호 순서대로 JD 키워드 커버리지를 반환합니다."""
+        started = time.perf_counter()
+        requirements = extract_requirements(jd)
+        skills = [set() for _ in range(self.size)]
+        for canonical in requirements:
+            for doc_id in self.postings.get(canonical, ()):
+                skills[doc_id].add(canonical)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        return [
+            KeywordMatch.from_skills(requirements, doc_skills, elapsed_ms)
+            for doc_skills in skills
+        ]
@@ -0,0 +1,101 @@
+"""Measure concurrent RequestLog write throughput for the configured database."""
+
+import multiprocessing
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections, transaction
+
+from evaluator.models import RequestLog
+
+# 문서용 주소 대역(TEST-NET-1)을 사용해 실제 요청 기록과 구분
+BENCHMARK_IP_PREFIX = "192.0.2."
+
+
+def write_rows(worker_id: int, writes: int) -> tuple[list[float], int]:
+    """RequestLog를 writes건 기록하고 (건별 지연 시간 목록, 실패 수)를 반환합니다."""
+    ip_address = f"{BENCHMARK_IP_PREFIX}{worker_id % 254 + 1}"
+    latencies = []
+    errors = 0
+    try:
+        for _ in range(writes):
+            start = time.perf_counter()
+            try:
+                # 실제 요청 처리처럼 한도 확인(읽기) 후 기록(쓰기)
+                with transaction.atomic():
+                    RequestLog.get_today_count(ip_address)
+                    RequestLog.log_request(ip_address)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+    finally:
+        connections.close_all()
+    return latencies, errors
+
+
+def percentile(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+class Command(BaseCommand):
+    help = "여러 프로세스에서 동시에 RequestLog를 기록하여 DB 쓰기 처리량을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=8,
+            help="동시에 기록하는 프로세스 수 (기본값: 8, gunicorn 워커 수에 맞춤)",
+        )
+        parser.add_argument(
+            "--writes",
+            type=int,
+            default=200,
+            help="프로세스당 기록 수 (기본값: 200)",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="측정 후 벤치마크 기록을 삭제하지 않음",
+        )
+
+    def handle(self, *args, **options):
+        workers = options["workers"]
+        writes = options["writes"]
+        if workers < 1 or writes < 1:
+            raise CommandError("--workers와 --writes는 1 이상이어야 합니다.")
+
+        settings_dict = connection.settings_dict
+        self.stdout.write(
+            f"DB: {connection.vendor} ({settings_dict['NAME']}), "
+            f"OPTIONS: {settings_dict.get('OPTIONS') or '-'}"
+        )
+        self.stdout.write(f"프로세스 {workers}개 × {writes}건 기록")
+
+        # fork된 프로세스가 부모의 DB 연결을 공유하지 않도록 먼저 닫음
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        start = time.perf_counter()
+        with context.Pool(workers) as pool:
+            results = pool.starmap(write_rows, [(i, writes) for i in range(workers)])
+        elapsed = time.perf_counter() - start
+
+        latencies = [latency for worker, _ in results for latency in worker]
+        errors = sum(error for _, error in results)
+        self.stdout.write(
+            f"성공 {len(latencies)}건, 실패 {errors}건, {elapsed:.2f}초\n"
+            f"처리량: {len(latencies) / elapsed:.0f} writes/s\n"
+            f"지연 시간(ms): p50 {statistics.median(latencies or [0]) * 1000:.1f}, "
+            f"p95 {percentile(latencies, 95) * 1000:.1f}, "
+            f"p99 {percentile(latencies, 99) * 1000:.1f}"
+        )
+
+        if not options["keep"]:
+            RequestLog.objects.filter(
+                ip_address__startswith=BENCHMARK_IP_PREFIX
+            ).delete()
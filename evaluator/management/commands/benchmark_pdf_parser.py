@@ -0,0 +1,96 @@
+"""Benchmark serial vs page-parallel PDF extraction over generated PDFs."""
+
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from evaluator.file_parser import get_pdf_limits, parse_pdf
+
+SAMPLE_LINE = "Python Django Kubernetes 백엔드 개발 경험 5년, 대용량 트래픽 서비스 운영 "
+
+
+def generate_pdf(path: Path, pages: int, lines_per_page: int = 40):
+    """이력서와 비슷한 분량의 텍스트를 가진 PDF를 생성합니다."""
+    import fitz  # PyMuPDF
+
+    doc = fitz.open()
+    try:
+        for number in range(pages):
+            page = doc.new_page()
+            text = "\n".join(
+                f"{number + 1}-{line + 1}. {SAMPLE_LINE}"
+                for line in range(lines_per_page)
+            )
+            page.insert_textbox(page.rect + (36, 36, -36, -36), text, fontname="korea")
+        doc.save(path)
+    finally:
+        doc.close()
+
+
+class Command(BaseCommand):
+    help = "생성한 PDF 묶음으로 직렬/병렬 텍스트 추출 성능을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--pages",
+            default="2,20,80",
+            help="생성할 PDF의 페이지 수 목록 (쉼표 구분, 기본값: 2,20,80)",
+        )
+        parser.add_argument(
+            "--documents",
+            type=int,
+            default=5,
+            help="페이지 수별 PDF 개수 (기본값: 5)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=get_pdf_limits()["workers"],
+            help="병렬 추출 프로세스 수 (기본값: PDF_WORKERS)",
+        )
+
+    def handle(self, *args, **options):
+        page_counts = [int(value) for value in options["pages"].split(",")]
+        workers = options["workers"]
+
+        with tempfile.TemporaryDirectory() as directory:
+            corpus = {}
+            for pages in page_counts:
+                corpus[pages] = []
+                for index in range(options["documents"]):
+                    path = Path(directory) / f"resume_{pages}_{index}.pdf"
+                    generate_pdf(path, pages)
+                    corpus[pages].append(path)
+
+            # 추출 워커 시작 비용이 측정에 섞이지 않도록 미리 실행
+            parse_pdf(corpus[page_counts[-1]][0], workers=workers, parallel_min_pages=1)
+
+            self.stdout.write(
+                f"{'페이지':>6} {'방식':>8} {'문서/s':>8} {'페이지/s':>10} {'p95(ms)':>9}"
+            )
+            for pages, paths in corpus.items():
+                for label, limits in (
+                    # 요청 프로세스에서 직접 추출 (제한 시간 없음)
+                    ("serial", {"workers": 1, "timeout": 0}),
+                    # 기본 경로: 제한 시간을 위해 워커 하나에서 문서 전체를 추출
+                    ("isolated", {"workers": workers, "parallel_min_pages": pages + 1}),
+                    (f"x{workers}", {"workers": workers, "parallel_min_pages": 1}),
+                ):
+                    latencies = []
+                    for path in paths:
+                        start = time.perf_counter()
+                        parse_pdf(path, max_pages=max(page_counts), **limits)
+                        latencies.append(time.perf_counter() - start)
+                    total = sum(latencies)
+                    latencies.sort()
+                    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+                    self.stdout.write(
+                        f"{pages:>6} {label:>8} {len(paths) / total:>8.1f} "
+                        f"{len(paths) * pages / total:>10.0f} {p95 * 1000:>9.1f}"
+                    )
+
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        self.stdout.write(f"최대 메모리(RSS): {peak_kb / 1024:.0f}MB")
@@ -0,0 +1,163 @@
+"""Measure worker cold start and first-request latency against a budget."""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from .benchmark_pdf_parser import generate_pdf
+
+# 새로 뜬 워커와 같은 진입점(config.wsgi)으로 앱을 불러오고 첫 요청/두 번째 요청을 보냄
+# (가짜 LLM 백엔드)
+CHILD_SCRIPT = """
+import json, sys, time, uuid
+started = time.perf_counter()
+from config.wsgi import application
+timings = {"cold_start": time.perf_counter() - started}
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client
+from evaluator import startup
+from evaluator.management.commands.loadtest import SAMPLE_JD
+
+client = Client(HTTP_HOST="localhost")
+
+def timed(name, method, *args, **kwargs):
+    started = time.perf_counter()
+    response = method(*args, **kwargs)
+    # 폼 오류는 200 응답에 오류 알림으로 렌더링됨
+    if response.status_code >= 400 or b"alert-dismissible" in response.content:
+        raise SystemExit(f"{name}: HTTP {response.status_code} {response.content[-300:]!r}")
+    timings[name] = time.perf_counter() - started
+
+with open(sys.argv[1], "rb") as f:
+    pdf = f.read()
+
+def evaluate():
+    # 파싱 결과 캐시(DB)에 걸리지 않도록 실행/요청마다 내용을 조금씩 바꿈
+    resume = SimpleUploadedFile(
+        "resume.pdf", pdf + f"\\n%{uuid.uuid4()}".encode(), content_type="application/pdf"
+    )
+    data = {"provider": "openai", "jd": SAMPLE_JD, "resume": resume, "bypass_cache": "on"}
+    return client.post("/", data)
+
+timed("first_get", client.get, "/")
+timed("first_post", evaluate)
+timed("warm_post", evaluate)
+timings["stages"] = startup.last_timings
+print(json.dumps(timings))
+"""
+
+# 측정 중에 LLM 지연이 섞이지 않도록 가짜 백엔드는 즉시 응답
+CHILD_ENV = {
+    "LLM_FAKE_BACKEND": "True",
+    "LLM_FAKE_TTFT": "fixed:0",
+    "LLM_FAKE_LATENCY": "fixed:0",
+    "LLM_FAKE_ERROR_RATE": "0",
+    "RATE_LIMIT_DAILY_LIMIT": "1000",
+}
+
+MODES = {
+    "preload": {"STARTUP_PRELOAD": "True", "LLM_WARMUP": "True"},
+    "lazy": {"STARTUP_PRELOAD": "False", "LLM_WARMUP": "False"},
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "새 프로세스에서 앱 로딩(cold start)과 첫 요청 지연을 측정하고, "
+        "예산을 넘으면 실패합니다 (회귀 확인용)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5, help="모드별 반복 횟수 (기본값: 5)")
+        parser.add_argument(
+            "--cold-start-budget",
+            type=float,
+            default=3.0,
+            help="앱 로딩 시간 예산(초, 중앙값 기준, 기본값: 3.0)",
+        )
+        parser.add_argument(
+            "--first-request-budget",
+            type=float,
+            default=0.5,
+            help="첫 분석 요청 지연 예산(초, 중앙값 기준, 기본값: 0.5)",
+        )
+        parser.add_argument(
+            "--compare",
+            action="store_true",
+            help="미리 준비하지 않는 모드(lazy)도 측정해 비교 (예산은 preload 모드에만 적용)",
+        )
+
+    def handle(self, *args, **options):
+        if options["runs"] < 1:
+            raise CommandError("--runs는 1 이상이어야 합니다.")
+
+        modes = ["preload", "lazy"] if options["compare"] else ["preload"]
+        with tempfile.TemporaryDirectory() as directory:
+            env = {**os.environ, **CHILD_ENV, "SQLITE_PATH": str(Path(directory) / "db.sqlite3")}
+            self.run_child([sys.executable, "manage.py", "migrate", "--no-input"], env)
+            # PDF 이력서로 요청해야 PyMuPDF 임포트 비용이 첫 요청에 드러남
+            resume_path = Path(directory) / "resume.pdf"
+            generate_pdf(resume_path, pages=2)
+
+            results = {}
+            for mode in modes:
+                runs = []
+                for _ in range(options["runs"]):
+                    output = self.run_child(
+                        [sys.executable, "-c", CHILD_SCRIPT, str(resume_path)],
+                        {**env, **MODES[mode]},
+                    )
+                    runs.append(json.loads(output.strip().splitlines()[-1]))
+                results[mode] = runs
+
+        self.stdout.write(
+            f"{'모드':<8}{'앱 로딩':>10}{'첫 GET':>10}{'첫 분석':>10}{'이후 분석':>10}  (중앙값, 초)"
+        )
+        medians = {}
+        for mode, runs in results.items():
+            medians[mode] = {
+                key: statistics.median(run[key] for run in runs)
+                for key in ("cold_start", "first_get", "first_post", "warm_post")
+            }
+            self.stdout.write(
+                f"{mode:<8}"
+                + "".join(f"{medians[mode][key]:>10.3f}" for key in medians[mode])
+            )
+
+        stages = results["preload"][-1]["stages"]
+        self.stdout.write(
+            "\n시작 준비 단계: "
+            + ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in stages.items())
+        )
+
+        violations = []
+        preload = medians["preload"]
+        if preload["cold_start"] > options["cold_start_budget"]:
+            violations.append(
+                f"앱 로딩 {preload['cold_start']:.3f}초 > 예산 {options['cold_start_budget']}초"
+            )
+        if preload["first_post"] > options["first_request_budget"]:
+            violations.append(
+                f"첫 분석 요청 {preload['first_post']:.3f}초 > 예산 {options['first_request_budget']}초"
+            )
+        if violations:
+            raise CommandError("시작 성능 예산 초과: " + "; ".join(violations))
+        self.stdout.write(self.style.SUCCESS("\n시작 성능 예산 안에 있습니다."))
+
+    def run_child(self, command: list, env: dict) -> str:
+        completed = subprocess.run(
+            command, cwd=settings.BASE_DIR, env=env, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            raise CommandError(
+                f"{' '.join(command[:3])} 실행 실패:\n{(completed.stderr or completed.stdout)[-2000:]}"
+            )
+        return completed.stdout
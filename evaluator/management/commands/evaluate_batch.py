@@ -0,0 +1,235 @@
+"""Evaluate one JD against a zip file or directory of resumes."""
+
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from evaluator.batch import (
+    BatchInputError,
+    JsonlWriter,
+    collect_offline_batch,
+    format_ranking,
+    get_config,
+    keyword_records,
+    prepare_batch,
+    run_batch,
+    submit_offline_batch,
+)
+from evaluator.keyword_match import get_config as get_keyword_config
+from evaluator.similarity import METHODS as SIMILARITY_METHODS
+from evaluator.triage import get_config as get_triage_config
+from evaluator.views import load_system_prompt
+
+
+class Command(BaseCommand):
+    help = "하나의 JD로 여러 이력서(zip 또는 디렉터리)를 분석하여 JSONL과 순위 요약을 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "resumes",
+            nargs="?",
+            help="이력서 zip 파일 또는 디렉터리 (.pdf, .md, .txt)",
+        )
+        parser.add_argument("--jd", help="채용공고 텍스트 파일 경로")
+        parser.add_argument(
+            "--provider",
+            default="openai",
+            choices=["openai", "claude", "auto"],
+            help="AI 모델 (기본값: openai)",
+        )
+        parser.add_argument(
+            "--output",
+            default="results.jsonl",
+            help="결과 JSONL 경로 (기본값: results.jsonl, 순위 요약은 .summary.md)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=get_config()["CONCURRENCY"],
+            help="동시에 실행할 최대 LLM 호출 수",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="저장된 분석 결과를 사용하지 않음",
+        )
+        parser.add_argument(
+            "--triage-threshold",
+            type=int,
+            help="소형 모델 빠른 평가 점수가 이 값 이상인 이력서만 상세 분석 "
+            "(기본값: LLM_TRIAGE 사용 시 LLM_TRIAGE_THRESHOLD)",
+        )
+        parser.add_argument(
+            "--no-triage",
+            action="store_true",
+            help="빠른 평가 없이 모든 이력서를 상세 분석",
+        )
+        parser.add_argument(
+            "--keywords-only",
+            action="store_true",
+            help="LLM을 호출하지 않고 로컬 키워드 커버리지로만 정렬 (캐시된 결과는 사용)",
+        )
+        parser.add_argument(
+            "--min-keyword-score",
+            type=int,
+            help="키워드 커버리지가 이 값 이상인 이력서만 LLM으로 분석",
+        )
+        parser.add_argument(
+            "--similarity",
+            choices=SIMILARITY_METHODS,
+            help="JD-이력서 로컬 관련도 계산 방식 (numpy/scipy 필요, 기본값: SIMILARITY_RANKING 설정)",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            help="로컬 관련도(유사도, 키워드 커버리지 순) 상위 N개 이력서만 LLM으로 분석",
+        )
+        parser.add_argument(
+            "--offline",
+            action="store_true",
+            help="provider Batches API로 제출 (약 50%% 저렴, 최대 24시간 소요)",
+        )
+        parser.add_argument(
+            "--no-wait",
+            action="store_true",
+            help="--offline 제출 후 기다리지 않고 종료 (나중에 --collect로 결과 수집)",
+        )
+        parser.add_argument(
+            "--collect",
+            metavar="MANIFEST",
+            help="--offline으로 제출한 배치의 매니페스트(.batch.json)에서 결과 수집",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=60.0,
+            help="오프라인 배치 상태 확인 간격(초) (기본값: 60)",
+        )
+
+    def handle(self, *args, **options):
+        from llm_client import get_default_model
+
+        output = Path(options["output"])
+        if options["collect"]:
+            self.collect(options["collect"], output, options["poll_interval"])
+            return
+
+        if not options["resumes"] or not options["jd"]:
+            raise CommandError("이력서 경로와 --jd를 지정해주세요.")
+        provider = options["provider"]
+        if options["offline"] and provider == "auto":
+            raise CommandError("--offline은 openai 또는 claude provider만 지원합니다.")
+        keyword_options = options["keywords_only"] or options["min_keyword_score"] is not None
+        if keyword_options and not get_keyword_config()["ENABLED"]:
+            raise CommandError("키워드 매칭이 비활성화되어 있습니다 (KEYWORD_MATCH_ENABLED).")
+        if options["offline"] and (
+            options["min_keyword_score"] is not None or options["top"] is not None
+        ):
+            raise CommandError("--min-keyword-score, --top은 --offline과 함께 사용할 수 없습니다.")
+
+        jd = Path(options["jd"]).read_text(encoding="utf-8")
+        model = get_default_model(provider)
+        system_prompt = load_system_prompt()
+
+        started = time.monotonic()
+        try:
+            items = prepare_batch(
+                jd,
+                options["resumes"],
+                provider,
+                model,
+                system_prompt,
+                use_cache=not options["no_cache"],
+                similarity_method=options["similarity"],
+            )
+        except (BatchInputError, ImportError) as e:
+            raise CommandError(str(e))
+        cached = sum(1 for item in items if item.cached_result is not None)
+        failed = sum(1 for item in items if item.error)
+        self.stdout.write(
+            f"이력서 {len(items)}개 파싱 완료 ({time.monotonic() - started:.1f}초, "
+            f"캐시 {cached}개, 실패 {failed}개)"
+        )
+
+        if options["keywords_only"]:
+            writer = JsonlWriter(output)
+            try:
+                records = keyword_records(
+                    items, provider, model, lambda record: self.on_record(writer, record)
+                )
+            finally:
+                writer.close()
+            self.write_summary(records, output, started)
+            return
+
+        if options["offline"]:
+            manifest = output.with_suffix(".batch.json")
+            batch_id = submit_offline_batch(
+                items, provider, model, system_prompt, manifest
+            )
+            self.stdout.write(f"배치 제출: {batch_id or '(모두 캐시됨)'}, 매니페스트: {manifest}")
+            if options["no_wait"]:
+                self.stdout.write(f"결과 수집: python manage.py evaluate_batch --collect {manifest}")
+                return
+            self.collect(manifest, output, options["poll_interval"])
+            return
+
+        triage_threshold = options["triage_threshold"]
+        if triage_threshold is None and get_triage_config()["ENABLED"]:
+            triage_threshold = get_triage_config()["THRESHOLD"]
+        if options["no_triage"]:
+            triage_threshold = None
+
+        writer = JsonlWriter(output)
+        try:
+            records = run_batch(
+                items,
+                provider,
+                model,
+                system_prompt,
+                on_record=lambda record: self.on_record(writer, record),
+                concurrency=options["concurrency"],
+                triage_threshold=triage_threshold,
+                min_keyword_score=options["min_keyword_score"],
+                top=options["top"],
+            )
+        finally:
+            writer.close()
+        self.write_summary(records, output, started)
+
+    def on_record(self, writer: JsonlWriter, record: dict):
+        writer.write(record)
+        score = f"{record['score']}점" if record["score"] is not None else "-"
+        self.stdout.write(f"  [{record['status']}] {record['request_id']} ({score})")
+
+    def collect(self, manifest, output: Path, poll_interval: float):
+        started = time.monotonic()
+        writer = JsonlWriter(output)
+        try:
+            while True:
+                try:
+                    records = collect_offline_batch(
+                        manifest, lambda record: self.on_record(writer, record)
+                    )
+                except BatchInputError as e:
+                    raise CommandError(str(e))
+                if records is not None:
+                    break
+                self.stdout.write(f"배치 진행 중... {poll_interval:g}초 후 다시 확인합니다.")
+                time.sleep(poll_interval)
+        finally:
+            writer.close()
+        self.write_summary(records, output, started)
+
+    def write_summary(self, records: list, output: Path, started: float):
+        summary = format_ranking(records)
+        summary_path = output.with_suffix(".summary.md")
+        summary_path.write_text(summary + "\n", encoding="utf-8")
+        self.stdout.write("\n" + summary + "\n")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"완료: {len(records)}건, {time.monotonic() - started:.1f}초 "
+                f"(결과: {output}, 요약: {summary_path})"
+            )
+        )
@@ -0,0 +1,90 @@
+"""Report which packages dominate start-up import time (python -X importtime)."""
+
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 새 프로세스에서 워커 시작과 같은 경로(config.wsgi: django.setup → 시작 준비)를 실행
+STARTUP_SCRIPT = "import config.wsgi"
+
+# "import time:  self [us] | cumulative | imported package" (들여쓰기 = 임포트 깊이)
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def parse_importtime(output: str) -> list[tuple[str, int, int, int]]:
+    """-X importtime 출력을 [(모듈, 자체 μs, 누적 μs, 깊이)]로 변환합니다."""
+    rows = []
+    for line in output.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+class Command(BaseCommand):
+    help = (
+        "새 프로세스에서 앱 시작(config.wsgi)을 python -X importtime으로 실행해 "
+        "패키지별 임포트 시간을 보여줍니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=20, help="표시할 항목 수 (기본값: 20)")
+        parser.add_argument(
+            "--no-preload",
+            action="store_true",
+            help="STARTUP_PRELOAD/LLM_WARMUP을 끄고 측정 (요청 시점으로 미뤄지는 임포트 확인용)",
+        )
+        parser.add_argument(
+            "--modules",
+            action="store_true",
+            help="패키지 합계 대신 최상위 임포트별 누적 시간을 표시",
+        )
+
+    def handle(self, *args, **options):
+        env = dict(os.environ)
+        if options["no_preload"]:
+            env.update(STARTUP_PRELOAD="False", LLM_WARMUP="False")
+
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode != 0:
+            raise CommandError(f"앱 시작에 실패했습니다:\n{completed.stderr[-2000:]}")
+        rows = parse_importtime(completed.stderr)
+        if not rows:
+            raise CommandError("-X importtime 출력을 찾을 수 없습니다.")
+
+        total_ms = sum(self_us for _, self_us, _, _ in rows) / 1000
+        self.stdout.write(f"모듈 {len(rows)}개, 임포트 합계 {total_ms:.0f}ms\n")
+
+        if options["modules"]:
+            # 깊이 0 = 다른 모듈이 아닌 시작 코드가 직접 임포트한 모듈 (누적 시간이 곧 그 비용)
+            top_level = sorted(
+                (row for row in rows if row[3] == 0), key=lambda row: row[2], reverse=True
+            )
+            self.stdout.write(f"{'누적(ms)':>10}  모듈")
+            for name, _, cumulative_us, _ in top_level[: options["top"]]:
+                self.stdout.write(f"{cumulative_us / 1000:>10.1f}  {name}")
+            return
+
+        packages = defaultdict(lambda: [0, 0])
+        for name, self_us, _, _ in rows:
+            package = packages[name.split(".")[0]]
+            package[0] += self_us
+            package[1] += 1
+        ranked = sorted(packages.items(), key=lambda item: item[1][0], reverse=True)
+        self.stdout.write(f"{'자체(ms)':>10} {'비율':>6} {'모듈 수':>7}  패키지")
+        for package, (self_us, count) in ranked[: options["top"]]:
+            self.stdout.write(
+                f"{self_us / 1000:>10.1f} {self_us / 1000 / total_ms:>6.1%} {count:>7}  {package}"
+            )
@@ -0,0 +1,271 @@
+"""Drive a running server with concurrent evaluation requests and report latency."""
+
+import http.cookiejar
+import json
+import math
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+SAMPLE_JD = """백엔드 개발자 채용
+
+자격요건
+- Python 3년 이상, Django 또는 FastAPI 경험
+- AWS, Docker 기반 서비스 운영 경험
+
+우대사항
+- Kubernetes, Kafka 사용 경험
+"""
+
+SAMPLE_RESUME = """백엔드 개발자 5년차
+- Python/Django로 결제 서비스 개발 및 운영 (일 100만 건)
+- AWS ECS, Docker 기반 배포 자동화, GitHub Actions CI/CD 구축
+- Redis 캐시 도입으로 API 응답 시간 40% 단축
+"""
+
+CSRF_TOKEN_RE = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+# 서버가 렌더링한 오류 알림 (스트리밍용 #streamError는 항상 숨김 상태로 들어 있음)
+FORM_ERROR_RE = re.compile(r'alert-dismissible[^>]*role="alert">\s*<strong>오류:</strong>\s*([^<]*)')
+
+# 스트리밍 응답에서 첫 내용으로 보는 SSE 이벤트
+CONTENT_EVENTS = ("event: token", "event: markdown", "event: fields", "event: triage")
+
+
+def percentile(samples: list, q: float) -> float | None:
+    """nearest-rank 방식의 q(0~1) 백분위수."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def encode_multipart(fields: dict, files: dict) -> tuple[bytes, str]:
+    """multipart/form-data 본문과 Content-Type을 만듭니다."""
+    boundary = uuid.uuid4().hex
+    lines = []
+    for name, value in fields.items():
+        lines += [
+            f"--{boundary}".encode(),
+            f'Content-Disposition: form-data; name="{name}"'.encode(),
+            b"",
+            str(value).encode("utf-8"),
+        ]
+    for name, (filename, content) in files.items():
+        lines += [
+            f"--{boundary}".encode(),
+            f'Content-Disposition: form-data; name="{name}"; filename="{filename}"'.encode(),
+            b"Content-Type: text/plain",
+            b"",
+            content,
+        ]
+    lines += [f"--{boundary}--".encode(), b""]
+    return b"\r\n".join(lines), f"multipart/form-data; boundary={boundary}"
+
+
+class Session:
+    """CSRF 쿠키와 토큰을 가진 HTTP 세션 (스레드마다 하나)."""
+
+    def __init__(self, base_url: str, timeout: float):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+        with self.opener.open(self.base_url + "/", timeout=timeout) as response:
+            html = response.read().decode("utf-8")
+        match = CSRF_TOKEN_RE.search(html)
+        if match is None:
+            raise CommandError("폼에서 CSRF 토큰을 찾을 수 없습니다.")
+        self.csrf_token = match.group(1)
+
+    def post(self, path: str, fields: dict, files: dict, headers: dict):
+        body, content_type = encode_multipart(
+            {"csrfmiddlewaretoken": self.csrf_token, **fields}, files
+        )
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=body,
+            headers={
+                "Content-Type": content_type,
+                "Referer": self.base_url + "/",
+                "X-CSRFToken": self.csrf_token,
+                **headers,
+            },
+        )
+        return self.opener.open(request, timeout=self.timeout)
+
+    def get_json(self, path: str) -> dict:
+        with self.opener.open(self.base_url + path, timeout=self.timeout) as response:
+            return json.loads(response.read())
+
+
+class Command(BaseCommand):
+    help = (
+        "실행 중인 서버에 동시 분석 요청을 보내 p50/p95/p99 지연과 처리량을 측정합니다 "
+        "(LLM_FAKE_BACKEND=True로 서버를 띄우면 API 비용 없이 측정)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--url", default="http://127.0.0.1:8000", help="서버 주소 (기본값: http://127.0.0.1:8000)"
+        )
+        parser.add_argument(
+            "--endpoint",
+            default="stream",
+            choices=["stream", "form", "jobs"],
+            help="stream: SSE 스트리밍, form: 일반 폼 제출, jobs: 작업 큐 등록 후 완료까지 폴링",
+        )
+        parser.add_argument("-n", "--requests", type=int, default=50, help="전체 요청 수 (기본값: 50)")
+        parser.add_argument("-c", "--concurrency", type=int, default=10, help="동시 요청 수 (기본값: 10)")
+        parser.add_argument("--provider", default="openai", help="폼의 AI 모델 값 (기본값: openai)")
+        parser.add_argument("--jd", help="채용공고 텍스트 파일 (기본값: 내장 예시)")
+        parser.add_argument("--resume", help="이력서 .txt/.md 파일 (기본값: 내장 예시)")
+        parser.add_argument(
+            "--use-cache",
+            action="store_true",
+            help="결과 캐시 사용 (기본값은 매 요청 LLM 호출)",
+        )
+        parser.add_argument(
+            "--unique-ips",
+            action="store_true",
+            help="요청마다 다른 X-Forwarded-For를 보내 IP별 일일 한도를 피함 (테스트 서버 전용)",
+        )
+        parser.add_argument(
+            "--timeout", type=float, default=900.0, help="요청 하나의 최대 대기 시간(초)"
+        )
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["concurrency"] < 1:
+            raise CommandError("--requests와 --concurrency는 1 이상이어야 합니다.")
+
+        jd = Path(options["jd"]).read_text(encoding="utf-8") if options["jd"] else SAMPLE_JD
+        if options["resume"]:
+            resume_path = Path(options["resume"])
+            resume = (resume_path.name, resume_path.read_bytes())
+        else:
+            resume = ("resume.txt", SAMPLE_RESUME.encode("utf-8"))
+        fields = {"provider": options["provider"], "jd": jd}
+        if not options["use_cache"]:
+            fields["bypass_cache"] = "on"
+
+        local = threading.local()
+        results = []
+        results_lock = threading.Lock()
+
+        def run_one(index: int):
+            try:
+                if not hasattr(local, "session"):
+                    local.session = Session(options["url"], options["timeout"])
+                headers = {}
+                if options["unique_ips"]:
+                    headers["X-Forwarded-For"] = f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}"
+                result = getattr(self, f"request_{options['endpoint']}")(
+                    local.session, fields, {"resume": resume}, headers
+                )
+            except Exception as e:
+                result = {"error": type(e).__name__ if not str(e) else str(e)[:80]}
+            with results_lock:
+                results.append(result)
+
+        self.stdout.write(
+            f"{options['url']} ({options['endpoint']})에 {options['requests']}건, "
+            f"동시 {options['concurrency']}건 요청 중..."
+        )
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            list(executor.map(run_one, range(options["requests"])))
+        elapsed = time.monotonic() - started
+        self.report(results, elapsed, options["concurrency"])
+
+    def request_stream(self, session: Session, fields, files, headers) -> dict:
+        started = time.monotonic()
+        first_content = None
+        error = None
+        try:
+            response = session.post("/stream/", fields, files, headers)
+        except urllib.error.HTTPError as e:
+            return {"error": f"HTTP {e.code}"}
+        with response:
+            for line in response:
+                line = line.decode("utf-8").rstrip("\n")
+                if first_content is None and line.startswith(CONTENT_EVENTS):
+                    first_content = time.monotonic() - started
+                elif line.startswith("event: error"):
+                    error = "SSE error"
+        result = {"total": time.monotonic() - started, "first": first_content}
+        if error:
+            result["error"] = error
+        return result
+
+    def request_form(self, session: Session, fields, files, headers) -> dict:
+        started = time.monotonic()
+        try:
+            with session.post("/", fields, files, headers) as response:
+                html = response.read().decode("utf-8")
+        except urllib.error.HTTPError as e:
+            return {"error": f"HTTP {e.code}"}
+        result = {"total": time.monotonic() - started, "first": None}
+        match = FORM_ERROR_RE.search(html)
+        if match:
+            result["error"] = match.group(1).strip()[:80] or "오류 화면"
+        return result
+
+    def request_jobs(self, session: Session, fields, files, headers) -> dict:
+        started = time.monotonic()
+        try:
+            with session.post("/jobs/", fields, files, headers) as response:
+                data = json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return {"error": f"HTTP {e.code}"}
+        accepted = time.monotonic() - started
+        while data["status"] not in ("succeeded", "failed"):
+            time.sleep(0.5)
+            data = session.get_json(data.get("status_url") or f"/jobs/{data['job_id']}/")
+        result = {"total": time.monotonic() - started, "first": accepted}
+        if data["status"] == "failed":
+            result["error"] = "작업 실패"
+        return result
+
+    def report(self, results: list, elapsed: float, concurrency: int):
+        succeeded = [result for result in results if not result.get("error")]
+        errors = Counter(result["error"] for result in results if result.get("error"))
+        self.stdout.write(
+            f"\n요청 {len(results)}건 (동시 {concurrency}), 성공 {len(succeeded)}건, "
+            f"실패 {sum(errors.values())}건, 소요 {elapsed:.1f}초, "
+            f"처리량 {len(succeeded) / elapsed if elapsed else 0:.2f} req/s\n"
+        )
+
+        def row(label: str, samples: list):
+            if not samples:
+                return
+            values = [
+                percentile(samples, 0.5),
+                percentile(samples, 0.95),
+                percentile(samples, 0.99),
+                max(samples),
+            ]
+            self.stdout.write(
+                f"{label:<12}" + "".join(f"{value:>9.2f}s" for value in values)
+            )
+
+        self.stdout.write(f"{'':<12}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+        row("전체 응답", [result["total"] for result in succeeded])
+        row(
+            "첫 응답",
+            [result["first"] for result in succeeded if result.get("first") is not None],
+        )
+        if errors:
+            self.stdout.write(
+                "\n실패 사유: "
+                + ", ".join(f"{reason} ×{count}" for reason, count in errors.most_common())
+            )
@@ -0,0 +1,98 @@
+"""Roll up old RequestLog rows into daily counts and prune them."""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from evaluator.models import RateLimitCounter, RequestLog
+
+
+def optimize_database(table: str):
+    """삭제 후 빈 공간을 회수하고 쿼리 플래너 통계를 갱신합니다."""
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            cursor.execute("VACUUM")
+            cursor.execute("ANALYZE")
+        elif connection.vendor == "postgresql":
+            cursor.execute(f'VACUUM ANALYZE "{table}"')
+        else:
+            cursor.execute(f"ANALYZE TABLE {table}")
+
+
+class Command(BaseCommand):
+    help = "보존 기간이 지난 요청 기록을 일별 집계로 옮기고 원본을 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=settings.REQUEST_LOG_RETENTION_DAYS,
+            help=(
+                "원본 기록을 보존할 일수 "
+                f"(기본값: {settings.REQUEST_LOG_RETENTION_DAYS})"
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 트랜잭션에서 처리할 최대 기록 수 (기본값: 1000)",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.0,
+            help="배치 사이 대기 시간(초). 운영 중 DB 잠금을 줄일 때 사용 (기본값: 0)",
+        )
+        parser.add_argument(
+            "--no-vacuum",
+            action="store_true",
+            help="삭제 후 VACUUM/ANALYZE를 실행하지 않음",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="삭제하지 않고 대상 기록 수만 출력",
+        )
+
+    def handle(self, *args, **options):
+        retention_days = options["retention_days"]
+        batch_size = options["batch_size"]
+        # 오늘 기록은 요청 한도 계산에 쓰이므로 최소 1일은 보존
+        if retention_days < 1:
+            raise CommandError("--retention-days는 1 이상이어야 합니다.")
+        if batch_size < 1:
+            raise CommandError("--batch-size는 1 이상이어야 합니다.")
+
+        cutoff = RequestLog.today_start() - timedelta(days=retention_days - 1)
+        self.stdout.write(f"{cutoff:%Y-%m-%d} 이전 요청 기록을 정리합니다.")
+
+        if options["dry_run"]:
+            count = RequestLog.objects.filter(requested_at__lt=cutoff).count()
+            self.stdout.write(f"정리 대상: {count}건 (dry-run)")
+            return
+
+        total = 0
+        while True:
+            deleted = RequestLog.archive_batch(cutoff, batch_size)
+            if not deleted:
+                break
+            total += deleted
+            self.stdout.write(f"  {total}건 집계 및 삭제")
+            if options["sleep"]:
+                time.sleep(options["sleep"])
+
+        # 지난 날짜의 요청 한도 카운터는 더 이상 쓰이지 않음
+        pruned = RateLimitCounter.prune(timezone.localdate())
+        if pruned:
+            self.stdout.write(f"  지난 요청 한도 카운터 {pruned}건 삭제")
+
+        if total and not options["no_vacuum"]:
+            optimize_database(RequestLog._meta.db_table)
+            self.stdout.write("VACUUM/ANALYZE 완료")
+
+        self.stdout.write(self.style.SUCCESS(f"완료: {total}건 정리"))
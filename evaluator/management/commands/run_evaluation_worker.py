@@ -0,0 +1,206 @@
+"""Background worker that drains queued evaluation jobs."""
+
+import io
+import logging
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, transaction
+
+from evaluator.batch import BatchInputError, extract_total_score, prepare_batch
+from evaluator.models import EvaluationJob
+from evaluator.ratelimit import get_rate_limiter
+from evaluator.result_cache import set_cached_result
+from evaluator.structured import load_evaluation, output_options
+from evaluator.triage import run_triage, should_triage
+from evaluator.views import load_system_prompt
+
+logger = logging.getLogger(__name__)
+
+
+def run_prepare_batch(job: EvaluationJob):
+    """저장된 zip에서 이력서를 파싱하고 이력서별 분석 작업을 등록합니다."""
+    from llm_client import get_default_model
+
+    close_old_connections()
+    try:
+        batch = job.batch
+        registered = batch.jobs.filter(kind=EvaluationJob.Kind.EVALUATE).count()
+        if registered:
+            # 임대가 끊겨 다시 실행된 준비 작업: 이미 다른 워커가 등록을 마침
+            job.mark_succeeded(f"이력서 {registered}개를 등록했습니다.")
+            return
+        items = prepare_batch(
+            batch.jd,
+            io.BytesIO(bytes(batch.archive)),
+            batch.provider,
+            get_default_model(batch.provider),
+            load_system_prompt(),
+            use_cache=batch.use_cache,
+        )
+        # 등록과 zip 삭제를 한 트랜잭션으로 처리 (파싱 중 다른 워커가 등록을 마쳤으면 건너뜀)
+        with transaction.atomic():
+            if not batch.jobs.filter(kind=EvaluationJob.Kind.EVALUATE).exists():
+                EvaluationJob.create_batch_jobs(batch, job.ip_address, items)
+            batch.archive = b""
+            batch.save(update_fields=["archive"])
+            job.mark_succeeded(f"이력서 {len(items)}개를 등록했습니다.")
+    except (BatchInputError, ImportError) as e:
+        job.mark_failed(str(e))
+    except Exception as e:
+        job.mark_failed(f"배치 준비 중 오류가 발생했습니다: {str(e)}")
+    finally:
+        close_old_connections()
+
+
+def run_job(job: EvaluationJob):
+    """단일 분석 작업을 실행하고 결과를 기록합니다."""
+    from llm_client import get_client, get_default_model
+
+    if job.kind == EvaluationJob.Kind.PREPARE_BATCH:
+        run_prepare_batch(job)
+        return
+
+    limiter = get_rate_limiter()
+    committed = False
+    close_old_connections()
+    try:
+        # 배치 선별 작업은 빠른 평가 점수가 기준 미만이면 상세 분석을 생략
+        if job.batch_id is not None and should_triage():
+            triage = run_triage(job.provider, job.user_message)
+            if not triage.passed():
+                job.mark_succeeded(
+                    triage.to_markdown(),
+                    score=triage.score,
+                    stage=EvaluationJob.Stage.TRIAGE,
+                )
+                return
+
+        model = get_default_model(job.provider)
+        client = get_client(job.provider, model)
+        system_prompt, response_schema = output_options(
+            load_system_prompt(), job.provider
+        )
+        result = client.generate(system_prompt, job.user_message, response_schema)
+        if response_schema is not None:
+            load_evaluation(result)
+        score = extract_total_score(result)
+
+        # 성공 시 요청 기록 (배치 작업은 요청 한도와 무관)
+        if job.batch_id is None:
+            limiter.commit(job.ip_address)
+            committed = True
+        # 장애 조치로 다른 provider가 응답했으면 요청한 provider의 키로 캐시하지 않음
+        served = (client.served_provider or job.provider, client.served_model or model)
+        if job.cache_key and served == (job.provider, model):
+            try:
+                set_cached_result(job.cache_key, job.provider, model, result)
+            except Exception:
+                # 캐시 저장 실패가 완료된 분석을 실패로 바꾸지 않도록 기록만 남김
+                logger.exception("결과 캐시 저장 실패 (작업 %s)", job.pk)
+        job.mark_succeeded(result, score=score)
+    except Exception as e:
+        # 등록 시 예약한 요청 한도를 반환 (이미 기록된 요청은 반환하지 않음)
+        if job.batch_id is None and not committed:
+            limiter.release(job.ip_address)
+        job.mark_failed(f"분석 중 오류가 발생했습니다: {str(e)}")
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    help = "대기 중인 분석 작업을 스레드 풀에서 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="동시에 처리할 최대 작업 수 (기본값: 4)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="대기 작업이 없을 때 큐를 다시 확인하는 간격(초) (기본값: 1.0)",
+        )
+        parser.add_argument(
+            "--stale-after",
+            type=int,
+            default=60,
+            help=(
+                "하트비트가 이 시간(초) 이상 갱신되지 않은 실행 중 작업을 다시 대기열에 넣습니다 "
+                "(워커는 이 시간의 1/3마다 하트비트를 갱신, 기본값: 60)"
+            ),
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="대기 중인 작업을 모두 처리한 뒤 종료합니다.",
+        )
+
+    def handle(self, *args, **options):
+        concurrency = options["concurrency"]
+        poll_interval = options["poll_interval"]
+        stop = threading.Event()
+
+        def request_stop(signum, frame):
+            # 새 작업 선점을 멈추고 실행 중인 작업이 끝나기를 기다림
+            self.stdout.write("종료 신호를 받았습니다. 실행 중인 작업을 마무리합니다...")
+            stop.set()
+
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
+
+        lease = timedelta(seconds=options["stale_after"])
+        heartbeat_interval = lease.total_seconds() / 3
+        if heartbeat_interval <= 0:
+            raise CommandError("--stale-after는 1 이상이어야 합니다.")
+
+        self.stdout.write(f"분석 워커를 시작합니다 (동시 처리: {concurrency})")
+        in_flight = {}  # future -> 작업 ID
+        processed = 0
+        next_heartbeat = 0.0
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # 종료 신호 후에도 실행 중인 작업이 끝날 때까지 하트비트를 계속 갱신
+            while not stop.is_set() or in_flight:
+                in_flight = {
+                    future: job_id
+                    for future, job_id in in_flight.items()
+                    if not future.done()
+                }
+
+                # 실행 중인 작업의 임대(lease)를 연장하고, 임대가 끊긴 다른 워커의 작업을 회수
+                if time.monotonic() >= next_heartbeat:
+                    EvaluationJob.heartbeat(list(in_flight.values()))
+                    requeued = EvaluationJob.requeue_stale(lease)
+                    if requeued:
+                        self.stdout.write(f"멈춘 작업 {requeued}개를 다시 대기열에 넣었습니다.")
+                    next_heartbeat = time.monotonic() + heartbeat_interval
+
+                if stop.is_set():
+                    wait_futures(in_flight, timeout=poll_interval)
+                    continue
+
+                # 동시 처리 한도 내에서만 작업을 선점
+                claimed = False
+                while len(in_flight) < concurrency:
+                    job = EvaluationJob.claim_next()
+                    if job is None:
+                        break
+                    in_flight[executor.submit(run_job, job)] = job.pk
+                    processed += 1
+                    claimed = True
+
+                if options["once"] and not claimed and not in_flight:
+                    break
+                if not claimed:
+                    stop.wait(poll_interval)
+
+        self.stdout.write(self.style.SUCCESS(f"워커를 종료합니다 (처리한 작업: {processed}개)"))
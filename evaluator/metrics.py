@@ -0,0 +1,327 @@
+"""Per-stage latency spans and Prometheus-style metrics for the evaluation hot path.
+
+요청 처리 단계(요청 한도 확인, 파일 파싱, 프롬프트 로드, 클라이언트 생성, 첫 토큰까지 시간,
+전체 생성 시간, 템플릿 렌더링 등)마다 시간을 재어 히스토그램에 기록하고, ``/metrics``에서
+Prometheus 텍스트 형식으로 내보냅니다. 토큰 사용량, 캐시 적중, provider 오류 카운터는
+llm_client와 캐시 모듈이 이미 모으는 프로세스 단위 집계를 수집 시점에 읽습니다.
+
+집계는 프로세스 단위이므로 gunicorn 워커가 여럿이면 워커마다 따로 집계됩니다.
+"""
+
+import contextvars
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.decorators import sync_and_async_middleware
+
+# 단계별 소요 시간 버킷(초): 수 ms 단위의 로컬 단계부터 수 분 걸리는 LLM 생성까지
+STAGE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5)
+STAGE_BUCKETS += (1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def get_config() -> dict:
+    """settings.METRICS 값을 기본값과 합쳐 반환합니다."""
+    config = {"ENABLED": True, "SERVER_TIMING": False, "TOKEN": ""}
+    config.update(getattr(settings, "METRICS", {}))
+    return config
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """단조 증가 카운터 (레이블 조합별)."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{_labels(self.labelnames, key)} {_number(value)}"
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (레이블 조합별)."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple = STAGE_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # 레이블 조합 → [버킷별 개수 (+Inf 포함), 합계]
+        self._values = {}
+
+    def observe(self, value: float, **labels):
+        key = tuple(labels.get(name, "") for name in self.labelnames)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def samples(self):
+        with self._lock:
+            values = {key: (list(counts), total) for key, (counts, total) in self._values.items()}
+        for key, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _labels(self.labelnames, key, f'le="{_number(bound)}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_number(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """메트릭과 수집 함수를 모아 Prometheus 텍스트 형식으로 출력합니다."""
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: tuple = (), buckets=STAGE_BUCKETS
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def collector(self, func):
+        """수집 시점에 새 Counter 목록을 만들어 반환하는 함수를 등록합니다 (데코레이터)."""
+        self._collectors.append(func)
+        return func
+
+    def render(self) -> str:
+        metrics = list(self._metrics)
+        for collect in self._collectors:
+            metrics.extend(collect())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+REQUEST_SECONDS = registry.histogram(
+    "fitup_request_duration_seconds",
+    "요청 처리 시간 (스트리밍은 응답 헤더까지)",
+    ("view", "method", "status"),
+)
+STAGE_SECONDS = registry.histogram(
+    "fitup_stage_duration_seconds",
+    "분석 요청의 단계별 소요 시간",
+    ("view", "stage"),
+)
+
+
+@registry.collector
+def collect_llm_metrics() -> list:
+    """llm_client의 프로세스 단위 토큰 사용량과 provider 오류 집계."""
+    from llm_client import error_tracker, usage_tracker
+
+    calls = Counter("fitup_llm_calls_total", "성공한 LLM API 호출 수", ("provider",))
+    tokens = Counter("fitup_llm_tokens_total", "LLM 토큰 사용량", ("provider", "type"))
+    for provider, totals in usage_tracker.snapshot().items():
+        calls.inc(totals["calls"], provider=provider)
+        for name in usage_tracker.FIELDS:
+            tokens.inc(totals[name], provider=provider, type=name.removesuffix("_tokens"))
+
+    errors = Counter(
+        "fitup_llm_errors_total", "실패한 LLM API 호출 수 (재시도 포함)", ("provider", "error")
+    )
+    for (provider, kind), count in error_tracker.snapshot().items():
+        errors.inc(count, provider=provider, error=kind)
+    return [calls, tokens, errors]
+
+
+@registry.collector
+def collect_cache_metrics() -> list:
+    """분석 결과 캐시와 파싱 결과 캐시의 적중/미스 횟수."""
+    from . import document_cache, result_cache
+
+    lookups = Counter("fitup_cache_lookups_total", "캐시 조회 수", ("cache", "outcome"))
+    for cache, stats in (
+        ("result", result_cache.get_stats()),
+        ("document", document_cache.get_stats()),
+    ):
+        lookups.inc(stats["hits"], cache=cache, outcome="hit")
+        lookups.inc(stats["misses"], cache=cache, outcome="miss")
+    return [lookups]
+
+
+class RequestTimings:
+    """요청 하나의 단계별 소요 시간 (히스토그램과 Server-Timing 헤더에 사용)."""
+
+    def __init__(self, request=None):
+        self.request = request
+        self.started = time.perf_counter()
+        self.stages = []
+
+    @property
+    def view(self) -> str:
+        match = getattr(self.request, "resolver_match", None)
+        return match.view_name if match is not None else "-"
+
+    def observe(self, stage: str, seconds: float):
+        self.stages.append((stage, seconds))
+        if get_config()["ENABLED"]:
+            STAGE_SECONDS.observe(seconds, view=self.view, stage=stage)
+
+    @contextmanager
+    def span(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def as_dict(self) -> dict:
+        """{단계: 밀리초} (같은 단계가 여러 번이면 합산)."""
+        totals = {}
+        for stage, seconds in self.stages:
+            totals[stage] = totals.get(stage, 0.0) + seconds * 1000
+        return {stage: round(ms, 1) for stage, ms in totals.items()}
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (밀리초)."""
+        totals = self.as_dict()
+        totals["total"] = (time.perf_counter() - self.started) * 1000
+        return ", ".join(f"{stage};dur={ms:.1f}" for stage, ms in totals.items())
+
+
+_current_timings = contextvars.ContextVar("request_timings", default=None)
+
+
+def current_timings() -> RequestTimings:
+    """현재 요청의 RequestTimings (미들웨어 밖에서는 히스토그램에만 기록하는 새 객체)."""
+    timings = _current_timings.get()
+    return timings if timings is not None else RequestTimings()
+
+
+def span(stage: str):
+    """현재 요청의 단계 시간을 잽니다.
+
+    Example:
+        with span("parse"):
+            resume_text = await aparse_file_cached(resume_file)
+    """
+    return current_timings().span(stage)
+
+
+def timed_stream(tokens, timings: RequestTimings):
+    """스트리밍 토큰을 그대로 넘기면서 첫 토큰까지(ttft)와 전체 생성(generate) 시간을 기록합니다."""
+    started = time.perf_counter()
+    first = True
+    for token in tokens:
+        if first:
+            timings.observe("ttft", time.perf_counter() - started)
+            first = False
+        yield token
+    timings.observe("generate", time.perf_counter() - started)
+
+
+async def atimed_stream(tokens, timings: RequestTimings):
+    """timed_stream()의 비동기 버전."""
+    started = time.perf_counter()
+    first = True
+    async for token in tokens:
+        if first:
+            timings.observe("ttft", time.perf_counter() - started)
+            first = False
+        yield token
+    timings.observe("generate", time.perf_counter() - started)
+
+
+@sync_and_async_middleware
+def metrics_middleware(get_response):
+    """요청 처리 시간을 기록하고, 설정 시 Server-Timing 헤더를 붙입니다."""
+    config = get_config()
+    if not config["ENABLED"]:
+        raise MiddlewareNotUsed
+
+    def finish(request, response, timings: RequestTimings):
+        REQUEST_SECONDS.observe(
+            time.perf_counter() - timings.started,
+            view=timings.view,
+            method=request.method,
+            status=str(response.status_code),
+        )
+        if config["SERVER_TIMING"]:
+            response["Server-Timing"] = timings.server_timing()
+        return response
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            timings = RequestTimings(request)
+            token = _current_timings.set(timings)
+            try:
+                response = await get_response(request)
+            finally:
+                _current_timings.reset(token)
+            return finish(request, response, timings)
+
+    else:
+
+        def middleware(request):
+            timings = RequestTimings(request)
+            token = _current_timings.set(timings)
+            try:
+                response = get_response(request)
+            finally:
+                _current_timings.reset(token)
+            return finish(request, response, timings)
+
+    return middleware
@@ -0,0 +1,17 @@
+"""Response compression that leaves Server-Sent Events untouched."""
+
+from django.middleware.gzip import GZipMiddleware
+
+
+class StreamSafeGZipMiddleware(GZipMiddleware):
+    """HTML/JSON 응답은 gzip으로 압축하되 SSE 스트림은 압축하지 않습니다.
+
+    Django의 스트리밍 gzip은 토큰마다 flush하지 않아 압축하면 토큰이 버퍼에 쌓였다가
+    한꺼번에 전달되므로, ``text/event-stream`` 응답은 그대로 내보냅니다.
+    정적 파일은 WhiteNoise가 미리 압축해 둔 .gz/.br 파일을 제공합니다.
+    """
+
+    def process_response(self, request, response):
+        if response.get("Content-Type", "").startswith("text/event-stream"):
+            return response
+        return super().process_response(request, response)
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:04
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluator", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EvaluationJob",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("ip_address", models.GenericIPAddressField(verbose_name="IP 주소")),
+                ("provider", models.CharField(max_length=20, verbose_name="AI 모델")),
+                ("user_message", models.TextField(verbose_name="요청 메시지")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기"),
+                            ("running", "실행 중"),
+                            ("succeeded", "완료"),
+                            ("failed", "실패"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="상태",
+                    ),
+                ),
+                ("result", models.TextField(blank=True, verbose_name="분석 결과")),
+                ("error", models.TextField(blank=True, verbose_name="오류 메시지")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성 시간"),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="시작 시간"
+                    ),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="종료 시간"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "분석 작업",
+                "verbose_name_plural": "분석 작업",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "created_at"],
+                        name="evaluator_e_status_825ac6_idx",
+                    )
+                ],
+            },
+        ),
+    ]
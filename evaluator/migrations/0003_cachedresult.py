@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:06
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluator", "0002_evaluationjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CachedResult",
+            fields=[
+                (
+                    "key",
+                    models.CharField(
+                        max_length=64,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="캐시 키",
+                    ),
+                ),
+                ("provider", models.CharField(max_length=20, verbose_name="AI 모델")),
+                ("model", models.CharField(max_length=100, verbose_name="모델명")),
+                ("result", models.TextField(verbose_name="분석 결과")),
+                (
+                    "hit_count",
+                    models.PositiveIntegerField(default=0, verbose_name="적중 횟수"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성 시간"),
+                ),
+                (
+                    "last_accessed_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="마지막 사용 시간",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "분석 결과 캐시",
+                "verbose_name_plural": "분석 결과 캐시",
+            },
+        ),
+        migrations.AddField(
+            model_name="evaluationjob",
+            name="cache_key",
+            field=models.CharField(
+                blank=True, max_length=64, verbose_name="결과 캐시 키"
+            ),
+        ),
+    ]
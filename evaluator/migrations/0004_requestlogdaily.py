@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluator", "0003_cachedresult"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RequestLogDaily",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("ip_address", models.GenericIPAddressField(verbose_name="IP 주소")),
+                ("date", models.DateField(verbose_name="날짜")),
+                (
+                    "count",
+                    models.PositiveIntegerField(default=0, verbose_name="요청 횟수"),
+                ),
+            ],
+            options={
+                "verbose_name": "일별 요청 집계",
+                "verbose_name_plural": "일별 요청 집계",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("ip_address", "date"),
+                        name="unique_requestlogdaily_ip_date",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:19
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluator", "0004_requestlogdaily"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ParsedDocument",
+            fields=[
+                (
+                    "key",
+                    models.CharField(
+                        max_length=64,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="내용 해시",
+                    ),
+                ),
+                ("kind", models.CharField(max_length=20, verbose_name="파일 종류")),
+                (
+                    "parser_version",
+                    models.CharField(max_length=20, verbose_name="파서 버전"),
+                ),
+                ("text", models.TextField(verbose_name="추출 텍스트")),
+                (
+                    "page_count",
+                    models.PositiveIntegerField(default=1, verbose_name="페이지 수"),
+                ),
+                (
+                    "file_size",
+                    models.PositiveBigIntegerField(default=0, verbose_name="파일 크기"),
+                ),
+                (
+                    "hit_count",
+                    models.PositiveIntegerField(default=0, verbose_name="적중 횟수"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성 시간"),
+                ),
+                (
+                    "last_accessed_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="마지막 사용 시간",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "파싱 결과 캐시",
+                "verbose_name_plural": "파싱 결과 캐시",
+            },
+        ),
+    ]
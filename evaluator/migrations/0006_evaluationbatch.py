@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:24
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluator", "0005_parseddocument"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EvaluationBatch",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("provider", models.CharField(max_length=20, verbose_name="AI 모델")),
+                ("jd", models.TextField(verbose_name="채용공고")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성 시간"),
+                ),
+            ],
+            options={
+                "verbose_name": "배치 분석",
+                "verbose_name_plural": "배치 분석",
+            },
+        ),
+        migrations.AddField(
+            model_name="evaluationjob",
+            name="name",
+            field=models.CharField(
+                blank=True, max_length=255, verbose_name="이력서 파일명"
+            ),
+        ),
+        migrations.AddField(
+            model_name="evaluationjob",
+            name="score",
+            field=models.PositiveSmallIntegerField(
+                blank=True, null=True, verbose_name="총점"
+            ),
+        ),
+        migrations.AddField(
+            model_name="evaluationjob",
+            name="batch",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="jobs",
+                to="evaluator.evaluationbatch",
+                verbose_name="배치",
+            ),
+        ),
+    ]
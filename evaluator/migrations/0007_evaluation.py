@@ -0,0 +1,112 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:55
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluator", "0006_evaluationbatch"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Evaluation",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "cache_key",
+                    models.CharField(
+                        db_index=True, max_length=64, verbose_name="입력 해시"
+                    ),
+                ),
+                (
+                    "prompt_version",
+                    models.CharField(max_length=64, verbose_name="프롬프트 버전"),
+                ),
+                (
+                    "jd_hash",
+                    models.CharField(max_length=64, verbose_name="채용공고 해시"),
+                ),
+                (
+                    "resume_hash",
+                    models.CharField(max_length=64, verbose_name="이력서 해시"),
+                ),
+                (
+                    "career_hash",
+                    models.CharField(
+                        blank=True, max_length=64, verbose_name="경력기술서 해시"
+                    ),
+                ),
+                ("provider", models.CharField(max_length=20, verbose_name="AI 모델")),
+                ("model", models.CharField(max_length=100, verbose_name="모델명")),
+                ("result", models.TextField(verbose_name="분석 결과")),
+                (
+                    "evaluation",
+                    models.JSONField(blank=True, null=True, verbose_name="구조화 결과"),
+                ),
+                (
+                    "score",
+                    models.PositiveSmallIntegerField(
+                        blank=True, null=True, verbose_name="총점"
+                    ),
+                ),
+                (
+                    "cached",
+                    models.BooleanField(default=False, verbose_name="캐시 결과"),
+                ),
+                (
+                    "keyword_note",
+                    models.TextField(blank=True, verbose_name="키워드 매칭 요약"),
+                ),
+                (
+                    "compaction_note",
+                    models.TextField(blank=True, verbose_name="입력 압축 요약"),
+                ),
+                (
+                    "input_tokens",
+                    models.PositiveIntegerField(default=0, verbose_name="입력 토큰"),
+                ),
+                (
+                    "output_tokens",
+                    models.PositiveIntegerField(default=0, verbose_name="출력 토큰"),
+                ),
+                (
+                    "cached_input_tokens",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="캐시 입력 토큰"
+                    ),
+                ),
+                (
+                    "timings",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="단계별 소요 시간(ms)"
+                    ),
+                ),
+                ("html", models.TextField(blank=True, verbose_name="렌더링 결과")),
+                (
+                    "html_version",
+                    models.CharField(
+                        blank=True, max_length=16, verbose_name="렌더링 버전"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성 시간"),
+                ),
+            ],
+            options={
+                "verbose_name": "분석 결과",
+                "verbose_name_plural": "분석 결과",
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluator", "0007_evaluation"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RateLimitCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("ip_address", models.GenericIPAddressField(verbose_name="IP 주소")),
+                ("date", models.DateField(verbose_name="날짜")),
+                (
+                    "count",
+                    models.PositiveIntegerField(default=0, verbose_name="사용 횟수"),
+                ),
+            ],
+            options={
+                "verbose_name": "요청 한도 카운터",
+                "verbose_name_plural": "요청 한도 카운터",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("ip_address", "date"),
+                        name="unique_ratelimitcounter_ip_date",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluator", "0008_ratelimitcounter"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="evaluationjob",
+            name="stage",
+            field=models.CharField(
+                choices=[("full", "상세 분석"), ("triage", "빠른 평가")],
+                default="full",
+                max_length=10,
+                verbose_name="분석 단계",
+            ),
+        ),
+    ]
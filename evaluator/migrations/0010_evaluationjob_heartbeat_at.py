@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:43
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_heartbeat(apps, schema_editor):
+    # 이전 버전 워커가 실행 중이던 작업은 시작 시간을 마지막 하트비트로 간주
+    EvaluationJob = apps.get_model("evaluator", "EvaluationJob")
+    EvaluationJob.objects.filter(status="running").update(heartbeat_at=F("started_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluator", "0009_evaluationjob_stage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="evaluationjob",
+            name="heartbeat_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="하트비트 시간"
+            ),
+        ),
+        migrations.RunPython(backfill_heartbeat, migrations.RunPython.noop),
+    ]
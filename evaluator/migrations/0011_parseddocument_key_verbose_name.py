@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:44
+
+from django.db import migrations, models
+
+
+def clear_parsed_documents(apps, schema_editor):
+    # 키 형식이 바뀌어 이전 항목은 다시 조회되지 않으므로 비움 (캐시라 다시 채워짐)
+    apps.get_model("evaluator", "ParsedDocument").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluator", "0010_evaluationjob_heartbeat_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="parseddocument",
+            name="key",
+            field=models.CharField(
+                max_length=64, primary_key=True, serialize=False, verbose_name="캐시 키"
+            ),
+        ),
+        migrations.RunPython(clear_parsed_documents, migrations.RunPython.noop),
+    ]
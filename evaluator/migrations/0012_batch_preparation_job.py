@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("evaluator", "0011_parseddocument_key_verbose_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="evaluationbatch",
+            name="archive",
+            field=models.BinaryField(
+                blank=True, default=b"", verbose_name="이력서 묶음 (zip)"
+            ),
+        ),
+        migrations.AddField(
+            model_name="evaluationbatch",
+            name="use_cache",
+            field=models.BooleanField(default=True, verbose_name="결과 캐시 사용"),
+        ),
+        migrations.AddField(
+            model_name="evaluationjob",
+            name="kind",
+            field=models.CharField(
+                choices=[("evaluate", "분석"), ("prepare_batch", "배치 준비")],
+                default="evaluate",
+                max_length=20,
+                verbose_name="작업 종류",
+            ),
+        ),
+    ]
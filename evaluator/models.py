@@ -1,4 +1,9 @@
-from django.db import models
+import uuid
+from datetime import timedelta
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 
 
@@ -18,26 +23,543 @@ class RequestLog(models.Model):
     def __str__(self):
         return f"{self.ip_address} - {self.requested_at}"
 
+    @staticmethod
+    def today_start():
+        """오늘 자정(TIME_ZONE 기준)의 시각을 반환합니다."""
+        return timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+
     @classmethod
     def get_today_count(cls, ip_address: str) -> int:
         """오늘 해당 IP의 요청 횟수를 반환합니다."""
-        today = timezone.now().date()
+        # __date 조회 대신 범위 조건을 사용해 (ip_address, requested_at) 인덱스를 활용
         return cls.objects.filter(
             ip_address=ip_address,
-            requested_at__date=today
+            requested_at__gte=cls.today_start()
         ).count()
 
+    @classmethod
+    async def aget_today_count(cls, ip_address: str) -> int:
+        """오늘 해당 IP의 요청 횟수를 반환합니다 (비동기)."""
+        return await cls.objects.filter(
+            ip_address=ip_address,
+            requested_at__gte=cls.today_start()
+        ).acount()
+
     @classmethod
     def can_make_request(cls, ip_address: str, daily_limit: int = 3) -> bool:
         """해당 IP가 요청 가능한지 확인합니다."""
         return cls.get_today_count(ip_address) < daily_limit
 
+    @classmethod
+    async def acan_make_request(cls, ip_address: str, daily_limit: int = 3) -> bool:
+        """해당 IP가 요청 가능한지 확인합니다 (비동기)."""
+        return await cls.aget_today_count(ip_address) < daily_limit
+
     @classmethod
     def log_request(cls, ip_address: str) -> "RequestLog":
         """요청을 기록합니다."""
         return cls.objects.create(ip_address=ip_address)
 
+    @classmethod
+    async def alog_request(cls, ip_address: str) -> "RequestLog":
+        """요청을 기록합니다 (비동기)."""
+        return await cls.objects.acreate(ip_address=ip_address)
+
     @classmethod
     def get_remaining_requests(cls, ip_address: str, daily_limit: int = 3) -> int:
         """남은 요청 횟수를 반환합니다."""
         return max(0, daily_limit - cls.get_today_count(ip_address))
+
+    @classmethod
+    async def aget_remaining_requests(cls, ip_address: str, daily_limit: int = 3) -> int:
+        """남은 요청 횟수를 반환합니다 (비동기)."""
+        return max(0, daily_limit - await cls.aget_today_count(ip_address))
+
+    @classmethod
+    def archive_batch(cls, before, batch_size: int = 1000) -> int:
+        """before 이전 기록을 최대 batch_size건 일별 집계로 옮기고 원본을 삭제합니다.
+
+        집계와 삭제를 한 트랜잭션에서 처리하므로 중간에 중단되어도 중복 집계되지 않습니다.
+
+        Returns:
+            int: 삭제한 원본 기록 수 (0이면 더 옮길 기록이 없음)
+        """
+        with transaction.atomic():
+            ids = list(
+                cls.objects.filter(requested_at__lt=before)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return 0
+
+            # TruncDate는 현재 타임존(TIME_ZONE) 기준 날짜로 집계
+            daily_counts = (
+                cls.objects.filter(id__in=ids)
+                .annotate(date=TruncDate("requested_at"))
+                .values("ip_address", "date")
+                .annotate(count=Count("id"))
+            )
+            for row in daily_counts:
+                updated = RequestLogDaily.objects.filter(
+                    ip_address=row["ip_address"], date=row["date"]
+                ).update(count=F("count") + row["count"])
+                if not updated:
+                    RequestLogDaily.objects.create(
+                        ip_address=row["ip_address"],
+                        date=row["date"],
+                        count=row["count"],
+                    )
+
+            deleted, _ = cls.objects.filter(id__in=ids).delete()
+            return deleted
+
+
+class RequestLogDaily(models.Model):
+    """보존 기간이 지난 RequestLog를 IP·날짜별로 집계한 모델."""
+
+    ip_address = models.GenericIPAddressField(verbose_name="IP 주소")
+    date = models.DateField(verbose_name="날짜")
+    count = models.PositiveIntegerField(default=0, verbose_name="요청 횟수")
+
+    class Meta:
+        verbose_name = "일별 요청 집계"
+        verbose_name_plural = "일별 요청 집계"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["ip_address", "date"], name="unique_requestlogdaily_ip_date"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.ip_address} - {self.date} ({self.count})"
+
+
+class RateLimitCounter(models.Model):
+    """IP·날짜별 요청 한도 카운터 (예약 포함).
+
+    모든 웹/분석 워커 프로세스가 같은 행을 조건부 UPDATE로 증감하므로
+    프로세스 수와 관계없이 한도가 공유됩니다.
+    """
+
+    ip_address = models.GenericIPAddressField(verbose_name="IP 주소")
+    date = models.DateField(verbose_name="날짜")
+    count = models.PositiveIntegerField(default=0, verbose_name="사용 횟수")
+
+    class Meta:
+        verbose_name = "요청 한도 카운터"
+        verbose_name_plural = "요청 한도 카운터"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["ip_address", "date"], name="unique_ratelimitcounter_ip_date"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.ip_address} - {self.date} ({self.count})"
+
+    @classmethod
+    def get_count(cls, ip_address: str, date) -> int | None:
+        """카운터 값을 반환합니다 (아직 없으면 None)."""
+        return (
+            cls.objects.filter(ip_address=ip_address, date=date)
+            .values_list("count", flat=True)
+            .first()
+        )
+
+    @classmethod
+    def ensure(cls, ip_address: str, date, initial: int):
+        """카운터가 없으면 initial 값으로 만듭니다 (동시에 만들어도 하나만 남음)."""
+        if cls.get_count(ip_address, date) is None:
+            try:
+                with transaction.atomic():
+                    cls.objects.create(ip_address=ip_address, date=date, count=initial)
+            except IntegrityError:
+                pass
+
+    @classmethod
+    def increment_below(cls, ip_address: str, date, limit: int) -> bool:
+        """카운터가 limit 미만일 때만 1 증가시키고 성공 여부를 반환합니다."""
+        return bool(
+            cls.objects.filter(ip_address=ip_address, date=date, count__lt=limit).update(
+                count=F("count") + 1
+            )
+        )
+
+    @classmethod
+    def decrement(cls, ip_address: str, date):
+        """카운터를 1 줄입니다 (0 미만으로는 내려가지 않음)."""
+        cls.objects.filter(ip_address=ip_address, date=date, count__gt=0).update(
+            count=F("count") - 1
+        )
+
+    @classmethod
+    def prune(cls, before) -> int:
+        """before 이전 날짜의 카운터를 삭제합니다."""
+        deleted, _ = cls.objects.filter(date__lt=before).delete()
+        return deleted
+
+
+class EvaluationBatch(models.Model):
+    """하나의 JD에 대해 여러 이력서를 분석하는 배치.
+
+    업로드한 zip은 그대로 저장되고, 워커가 준비 작업(EvaluationJob.Kind.PREPARE_BATCH)에서
+    이력서를 파싱해 이력서별 분석 작업을 등록합니다.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    provider = models.CharField(max_length=20, verbose_name="AI 모델")
+    jd = models.TextField(verbose_name="채용공고")
+    # 준비 작업이 끝나면 비움
+    archive = models.BinaryField(blank=True, default=b"", verbose_name="이력서 묶음 (zip)")
+    use_cache = models.BooleanField(default=True, verbose_name="결과 캐시 사용")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성 시간")
+
+    class Meta:
+        verbose_name = "배치 분석"
+        verbose_name_plural = "배치 분석"
+
+    def __str__(self):
+        return f"{self.id} ({self.provider})"
+
+
+class EvaluationJob(models.Model):
+    """백그라운드 워커가 처리하는 분석 작업 모델.
+
+    DB 테이블 자체를 작업 큐로 사용하므로 외부 브로커가 필요하지 않습니다.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "대기"
+        RUNNING = "running", "실행 중"
+        SUCCEEDED = "succeeded", "완료"
+        FAILED = "failed", "실패"
+
+    class Stage(models.TextChoices):
+        FULL = "full", "상세 분석"
+        TRIAGE = "triage", "빠른 평가"
+
+    class Kind(models.TextChoices):
+        EVALUATE = "evaluate", "분석"
+        PREPARE_BATCH = "prepare_batch", "배치 준비"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(
+        max_length=20,
+        choices=Kind.choices,
+        default=Kind.EVALUATE,
+        verbose_name="작업 종류",
+    )
+    ip_address = models.GenericIPAddressField(verbose_name="IP 주소")
+    provider = models.CharField(max_length=20, verbose_name="AI 모델")
+    user_message = models.TextField(verbose_name="요청 메시지")
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name="상태",
+    )
+    cache_key = models.CharField(max_length=64, blank=True, verbose_name="결과 캐시 키")
+    batch = models.ForeignKey(
+        EvaluationBatch,
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="jobs",
+        verbose_name="배치",
+    )
+    name = models.CharField(max_length=255, blank=True, verbose_name="이력서 파일명")
+    result = models.TextField(blank=True, verbose_name="분석 결과")
+    score = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name="총점")
+    # 결과를 낸 단계 (빠른 평가 점수가 기준 미만이면 상세 분석 없이 "triage"로 끝남)
+    stage = models.CharField(
+        max_length=10,
+        choices=Stage.choices,
+        default=Stage.FULL,
+        verbose_name="분석 단계",
+    )
+    error = models.TextField(blank=True, verbose_name="오류 메시지")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성 시간")
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="시작 시간")
+    # 실행 중인 워커가 주기적으로 갱신 (갱신이 끊긴 작업만 다른 워커가 다시 가져감)
+    heartbeat_at = models.DateTimeField(null=True, blank=True, verbose_name="하트비트 시간")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="종료 시간")
+
+    class Meta:
+        verbose_name = "분석 작업"
+        verbose_name_plural = "분석 작업"
+        indexes = [
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.id} ({self.status})"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.Status.SUCCEEDED, self.Status.FAILED)
+
+    @classmethod
+    async def aenqueue(
+        cls, ip_address: str, provider: str, user_message: str, cache_key: str = ""
+    ) -> "EvaluationJob":
+        """작업을 큐에 추가합니다 (비동기)."""
+        return await cls.objects.acreate(
+            ip_address=ip_address,
+            provider=provider,
+            user_message=user_message,
+            cache_key=cache_key,
+        )
+
+    @classmethod
+    async def acreate_finished(
+        cls, ip_address: str, provider: str, user_message: str, result: str
+    ) -> "EvaluationJob":
+        """이미 결과가 있는 작업(캐시 적중)을 완료 상태로 생성합니다 (비동기)."""
+        now = timezone.now()
+        return await cls.objects.acreate(
+            ip_address=ip_address,
+            provider=provider,
+            user_message=user_message,
+            status=cls.Status.SUCCEEDED,
+            result=result,
+            started_at=now,
+            finished_at=now,
+        )
+
+    @classmethod
+    async def aenqueue_batch(
+        cls, ip_address: str, provider: str, jd: str, archive: bytes, use_cache: bool
+    ) -> EvaluationBatch:
+        """업로드한 zip을 저장하고 워커가 이력서를 준비하도록 준비 작업을 등록합니다 (비동기)."""
+        batch = await EvaluationBatch.objects.acreate(
+            provider=provider, jd=jd, archive=archive, use_cache=use_cache
+        )
+        await cls.objects.acreate(
+            kind=cls.Kind.PREPARE_BATCH,
+            batch=batch,
+            ip_address=ip_address,
+            provider=provider,
+            user_message="",
+        )
+        return batch
+
+    @classmethod
+    def create_batch_jobs(cls, batch: EvaluationBatch, ip_address: str, items) -> list:
+        """배치의 이력서별 작업을 한 번에 등록합니다.
+
+        캐시 적중이나 파싱 실패로 이미 결과가 정해진 항목은 완료/실패 상태로 바로 저장합니다.
+
+        Args:
+            items: evaluator.batch.BatchItem 목록
+        """
+        now = timezone.now()
+        jobs = []
+        for item in items:
+            job = cls(
+                batch=batch,
+                ip_address=ip_address,
+                provider=batch.provider,
+                name=item.name,
+                user_message=item.user_message,
+                cache_key=item.cache_key,
+            )
+            if item.error:
+                job.status = cls.Status.FAILED
+                job.error = item.error
+                job.started_at = job.finished_at = now
+            elif item.cached_result is not None:
+                job.status = cls.Status.SUCCEEDED
+                job.result = item.cached_result
+                job.score = item.score
+                job.started_at = job.finished_at = now
+            jobs.append(job)
+        return cls.objects.bulk_create(jobs)
+
+    @classmethod
+    def claim_next(cls) -> "EvaluationJob | None":
+        """가장 오래된 대기 작업을 실행 중으로 전환하고 반환합니다.
+
+        상태 조건부 UPDATE로 선점하므로 여러 워커가 동시에 실행되어도
+        같은 작업을 두 번 처리하지 않습니다.
+        """
+        while True:
+            # 화면에서 기다리는 단건 작업을 배치 작업보다 먼저 처리
+            job = (
+                cls.objects.filter(status=cls.Status.PENDING)
+                .order_by(F("batch").asc(nulls_first=True), "created_at")
+                .first()
+            )
+            if job is None:
+                return None
+
+            now = timezone.now()
+            claimed = cls.objects.filter(
+                pk=job.pk, status=cls.Status.PENDING
+            ).update(status=cls.Status.RUNNING, started_at=now, heartbeat_at=now)
+            if claimed:
+                job.status = cls.Status.RUNNING
+                job.started_at = job.heartbeat_at = now
+                return job
+
+    @classmethod
+    def heartbeat(cls, job_ids) -> int:
+        """실행 중인 작업의 하트비트를 갱신해 다른 워커가 가져가지 않도록 합니다."""
+        if not job_ids:
+            return 0
+        return cls.objects.filter(pk__in=job_ids, status=cls.Status.RUNNING).update(
+            heartbeat_at=timezone.now()
+        )
+
+    @classmethod
+    def requeue_stale(cls, lease: timedelta) -> int:
+        """하트비트가 lease 이상 끊긴 실행 중 작업을 다시 대기 상태로 되돌립니다.
+
+        실행 중인 워커는 lease보다 짧은 주기로 하트비트를 갱신하므로, 오래 걸리는 작업이라도
+        워커가 살아 있으면 되돌리지 않고 비정상 종료한 워커의 작업만 되돌립니다.
+        """
+        return cls.objects.filter(
+            status=cls.Status.RUNNING,
+            heartbeat_at__lt=timezone.now() - lease,
+        ).update(status=cls.Status.PENDING, started_at=None, heartbeat_at=None)
+
+    def mark_succeeded(self, result: str, score: int = None, stage: str = Stage.FULL):
+        """작업을 완료 상태로 기록합니다."""
+        self.status = self.Status.SUCCEEDED
+        self.result = result
+        self.score = score
+        self.stage = stage
+        self.finished_at = timezone.now()
+        self.save(update_fields=["status", "result", "score", "stage", "finished_at"])
+
+    def mark_failed(self, error: str):
+        """작업을 실패 상태로 기록합니다."""
+        self.status = self.Status.FAILED
+        self.error = error
+        self.finished_at = timezone.now()
+        self.save(update_fields=["status", "error", "finished_at"])
+
+
+class CachedResult(models.Model):
+    """동일한 입력에 대한 LLM 분석 결과 캐시.
+
+    키는 (provider, model, 프롬프트 버전, JD, 이력서, 경력기술서)의 해시입니다.
+    """
+
+    key = models.CharField(max_length=64, primary_key=True, verbose_name="캐시 키")
+    provider = models.CharField(max_length=20, verbose_name="AI 모델")
+    model = models.CharField(max_length=100, verbose_name="모델명")
+    result = models.TextField(verbose_name="분석 결과")
+    hit_count = models.PositiveIntegerField(default=0, verbose_name="적중 횟수")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성 시간")
+    last_accessed_at = models.DateTimeField(
+        default=timezone.now, db_index=True, verbose_name="마지막 사용 시간"
+    )
+
+    class Meta:
+        verbose_name = "분석 결과 캐시"
+        verbose_name_plural = "분석 결과 캐시"
+
+    def __str__(self):
+        return f"{self.provider}/{self.model} - {self.key[:12]}"
+
+
+class ParsedDocument(models.Model):
+    """업로드 파일에서 추출한 텍스트 캐시.
+
+    키는 파일 내용의 BLAKE2b 해시에 파일 종류와 PDF 제한값을 더한 해시이며
+    (document_cache.cache_key), 같은 파일을 다시 올리면 PDF 파싱을 생략합니다.
+    """
+
+    key = models.CharField(max_length=64, primary_key=True, verbose_name="캐시 키")
+    kind = models.CharField(max_length=20, verbose_name="파일 종류")
+    parser_version = models.CharField(max_length=20, verbose_name="파서 버전")
+    text = models.TextField(verbose_name="추출 텍스트")
+    page_count = models.PositiveIntegerField(default=1, verbose_name="페이지 수")
+    file_size = models.PositiveBigIntegerField(default=0, verbose_name="파일 크기")
+    hit_count = models.PositiveIntegerField(default=0, verbose_name="적중 횟수")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성 시간")
+    last_accessed_at = models.DateTimeField(
+        default=timezone.now, db_index=True, verbose_name="마지막 사용 시간"
+    )
+
+    class Meta:
+        verbose_name = "파싱 결과 캐시"
+        verbose_name_plural = "파싱 결과 캐시"
+
+    def __str__(self):
+        return f"{self.kind} ({self.page_count}p) - {self.key[:12]}"
+
+
+class Evaluation(models.Model):
+    """고유 주소(permalink)로 다시 볼 수 있도록 저장한 분석 결과.
+
+    입력 원문은 저장하지 않고 정규화한 텍스트의 해시만 보관합니다. 같은 주소를 다시 열거나
+    공유하면 LLM을 다시 호출하지 않고 기본 키 조회 한 번으로 결과를 보여줍니다.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # CachedResult와 같은 입력 조합 해시 (provider, model, 프롬프트 버전, JD, 이력서, 경력기술서)
+    cache_key = models.CharField(max_length=64, db_index=True, verbose_name="입력 해시")
+    prompt_version = models.CharField(max_length=64, verbose_name="프롬프트 버전")
+    jd_hash = models.CharField(max_length=64, verbose_name="채용공고 해시")
+    resume_hash = models.CharField(max_length=64, verbose_name="이력서 해시")
+    career_hash = models.CharField(max_length=64, blank=True, verbose_name="경력기술서 해시")
+    provider = models.CharField(max_length=20, verbose_name="AI 모델")
+    model = models.CharField(max_length=100, verbose_name="모델명")
+    result = models.TextField(verbose_name="분석 결과")
+    evaluation = models.JSONField(null=True, blank=True, verbose_name="구조화 결과")
+    score = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name="총점")
+    cached = models.BooleanField(default=False, verbose_name="캐시 결과")
+    keyword_note = models.TextField(blank=True, verbose_name="키워드 매칭 요약")
+    compaction_note = models.TextField(blank=True, verbose_name="입력 압축 요약")
+    input_tokens = models.PositiveIntegerField(default=0, verbose_name="입력 토큰")
+    output_tokens = models.PositiveIntegerField(default=0, verbose_name="출력 토큰")
+    cached_input_tokens = models.PositiveIntegerField(
+        default=0, verbose_name="캐시 입력 토큰"
+    )
+    timings = models.JSONField(default=dict, blank=True, verbose_name="단계별 소요 시간(ms)")
+    # 미리 렌더링한 결과 페이지와 렌더링에 사용한 템플릿 버전
+    html = models.TextField(blank=True, verbose_name="렌더링 결과")
+    html_version = models.CharField(max_length=16, blank=True, verbose_name="렌더링 버전")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성 시간")
+
+    class Meta:
+        verbose_name = "분석 결과"
+        verbose_name_plural = "분석 결과"
+
+    def __str__(self):
+        return f"{self.id} ({self.provider}/{self.model})"
+
+    def get_absolute_url(self) -> str:
+        from django.urls import reverse
+
+        return reverse("evaluator:evaluation_detail", args=[self.id])
+
+    def etag(self, version: str) -> str:
+        """결과는 바뀌지 않으므로 id와 페이지 템플릿 버전만으로 ETag를 만듭니다."""
+        return f'"{self.id.hex}-{version}"'
+
+    def set_usage(self, usages):
+        """collect_usage()로 모은 TokenUsage 목록의 합계를 기록합니다."""
+        self.input_tokens = sum(usage.input_tokens for usage in usages)
+        self.output_tokens = sum(usage.output_tokens for usage in usages)
+        self.cached_input_tokens = sum(usage.cached_input_tokens for usage in usages)
+
+    @classmethod
+    def latest_for_key(cls, cache_key: str) -> "Evaluation | None":
+        """같은 입력의 가장 최근 결과를 반환합니다."""
+        return cls.objects.filter(cache_key=cache_key).order_by("-created_at").first()
+
+    @classmethod
+    async def alatest_for_key(cls, cache_key: str) -> "Evaluation | None":
+        """같은 입력의 가장 최근 결과를 반환합니다 (비동기)."""
+        return await (
+            cls.objects.filter(cache_key=cache_key).order_by("-created_at").afirst()
+        )
+
+    async def aset_html(self, html: str, version: str):
+        """미리 렌더링한 페이지를 저장합니다 (비동기)."""
+        self.html = html
+        self.html_version = version
+        await Evaluation.objects.filter(pk=self.pk).aupdate(html=html, html_version=version)
@@ -0,0 +1,280 @@
+"""Pluggable per-IP daily rate limiters.
+
+분석 요청은 LLM 호출 전에 한도를 원자적으로 예약(acquire)하고, 성공하면 확정(commit),
+실패하면 반환(release)합니다. 따라서 동시에 들어온 요청이 모두 확인을 통과해
+한도를 넘는 일이 없고, 분석에 성공한 요청만 횟수가 차감됩니다.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import close_old_connections
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import RateLimitCounter, RequestLog
+
+logger = logging.getLogger(__name__)
+
+
+class BaseRateLimiter:
+    """Interface of the daily rate limiter backends."""
+
+    def __init__(self, daily_limit: int = 3, **options):
+        self.daily_limit = daily_limit
+
+    def get_usage(self, ip_address: str) -> int:
+        """오늘 사용(예약 포함)한 요청 횟수를 반환합니다."""
+        raise NotImplementedError
+
+    def acquire(self, ip_address: str) -> bool:
+        """한도 내이면 1회를 예약하고 True를 반환합니다 (확인과 증가를 한 번에 수행)."""
+        raise NotImplementedError
+
+    def release(self, ip_address: str):
+        """분석에 실패한 요청의 예약을 반환합니다."""
+        raise NotImplementedError
+
+    def commit(self, ip_address: str):
+        """분석에 성공한 요청을 RequestLog에 기록합니다."""
+        raise NotImplementedError
+
+    def remaining(self, ip_address: str) -> int:
+        """남은 요청 횟수를 반환합니다."""
+        return max(0, self.daily_limit - self.get_usage(ip_address))
+
+    async def aremaining(self, ip_address: str) -> int:
+        return await sync_to_async(self.remaining)(ip_address)
+
+    async def aacquire(self, ip_address: str) -> bool:
+        return await sync_to_async(self.acquire)(ip_address)
+
+    async def arelease(self, ip_address: str):
+        await sync_to_async(self.release)(ip_address)
+
+    async def acommit(self, ip_address: str):
+        await sync_to_async(self.commit)(ip_address)
+
+
+class DatabaseRateLimiter(BaseRateLimiter):
+    """Count today's RequestLog rows on every check (기존 방식).
+
+    공유 캐시가 없는 환경을 위한 백엔드로, 확인과 기록 사이에 경쟁 조건이 있습니다.
+    """
+
+    def get_usage(self, ip_address: str) -> int:
+        return RequestLog.get_today_count(ip_address)
+
+    def acquire(self, ip_address: str) -> bool:
+        return self.get_usage(ip_address) < self.daily_limit
+
+    def release(self, ip_address: str):
+        pass
+
+    def commit(self, ip_address: str):
+        RequestLog.log_request(ip_address)
+
+
+class RequestLogWriter:
+    """Buffer RequestLog rows and write them in batches from a background thread."""
+
+    def __init__(self, flush_interval: float = 2.0):
+        self.flush_interval = flush_interval
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread = None
+        atexit.register(self.flush)
+
+    def add(self, ip_address: str):
+        self._queue.put(ip_address)
+        self._ensure_started()
+
+    def _ensure_started(self):
+        # fork된 워커에서는 스레드가 없으므로 처음 기록할 때 다시 시작
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="request-log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+            close_old_connections()
+
+    def flush(self) -> int:
+        """대기 중인 기록을 한 번의 bulk_create로 저장합니다."""
+        rows = []
+        while True:
+            try:
+                rows.append(RequestLog(ip_address=self._queue.get_nowait()))
+            except queue.Empty:
+                break
+        if rows:
+            try:
+                RequestLog.objects.bulk_create(rows)
+            except Exception:
+                logger.exception("요청 기록 저장 실패 (%d건)", len(rows))
+        return len(rows)
+
+
+class DatabaseCounterRateLimiter(BaseRateLimiter):
+    """Daily counters stored in the RateLimitCounter table (기본값).
+
+    예약과 반환은 (IP, 날짜) 행 하나에 대한 조건부 UPDATE이므로 원자적이고,
+    gunicorn 워커와 분석 워커 등 모든 프로세스가 같은 카운터를 공유합니다.
+    웹 프로세스에서 예약한 작업을 분석 워커가 실패 처리하며 반환해도 정확히 돌아옵니다.
+    카운터가 없을 때(하루의 첫 요청)만 RequestLog에서 오늘 횟수를 읽어 초기화합니다.
+
+    페이지 조회(get_usage)는 DB 대신 캐시에 usage_cache_ttl초 동안 보관한 값을 보여줍니다.
+    이 프로세스의 예약/반환은 캐시를 바로 지우므로, 다른 프로세스(분석 워커 등)의 변경만
+    최대 TTL만큼 늦게 보입니다. 한도 판정(acquire)은 항상 DB에서 원자적으로 합니다.
+    """
+
+    def __init__(
+        self,
+        daily_limit: int = 3,
+        flush_interval: float = 2.0,
+        cache_alias: str = "default",
+        usage_cache_ttl: int = 30,
+        **options,
+    ):
+        super().__init__(daily_limit)
+        self.writer = RequestLogWriter(flush_interval)
+        self.cache = caches[cache_alias]
+        self.usage_cache_ttl = usage_cache_ttl
+
+    def _usage_key(self, ip_address: str) -> str:
+        return f"ratelimit-usage:{ip_address}:{timezone.localdate().isoformat()}"
+
+    def get_usage(self, ip_address: str) -> int:
+        key = self._usage_key(ip_address)
+        if self.usage_cache_ttl > 0:
+            count = self.cache.get(key)
+            if count is not None:
+                return count
+        count = RateLimitCounter.get_count(ip_address, timezone.localdate())
+        if count is None:
+            count = RequestLog.get_today_count(ip_address)
+        if self.usage_cache_ttl > 0:
+            self.cache.set(key, count, self.usage_cache_ttl)
+        return count
+
+    def acquire(self, ip_address: str) -> bool:
+        today = timezone.localdate()
+        RateLimitCounter.ensure(ip_address, today, RequestLog.get_today_count(ip_address))
+        acquired = RateLimitCounter.increment_below(ip_address, today, self.daily_limit)
+        self.cache.delete(self._usage_key(ip_address))
+        return acquired
+
+    def release(self, ip_address: str):
+        RateLimitCounter.decrement(ip_address, timezone.localdate())
+        self.cache.delete(self._usage_key(ip_address))
+
+    def commit(self, ip_address: str):
+        self.writer.add(ip_address)
+
+
+class CacheRateLimiter(BaseRateLimiter):
+    """Daily counters keyed by IP + local date in a Django cache backend.
+
+    한도 확인(페이지 조회)은 캐시만 조회하며, RequestLog 기록은 백그라운드
+    스레드에서 모아서 저장합니다. 카운터가 캐시에 없을 때(하루의 첫 조회, 캐시 재시작)만
+    RequestLog에서 오늘 횟수를 한 번 읽어 초기화합니다.
+
+    Redis/Memcached 등 모든 프로세스가 공유하는 캐시가 필요합니다. LocMemCache는
+    프로세스마다 카운터를 따로 가져 워커 수만큼 한도가 늘어나고 분석 워커의 반환이
+    사라지므로, 단일 프로세스임을 명시(allow_local_cache)하지 않으면 거부합니다.
+    """
+
+    def __init__(
+        self,
+        daily_limit: int = 3,
+        cache_alias: str = "default",
+        flush_interval: float = 2.0,
+        allow_local_cache: bool = False,
+        **options,
+    ):
+        super().__init__(daily_limit)
+        self.cache = caches[cache_alias]
+        if isinstance(self.cache, LocMemCache) and not allow_local_cache:
+            raise ImproperlyConfigured(
+                "CacheRateLimiter에는 프로세스 간 공유 캐시(Redis 등)가 필요합니다. "
+                f"'{cache_alias}' 캐시가 LocMemCache입니다. DatabaseCounterRateLimiter를 쓰거나, "
+                "단일 프로세스라면 RATE_LIMIT_ALLOW_LOCAL_CACHE=True로 설정하세요."
+            )
+        self.writer = RequestLogWriter(flush_interval)
+
+    def _key(self, ip_address: str) -> str:
+        return f"ratelimit:{ip_address}:{timezone.localdate().isoformat()}"
+
+    def _timeout(self) -> int:
+        """다음 날 자정(로컬 시간) 이후 만료되도록 TTL을 계산합니다."""
+        now = timezone.localtime()
+        midnight = (now + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        return int((midnight - now).total_seconds()) + 60
+
+    def _ensure_counter(self, key: str, ip_address: str):
+        if self.cache.get(key) is None:
+            self.cache.add(key, RequestLog.get_today_count(ip_address), self._timeout())
+
+    def get_usage(self, ip_address: str) -> int:
+        key = self._key(ip_address)
+        self._ensure_counter(key, ip_address)
+        return self.cache.get(key, 0)
+
+    def acquire(self, ip_address: str) -> bool:
+        key = self._key(ip_address)
+        self._ensure_counter(key, ip_address)
+        try:
+            count = self.cache.incr(key)
+        except ValueError:
+            # 확인과 증가 사이에 만료된 경우
+            self.cache.add(key, 1, self._timeout())
+            count = 1
+        if count > self.daily_limit:
+            self.cache.decr(key)
+            return False
+        return True
+
+    def release(self, ip_address: str):
+        key = self._key(ip_address)
+        try:
+            if self.cache.decr(key) < 0:
+                self.cache.set(key, 0, self._timeout())
+        except ValueError:
+            pass
+
+    def commit(self, ip_address: str):
+        self.writer.add(ip_address)
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> BaseRateLimiter:
+    """settings.RATE_LIMIT에 설정된 백엔드 인스턴스를 반환합니다."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                config = dict(getattr(settings, "RATE_LIMIT", {}))
+                backend = import_string(
+                    config.pop("BACKEND", "evaluator.ratelimit.DatabaseCounterRateLimiter")
+                )
+                _limiter = backend(**{k.lower(): v for k, v in config.items()})
+    return _limiter
@@ -0,0 +1,64 @@
+"""Server-side rendering of result markdown to sanitized HTML.
+
+결과 마크다운을 서버에서 한 번 HTML로 변환하고 허용한 태그/속성만 남겨(nh3) 저장된 결과와
+함께 보관합니다. 브라우저는 마크다운 파서를 내려받아 전체 결과를 다시 해석할 필요 없이
+바로 그립니다.
+
+markdown, nh3 패키지가 필요하며 (pip install markdown nh3), 설치되지 않았으면 빈 문자열을
+반환해 기존처럼 브라우저에서 렌더링합니다.
+"""
+
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+MARKDOWN_EXTENSIONS = ("tables", "fenced_code", "sane_lists")
+
+# 결과에 쓰이는 마크다운 요소 (표 셀 안의 줄바꿈은 <br>로 들어옴)
+ALLOWED_TAGS = set(
+    "h1 h2 h3 h4 h5 h6 p br hr blockquote strong em del code pre "
+    "ul ol li table thead tbody tr th td a".split()
+)
+ALLOWED_ATTRIBUTES = {"a": {"href", "title"}, "ol": {"start"}}
+ALLOWED_URL_SCHEMES = {"http", "https", "mailto"}
+
+
+def _require_renderer():
+    try:
+        import markdown
+        import nh3
+    except ImportError:
+        raise ImportError(
+            "서버 측 결과 렌더링에는 markdown, nh3 패키지가 필요합니다: pip install markdown nh3"
+        )
+    return markdown, nh3
+
+
+@lru_cache(maxsize=256)
+def markdown_to_html(text: str) -> str:
+    """마크다운을 정제된 HTML로 변환합니다 (같은 결과는 프로세스당 한 번만 변환).
+
+    Raises:
+        ImportError: markdown/nh3가 설치되지 않은 경우
+    """
+    markdown, nh3 = _require_renderer()
+    html = markdown.markdown(text, extensions=list(MARKDOWN_EXTENSIONS))
+    return nh3.clean(
+        html,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        url_schemes=ALLOWED_URL_SCHEMES,
+        link_rel="noopener noreferrer nofollow",
+    )
+
+
+def render_result_html(text: str) -> str:
+    """결과 마크다운의 HTML (렌더러가 없으면 빈 문자열 → 브라우저에서 렌더링)."""
+    if not text:
+        return ""
+    try:
+        return markdown_to_html(text)
+    except ImportError as e:
+        logger.debug("%s", e)
+        return ""
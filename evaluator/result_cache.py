@@ -0,0 +1,156 @@
+"""Content-addressed cache for LLM evaluation results.
+
+동일한 JD + 이력서 조합이 다시 제출되면 LLM을 호출하지 않고 저장된 결과를 반환합니다.
+"""
+
+import hashlib
+import re
+import threading
+import unicodedata
+from datetime import timedelta
+from functools import lru_cache
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from .models import CachedResult
+
+# 프로세스 단위 적중/미스 카운터
+_stats_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def _record(outcome: str):
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def get_stats() -> dict:
+    """현재 프로세스의 캐시 적중/미스 횟수를 반환합니다."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def get_config() -> dict:
+    """settings.RESULT_CACHE 값을 기본값과 합쳐 반환합니다."""
+    config = {"ENABLED": True, "TTL": 7 * 24 * 60 * 60, "MAX_ENTRIES": 1000}
+    config.update(getattr(settings, "RESULT_CACHE", {}))
+    return config
+
+
+def normalize_text(text: str) -> str:
+    """공백/줄바꿈 차이로 캐시가 빗나가지 않도록 텍스트를 정규화합니다."""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFC", text).replace("\r\n", "\n")
+    lines = [re.sub(r"[ \t]+", " ", line).strip() for line in text.split("\n")]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+@lru_cache(maxsize=4)
+def prompt_version(system_prompt: str) -> str:
+    """시스템 프롬프트의 SHA-256 해시를 반환합니다 (같은 프롬프트는 한 번만 계산)."""
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+
+
+def hash_text(text: str) -> str:
+    """정규화한 텍스트의 SHA-256 해시 (빈 텍스트는 빈 문자열)."""
+    text = normalize_text(text)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest() if text else ""
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    system_prompt: str,
+    jd: str,
+    resume_text: str,
+    career_text: str = None,
+    hints: str = "",
+) -> str:
+    """입력 조합의 SHA-256 해시를 캐시 키로 반환합니다.
+
+    프롬프트 버전은 시스템 프롬프트 내용의 해시로 대신하므로,
+    prompt.md가 수정되면 이전 결과는 자동으로 무효화됩니다.
+    hints는 사용자 메시지에 덧붙인 키워드 매칭 힌트로, 힌트 설정을 바꾸면
+    다른 키가 됩니다. 힌트가 없으면 이전과 같은 키를 반환합니다.
+    """
+    parts = [
+        provider,
+        model,
+        prompt_version(system_prompt),
+        normalize_text(jd),
+        normalize_text(resume_text),
+        normalize_text(career_text),
+    ]
+    if hints:
+        parts.append(normalize_text(hints))
+    digest = hashlib.sha256()
+    for part in parts:
+        encoded = part.encode("utf-8")
+        # 길이를 함께 넣어 필드 경계가 모호해지지 않도록 함
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+def get_cached_result(key: str) -> str | None:
+    """캐시된 결과를 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+    config = get_config()
+    if not config["ENABLED"]:
+        return None
+
+    entry = CachedResult.objects.filter(key=key).only("result", "created_at").first()
+    if entry is None:
+        _record("misses")
+        return None
+
+    if entry.created_at < timezone.now() - timedelta(seconds=config["TTL"]):
+        CachedResult.objects.filter(key=key).delete()
+        _record("misses")
+        return None
+
+    # LRU 순서를 위해 마지막 사용 시간 갱신
+    CachedResult.objects.filter(key=key).update(
+        last_accessed_at=timezone.now(), hit_count=F("hit_count") + 1
+    )
+    _record("hits")
+    return entry.result
+
+
+def set_cached_result(key: str, provider: str, model: str, result: str):
+    """결과를 캐시에 저장하고 최대 개수를 넘으면 오래 사용되지 않은 항목을 제거합니다."""
+    config = get_config()
+    if not config["ENABLED"]:
+        return
+
+    CachedResult.objects.update_or_create(
+        key=key,
+        defaults={
+            "provider": provider,
+            "model": model,
+            "result": result,
+            "created_at": timezone.now(),
+            "last_accessed_at": timezone.now(),
+        },
+    )
+    evict(config["MAX_ENTRIES"])
+
+
+def evict(max_entries: int) -> int:
+    """최근 사용 순으로 max_entries개만 남기고 나머지를 삭제합니다 (LRU)."""
+    stale_keys = list(
+        CachedResult.objects.order_by("-last_accessed_at").values_list(
+            "key", flat=True
+        )[max_entries:]
+    )
+    if not stale_keys:
+        return 0
+    deleted, _ = CachedResult.objects.filter(key__in=stale_keys).delete()
+    return deleted
+
+
+aget_cached_result = sync_to_async(get_cached_result)
+aset_cached_result = sync_to_async(set_cached_result)
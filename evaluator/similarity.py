@@ -0,0 +1,199 @@
+"""Embedding-free JD-resume relevance scoring with sparse TF-IDF/BM25 vectors.
+
+배치 분석에서 LLM을 호출하기 전에 JD와 이력서 N개의 관련도를 로컬에서 계산합니다.
+한글은 형태소 분석 없이도 조사/어미 변화에 강하도록 어절 단위 문자 n-gram으로,
+영문/숫자는 단어 단위로 토큰화하고, 희소 행렬 곱 한 번으로 모든 이력서의 점수를 구합니다.
+
+NumPy/SciPy가 필요합니다 (pip install numpy scipy).
+"""
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+
+from django.conf import settings
+
+METHODS = ("tfidf", "bm25")
+
+# 영문/숫자 단어 또는 한글 어절
+WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*|[가-힣]+")
+
+
+def get_config() -> dict:
+    """settings.SIMILARITY 값을 기본값과 합쳐 반환합니다."""
+    config = {
+        "ENABLED": False,
+        "METHOD": "tfidf",
+        "NGRAM_MIN": 2,
+        "NGRAM_MAX": 3,
+        "BM25_K1": 1.2,
+        "BM25_B": 0.75,
+    }
+    config.update(getattr(settings, "SIMILARITY", {}))
+    return config
+
+
+def _require_numpy():
+    try:
+        import numpy as np
+        from scipy import sparse
+    except ImportError:
+        raise ImportError(
+            "유사도 계산에는 numpy, scipy 패키지가 필요합니다: pip install numpy scipy"
+        )
+    return np, sparse
+
+
+@lru_cache(maxsize=65536)
+def chunk_terms(chunk: str, ngram_min: int = 2, ngram_max: int = 3) -> tuple[str, ...]:
+    """공백으로 나눈 덩어리 하나의 색인어.
+
+    영문/숫자는 단어 그대로, 한글 어절은 경계를 포함한 문자 n-gram으로 나눕니다.
+    "쿠버네티스를" → " 쿠", "쿠버", ..., "스를", "를 " 등 (조사가 붙어도 대부분의 n-gram이 겹침)
+    """
+    terms = []
+    for word in WORD_RE.findall(chunk):
+        if not "가" <= word[0] <= "힣":
+            terms.append(word)
+            continue
+        padded = f" {word} "
+        for n in range(ngram_min, ngram_max + 1):
+            terms.extend(padded[i : i + n] for i in range(len(padded) - n + 1))
+    return tuple(terms)
+
+
+def term_counts(text: str, ngram_min: int = 2, ngram_max: int = 3) -> Counter:
+    """문서의 색인어 빈도를 셉니다.
+
+    정규식 토큰화는 공백 단위 덩어리마다 한 번만 하고 (chunk_terms 캐시),
+    덩어리의 등장 횟수를 곱해 더합니다.
+    """
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    counts = Counter()
+    for chunk, occurrences in Counter(text.split()).items():
+        for term in chunk_terms(chunk, ngram_min, ngram_max):
+            counts[term] += occurrences
+    return counts
+
+
+def _count_matrix(documents: list[Counter], vocabulary: dict, grow: bool):
+    """문서별 색인어 빈도를 (문서 × 어휘) CSR 행렬로 만듭니다.
+
+    grow가 False이면 vocabulary에 없는 색인어는 버립니다 (질의 벡터용).
+    """
+    np, sparse = _require_numpy()
+    indptr = [0]
+    indices = []
+    data = []
+    for counts in documents:
+        for term, count in counts.items():
+            index = vocabulary.get(term)
+            if index is None:
+                if not grow:
+                    continue
+                index = vocabulary[term] = len(vocabulary)
+            indices.append(index)
+            data.append(count)
+        indptr.append(len(indices))
+    return sparse.csr_matrix(
+        (
+            np.asarray(data, dtype=np.float32),
+            np.asarray(indices, dtype=np.int32),
+            np.asarray(indptr, dtype=np.int64),
+        ),
+        shape=(len(documents), len(vocabulary)),
+    )
+
+
+def _row_ids(matrix):
+    """CSR 행렬의 각 nonzero 값이 속한 행 번호."""
+    np, _ = _require_numpy()
+    return np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+
+
+def _l2_normalize(matrix):
+    np, _ = _require_numpy()
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    matrix.data /= norms[_row_ids(matrix)]
+    return matrix
+
+
+def _tfidf(documents, queries, document_frequency):
+    """sublinear TF × smooth IDF, L2 정규화 → 행렬 곱이 코사인 유사도가 됨."""
+    np, _ = _require_numpy()
+    n_docs = documents.shape[0]
+    idf = np.log((1 + n_docs) / (1 + document_frequency)) + 1.0
+    for matrix in (documents, queries):
+        matrix.data = (1.0 + np.log(matrix.data)) * idf[matrix.indices]
+        _l2_normalize(matrix)
+    return documents, queries
+
+
+def _bm25(documents, queries, document_frequency, k1: float, b: float):
+    """문서 쪽에 BM25 TF 포화/길이 정규화와 IDF를 적용하고 질의는 이진 벡터로 둡니다."""
+    np, _ = _require_numpy()
+    n_docs = documents.shape[0]
+    idf = np.log(1.0 + (n_docs - document_frequency + 0.5) / (document_frequency + 0.5))
+    lengths = np.asarray(documents.sum(axis=1)).ravel()
+    average_length = lengths.mean() if n_docs and lengths.mean() > 0 else 1.0
+    tf = documents.data
+    norm = k1 * (1.0 - b + b * lengths[_row_ids(documents)] / average_length)
+    documents.data = idf[documents.indices] * tf * (k1 + 1.0) / (tf + norm)
+    queries.data = np.ones_like(queries.data)
+    return documents, queries
+
+
+def similarity_matrix(queries: list[str], documents: list[str], method: str = None):
+    """질의(JD) Q개와 문서(이력서) N개의 관련도를 (Q × N) 배열로 반환합니다.
+
+    tfidf는 코사인 유사도(0~1), bm25는 질의별 최고점이 1이 되도록 나눈 값입니다.
+    어휘와 IDF는 문서 집합에서 계산하며, 점수는 희소 행렬 곱 한 번으로 구합니다.
+
+    Raises:
+        ImportError: numpy/scipy가 설치되지 않은 경우
+        ValueError: 알 수 없는 method
+    """
+    np, _ = _require_numpy()
+    config = get_config()
+    method = method or config["METHOD"]
+    if method not in METHODS:
+        raise ValueError(f"지원하지 않는 유사도 방식입니다: {method} ({', '.join(METHODS)})")
+    if not queries or not documents:
+        return np.zeros((len(queries), len(documents)), dtype=np.float32)
+
+    ngrams = (config["NGRAM_MIN"], config["NGRAM_MAX"])
+    vocabulary = {}
+    doc_matrix = _count_matrix(
+        [term_counts(text, *ngrams) for text in documents], vocabulary, grow=True
+    )
+    query_matrix = _count_matrix(
+        [term_counts(text, *ngrams) for text in queries], vocabulary, grow=False
+    )
+    document_frequency = np.bincount(doc_matrix.indices, minlength=len(vocabulary))
+
+    if method == "tfidf":
+        doc_matrix, query_matrix = _tfidf(doc_matrix, query_matrix, document_frequency)
+    else:
+        doc_matrix, query_matrix = _bm25(
+            doc_matrix,
+            query_matrix,
+            document_frequency,
+            config["BM25_K1"],
+            config["BM25_B"],
+        )
+
+    scores = (query_matrix @ doc_matrix.T).toarray()
+    if method == "bm25":
+        top = scores.max(axis=1, keepdims=True)
+        top[top == 0] = 1.0
+        scores /= top
+    return scores
+
+
+def similarity_scores(jd: str, documents: list[str], method: str = None) -> list[int]:
+    """JD 하나에 대한 이력서별 관련도 점수(0~100)를 문서 순서대로 반환합니다."""
+    scores = similarity_matrix([jd], documents, method)[0]
+    return [int(math.floor(score * 100 + 0.5)) for score in scores.tolist()]
@@ -0,0 +1,108 @@
+"""Process start-up warm-up: eager imports and one-time initialisation.
+
+SDK(anthropic/openai), PyMuPDF, markdown 같은 무거운 모듈은 처음 쓰일 때 임포트되어 새로 뜬
+워커의 첫 요청이 그 비용을 떠안습니다. 서버 시작 시(config/wsgi.py, config/asgi.py) 미리 임포트하고
+템플릿, 정적 파일 매니페스트, 시스템 프롬프트를 준비해 두면 첫 요청도 평소 요청과 같은 지연으로
+처리됩니다. migrate, check 같은 관리 명령은 요청을 받지 않으므로 준비하지 않습니다.
+
+gunicorn ``--preload``(preload_app)에서는 마스터 프로세스가 한 번만 준비하고 워커는 fork로
+임포트된 모듈을 그대로 물려받습니다. 여기서는 DB 연결이나 소켓을 열지 않으므로 fork 후에
+공유되는 자원이 없습니다 (LLM 연결 풀은 llm_client가 fork 시 초기화).
+"""
+
+import importlib
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# 요청 처리 중 처음 임포트되던 모듈 (설치되지 않은 선택 의존성은 건너뜀)
+PRELOAD_MODULES = (
+    "pymupdf",  # PDF 파싱 (file_parser의 `import fitz`가 가리키는 모듈)
+    "markdown",
+    "nh3",
+)
+
+# 마지막 warm_up()의 단계별 소요 시간(초) — benchmark_startup 명령이 읽음
+last_timings = {}
+
+
+def preload_modules(names) -> list:
+    """모듈을 임포트하고 임포트한 모듈 이름 목록을 반환합니다."""
+    loaded = []
+    for name in names:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        loaded.append(name)
+    return loaded
+
+
+def warm_up_server() -> dict:
+    """서버 진입점에서 settings.STARTUP_PRELOAD/LLM_WARMUP에 따라 warm_up()을 실행합니다."""
+    from django.conf import settings
+
+    return warm_up(
+        preload=getattr(settings, "STARTUP_PRELOAD", True),
+        llm_clients=getattr(settings, "LLM_WARMUP", True),
+    )
+
+
+def warm_up(preload: bool = True, llm_clients: bool = True) -> dict:
+    """시작 시 한 번 필요한 준비를 모두 마치고 {단계: 초}를 반환합니다.
+
+    Args:
+        preload: 무거운 모듈 임포트, 템플릿/정적 파일 매니페스트/마크다운 렌더러 준비
+        llm_clients: API 키가 설정된 provider의 LLM 클라이언트(연결 풀) 생성
+    """
+    import llm_client
+
+    from .rendering import render_result_html
+    from .result_cache import prompt_version
+    from .views import load_system_prompt, permalink_page_version
+
+    timings = {}
+
+    @contextmanager
+    def stage(name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            timings[name] = time.perf_counter() - started
+
+    # 시스템 프롬프트를 한 번 읽고 해시해 두어 요청마다 파일을 읽지 않음
+    with stage("prompt"):
+        prompt_version(load_system_prompt())
+
+    if preload:
+        with stage("imports"):
+            # 가짜 백엔드를 쓰더라도 API 키가 있으면 실제 배포와 같은 비용을 치르도록 임포트
+            sdk_modules = [
+                llm_client.SDK_MODULES[provider]
+                for provider, env in llm_client.API_KEY_ENV.items()
+                if os.getenv(env)
+            ]
+            preload_modules(PRELOAD_MODULES + tuple(sdk_modules))
+        # 템플릿 컴파일(캐시 로더)과 정적 파일 매니페스트 로드
+        with stage("templates"):
+            permalink_page_version()
+        # 마크다운 확장 모듈은 첫 변환 시 로드됨
+        with stage("markdown"):
+            render_result_html("# warm-up")
+
+    # 첫 요청에서 SDK 클라이언트와 연결 풀 생성 비용을 없앰
+    if llm_clients:
+        with stage("llm_clients"):
+            llm_client.warm_up()
+
+    last_timings.clear()
+    last_timings.update(timings)
+    logger.info(
+        "시작 준비 완료: %s",
+        ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in timings.items()),
+    )
+    return timings
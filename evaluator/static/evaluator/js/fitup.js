@@ -0,0 +1,231 @@
+// 스트리밍 중에는 받은 마크다운을 원문 그대로 보여주고, 완료되면 서버가 변환/정제한 HTML로 교체
+// (LLM 출력을 브라우저에서 HTML로 만들어 DOM에 넣지 않음)
+function renderPreview(target, markdown) {
+    target.classList.add('markdown-plain');
+    target.textContent = markdown;
+}
+
+// 오류 알림 닫기 (Bootstrap JS 없이 처리)
+document.querySelectorAll('[data-bs-dismiss="alert"]').forEach(button => {
+    button.addEventListener('click', () => button.closest('.alert').remove());
+});
+
+// 폼 제출 시 로딩 표시
+const evaluationForm = document.getElementById('evaluationForm');
+const submitBtn = document.getElementById('submitBtn');
+const submitBtnHtml = submitBtn ? submitBtn.innerHTML : '';
+
+function showLoading() {
+    document.querySelector('.loading').classList.add('show');
+    submitBtn.disabled = true;
+    submitBtn.innerHTML =
+        '<span class="spinner-border spinner-border-sm me-2" role="status"></span>분석 중... 잠시만 기다려주세요';
+}
+
+function hideLoading() {
+    submitBtn.disabled = false;
+    submitBtn.innerHTML = submitBtnHtml;
+}
+
+function showStreamError(message) {
+    document.getElementById('streamErrorMessage').textContent = message;
+    document.getElementById('streamError').classList.remove('d-none');
+}
+
+function updateRemaining(remaining) {
+    document.getElementById('remainingCount').textContent = remaining;
+    const badge = document.getElementById('remainingBadge');
+    badge.classList.remove('available', 'exhausted');
+    if (remaining === 0) {
+        badge.classList.add('exhausted');
+    } else if (remaining > 1) {
+        badge.classList.add('available');
+    }
+}
+
+// 스트리밍 응답(SSE)을 받아 결과를 점진적으로 렌더링
+async function streamEvaluation() {
+    const response = await fetch(evaluationForm.dataset.streamUrl, {
+        method: 'POST',
+        body: new FormData(evaluationForm),
+    });
+    const contentType = response.headers.get('Content-Type') || '';
+    if (!response.ok || !contentType.startsWith('text/event-stream')) {
+        // 검증 오류 등은 일반 폼 제출로 서버 렌더링 화면을 표시
+        evaluationForm.submit();
+        return;
+    }
+
+    const resultContainer = document.getElementById('resultContainer');
+    const rawMarkdown = document.getElementById('rawMarkdown');
+    let markdown = '';
+    let renderScheduled = false;
+    let replaceOnNextToken = false;
+
+    function render() {
+        renderScheduled = false;
+        renderPreview(resultContent, markdown);
+        rawMarkdown.textContent = markdown;
+    }
+
+    function scheduleRender() {
+        if (!renderScheduled) {
+            renderScheduled = true;
+            requestAnimationFrame(render);
+        }
+    }
+
+    resultContainer.classList.remove('d-none');
+    resultContent.innerHTML = '';
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const rawEvent = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let eventName = 'message';
+            let data = '';
+            rawEvent.split('\n').forEach(line => {
+                if (line.startsWith('event: ')) eventName = line.slice(7);
+                else if (line.startsWith('data: ')) data += line.slice(6);
+            });
+            if (!data) continue;
+
+            const payload = JSON.parse(data);
+            if (eventName === 'keywords') {
+                // LLM 응답 전에 로컬 키워드 매칭 결과를 바로 표시
+                const keywordNote = document.getElementById('keywordNote');
+                keywordNote.textContent = payload.summary || '';
+                keywordNote.classList.toggle('d-none', !payload.summary);
+            } else if (eventName === 'triage') {
+                // 빠른 평가 결과를 먼저 표시하고, 상세 분석이 시작되면 교체
+                markdown = payload.markdown;
+                replaceOnNextToken = payload.passed;
+                scheduleRender();
+            } else if (eventName === 'token') {
+                if (replaceOnNextToken) {
+                    markdown = '';
+                    replaceOnNextToken = false;
+                }
+                markdown += payload;
+                scheduleRender();
+            } else if (eventName === 'markdown') {
+                // 구조화 출력 모드: 받은 필드까지 렌더링한 전체 마크다운
+                markdown = payload;
+                scheduleRender();
+            } else if (eventName === 'done') {
+                render();
+                if (payload.html) {
+                    // 서버에서 변환/정제한 최종 결과로 교체
+                    resultContent.classList.remove('markdown-plain');
+                    resultContent.innerHTML = payload.html;
+                }
+                updateRemaining(payload.remaining_requests);
+                document.getElementById('cachedBadge').classList.toggle('d-none', !payload.cached);
+                const compactionNote = document.getElementById('compactionNote');
+                compactionNote.textContent = payload.compaction_note || '';
+                compactionNote.classList.toggle('d-none', !payload.compaction_note);
+                if (payload.permalink) {
+                    // 새로고침해도 다시 분석하지 않도록 주소를 저장된 결과의 고유 주소로 변경
+                    document.getElementById('permalinkLink').href = payload.permalink;
+                    document.getElementById('permalinkNote').classList.remove('d-none');
+                    history.replaceState(null, '', payload.permalink);
+                }
+            } else if (eventName === 'error') {
+                showStreamError(payload);
+            }
+        }
+    }
+    hideLoading();
+}
+
+if (evaluationForm && submitBtn && window.fetch && window.ReadableStream) {
+    evaluationForm.addEventListener('submit', function(e) {
+        e.preventDefault();
+        document.getElementById('streamError').classList.add('d-none');
+        showLoading();
+        streamEvaluation().catch(err => {
+            showStreamError(`분석 중 오류가 발생했습니다: ${err.message}`);
+            hideLoading();
+        });
+    });
+} else if (evaluationForm && submitBtn) {
+    evaluationForm.addEventListener('submit', showLoading);
+}
+
+// 드래그 앤 드롭 지원
+function setupDropArea(dropAreaId, inputId) {
+    const dropArea = document.getElementById(dropAreaId);
+    const input = document.getElementById(inputId);
+    // 저장된 결과 페이지에는 입력 폼이 없음
+    if (!dropArea || !input) return;
+
+    ['dragenter', 'dragover', 'dragleave', 'drop'].forEach(eventName => {
+        dropArea.addEventListener(eventName, preventDefaults, false);
+    });
+
+    function preventDefaults(e) {
+        e.preventDefault();
+        e.stopPropagation();
+    }
+
+    ['dragenter', 'dragover'].forEach(eventName => {
+        dropArea.addEventListener(eventName, () => dropArea.classList.add('dragover'), false);
+    });
+
+    ['dragleave', 'drop'].forEach(eventName => {
+        dropArea.addEventListener(eventName, () => dropArea.classList.remove('dragover'), false);
+    });
+
+    dropArea.addEventListener('drop', (e) => {
+        const files = e.dataTransfer.files;
+        if (files.length > 0) {
+            input.files = files;
+            // 파일명 표시
+            const fileName = files[0].name;
+            dropArea.querySelector('.file-upload-icon').textContent = '✅';
+            dropArea.querySelector('.form-text').textContent = fileName;
+        }
+    }, false);
+
+    // 파일 선택 시 아이콘 변경
+    input.addEventListener('change', function() {
+        if (this.files.length > 0) {
+            dropArea.querySelector('.file-upload-icon').textContent = '✅';
+            dropArea.querySelector('.form-text').textContent = this.files[0].name;
+        }
+    });
+}
+
+setupDropArea('resumeDropArea', 'id_resume');
+setupDropArea('careerDropArea', 'id_career_description');
+
+const resultContent = document.getElementById('resultContent');
+
+// 마크다운 다운로드
+const downloadBtn = document.getElementById('downloadBtn');
+if (downloadBtn) {
+    downloadBtn.addEventListener('click', function() {
+        const rawMarkdown = document.getElementById('rawMarkdown').textContent;
+        const blob = new Blob([rawMarkdown], { type: 'text/markdown;charset=utf-8' });
+        const url = URL.createObjectURL(blob);
+        const a = document.createElement('a');
+        const now = new Date();
+        const timestamp = now.toISOString().slice(0, 10);
+        a.href = url;
+        a.download = `fitup-result-${timestamp}.md`;
+        document.body.appendChild(a);
+        a.click();
+        document.body.removeChild(a);
+        URL.revokeObjectURL(url);
+    });
+}
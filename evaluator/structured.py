@@ -0,0 +1,465 @@
+"""Structured (JSON) evaluation output.
+
+자유 형식 마크다운 대신 prompt.md의 점수 카테고리를 JSON Schema로 정의하고,
+OpenAI는 Structured Outputs(json_schema), Claude는 도구 호출(tool use)로 스키마에 맞는
+JSON을 받습니다. 화면과 다운로드용 마크다운은 이 구조에서 만들어지므로, 점수 정렬/집계는
+문장을 다시 해석하지 않고 필드를 읽기만 하면 됩니다.
+
+스트리밍 중에는 IncrementalJSONParser가 받은 만큼의 JSON을 해석하여, 점수 같은 앞쪽
+필드를 긴 코멘트가 끝나기 전에 먼저 보여줄 수 있습니다.
+"""
+
+import json
+import re
+
+from django.conf import settings
+
+# prompt.md Step 4의 기본 가중치 (필드 이름, 표시 이름, 배점)
+CATEGORIES = (
+    ("qualifications", "자격요건", 45),
+    ("preferred", "우대사항", 20),
+    ("tech_stack", "기술스택", 20),
+    ("culture_fit", "컬쳐핏·업무방식", 10),
+    ("etc", "기타", 5),
+)
+
+VERDICTS = ("충족", "부분충족", "미충족", "정보부족")
+IMPORTANCE = ("High", "Medium", "Low")
+
+# 적합도 등급 (하한 점수, 등급)
+GRADES = (
+    (90, "⭐ 매우 적합 (Most Qualified)"),
+    (75, "✅ 적합 (Qualified)"),
+    (60, "🔶 보통 (Partially Qualified)"),
+    (40, "⚠️ 부족 (Under-Qualified)"),
+    (0, "❌ 부적합 (Not Qualified)"),
+)
+
+
+def object_schema(properties: dict) -> dict:
+    # OpenAI strict 모드는 모든 필드가 required이고 추가 필드가 없어야 함
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def _string_list(description: str) -> dict:
+    return {"type": "array", "items": {"type": "string"}, "description": description}
+
+
+# 필드 순서가 곧 생성(스트리밍) 순서이므로 점수를 앞에, 긴 코멘트를 뒤에 둠
+EVALUATION_SCHEMA = {
+    "name": "record_evaluation",
+    "description": "JD-이력서 적합도 평가 결과를 기록합니다.",
+    "schema": object_schema(
+        {
+            "scores": object_schema(
+                {
+                    name: {"type": "integer", "description": f"{label} 점수 (0~{points})"}
+                    for name, label, points in CATEGORIES
+                }
+            ),
+            "score_cap": object_schema(
+                {
+                    "cap": {
+                        "type": "integer",
+                        "description": "적용한 총점 상한 (미적용 시 100)",
+                    },
+                    "reason": {
+                        "type": "string",
+                        "description": "상한 적용 사유 (미적용 시 빈 문자열)",
+                    },
+                }
+            ),
+            "total_score": {
+                "type": "integer",
+                "description": "카테고리 점수 합계에 상한을 적용한 총점 (0~100)",
+            },
+            "summary": {
+                "type": "string",
+                "description": "핵심 강점과 주요 리스크를 요약한 한줄 평가 (1~2문장)",
+            },
+            "keywords": _string_list("JD와 매칭되는 핵심 역량 키워드 3~5개"),
+            "notices": {
+                "type": "array",
+                "description": "게이팅 조건 Notice (부분충족/미충족/정보부족/미확인 후보)",
+                "items": object_schema(
+                    {
+                        "condition": {"type": "string"},
+                        "verdict": {"type": "string", "enum": list(VERDICTS)},
+                        "detail": {
+                            "type": "string",
+                            "description": "근거/부재 근거와 '지원 전 확인 필요' 등 안내",
+                        },
+                    }
+                ),
+            },
+            "matches": {
+                "type": "array",
+                "description": "JD 항목별 매칭 결과 (점수 근거)",
+                "items": object_schema(
+                    {
+                        "jd_item": {"type": "string"},
+                        "importance": {"type": "string", "enum": list(IMPORTANCE)},
+                        "verdict": {"type": "string", "enum": list(VERDICTS)},
+                        "evidence": {
+                            "type": "string",
+                            "description": "이력서/경력기술서 근거 (발췌/요지)",
+                        },
+                        "comment": {"type": "string"},
+                    }
+                ),
+            },
+            "strengths": _string_list("강점 Top 3~5 (근거 포함)"),
+            "risks": _string_list("리스크/공백 Top 3~5 (근거 포함, 문서상 확인 불가 명시)"),
+            "improvements": _string_list("보완 우선순위 1~5 (이력서 수정 가이드, 새 사실 금지)"),
+            "questions": _string_list("추가 확인 질문 3~10개"),
+        }
+    ),
+}
+
+STRUCTURED_OUTPUT_INSTRUCTIONS = """
+
+[구조화 출력 모드]
+
+- 위 "출력 포맷(마크다운 고정)" 대신, 제공된 JSON 스키마(record_evaluation)에 맞는 JSON으로만 응답한다.
+- 분석 절차, 판정 4단계, 점수 규칙, 게이팅 조건 상한 규칙은 위와 동일하게 적용한다.
+- scores 배점: {categories}
+- score_cap: 상한을 적용하지 않으면 cap은 100, reason은 빈 문자열로 둔다.
+- total_score: scores 합계에 score_cap을 적용한 값이다.
+- 문자열 필드에는 제목/표 등 마크다운 서식을 넣지 않는다.
+""".format(
+    categories=", ".join(f"{label} {points}점" for _, label, points in CATEGORIES)
+)
+
+
+def get_config() -> dict:
+    """settings.STRUCTURED_OUTPUT 값을 기본값과 합쳐 반환합니다."""
+    config = {"ENABLED": False}
+    config.update(getattr(settings, "STRUCTURED_OUTPUT", {}))
+    return config
+
+
+def output_options(system_prompt: str, provider: str) -> tuple[str, dict | None]:
+    """provider 호출에 사용할 (시스템 프롬프트, 응답 스키마)를 반환합니다.
+
+    구조화 출력이 꺼져 있거나, 여러 provider 결과를 이어 붙이는 compare 모드에서는
+    기존 마크다운 출력을 사용합니다.
+    """
+    if not get_config()["ENABLED"] or provider == "compare":
+        return system_prompt, None
+    return system_prompt + STRUCTURED_OUTPUT_INSTRUCTIONS, EVALUATION_SCHEMA
+
+
+def parse_result(text: str) -> dict | None:
+    """결과가 구조화(JSON) 응답이면 dict를, 마크다운이면 None을 반환합니다."""
+    if not text or not text.lstrip().startswith("{"):
+        return None
+    try:
+        data = json.loads(text, strict=False)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def load_evaluation(text: str) -> dict:
+    """구조화 응답을 해석합니다.
+
+    Raises:
+        ValueError: JSON 객체가 아니거나 총점이 없는 경우 (토큰 한도로 잘린 응답 등)
+    """
+    data = parse_result(text)
+    if data is None or not isinstance(data.get("total_score"), int):
+        raise ValueError("AI 응답을 해석할 수 없습니다. 다시 시도해주세요.")
+    return data
+
+
+def total_score(data: dict) -> int | None:
+    score = data.get("total_score")
+    if not isinstance(score, int):
+        return None
+    return max(0, min(100, score))
+
+
+def grade_for(score: int) -> str:
+    """총점에 해당하는 적합도 등급을 반환합니다 (prompt.md 기준)."""
+    for threshold, grade in GRADES:
+        if score >= threshold:
+            return grade
+    return GRADES[-1][1]
+
+
+def table_cell(value) -> str:
+    # 표 셀 안에서 줄바꿈과 '|'가 표를 깨뜨리지 않도록 변환
+    return re.sub(r"\s*\n\s*", "<br>", str(value or "")).replace("|", "\\|")
+
+
+def _numbered(items) -> list:
+    return [f"{index}. {item}" for index, item in enumerate(items, start=1)]
+
+
+def render_markdown(data: dict) -> str:
+    """구조화된 평가 결과를 prompt.md의 출력 포맷 순서대로 마크다운으로 만듭니다.
+
+    스트리밍 중의 일부만 채워진 dict도 받은 필드까지만 렌더링합니다.
+    """
+    lines = []
+    score = total_score(data)
+
+    summary = []
+    if score is not None:
+        summary.append(f"> - **총점**: {score}/100점")
+        summary.append(f"> - **적합도 등급**: {grade_for(score)}")
+    if data.get("summary"):
+        summary.append(f"> - **한줄 평가**: {data['summary']}")
+    if data.get("keywords"):
+        summary.append(f"> - **핵심 키워드**: {', '.join(data['keywords'])}")
+    if summary:
+        lines += ["## 0. 평가 요약", ""] + summary + [""]
+
+    notices = [notice for notice in data.get("notices") or [] if notice.get("condition")]
+    if notices:
+        lines += ["### ⚠️ Notice", ""]
+        for notice in notices:
+            verdict = f" ({notice['verdict']})" if notice.get("verdict") else ""
+            lines.append(f"- **{notice['condition']}**{verdict}: {notice.get('detail', '')}")
+        lines.append("")
+
+    scores = data.get("scores") or {}
+    if scores:
+        lines += ["## 1. 점수", "", "| 카테고리 | 점수 |", "|----------|------|"]
+        for name, label, points in CATEGORIES:
+            if name in scores:
+                lines.append(f"| {label} | {scores[name]}/{points} |")
+        if score is not None:
+            lines.append(f"| **총점** | **{score}/100** |")
+        lines.append("")
+        cap = data.get("score_cap") or {}
+        if cap.get("reason"):
+            lines += [f"- 총점 상한 {cap.get('cap', '-')}점 적용: {cap['reason']}", ""]
+
+    matches = data.get("matches") or []
+    if matches:
+        lines += [
+            "## 2. 매칭 결과",
+            "",
+            "| JD 항목 | 중요도 | 판정 | 이력서/경력기술서 근거 | 코멘트 |",
+            "|---------|--------|------|------------------------|--------|",
+        ]
+        for match in matches:
+            lines.append(
+                "| "
+                + " | ".join(
+                    table_cell(match.get(field))
+                    for field in ("jd_item", "importance", "verdict", "evidence", "comment")
+                )
+                + " |"
+            )
+        lines.append("")
+
+    for field, title in (
+        ("strengths", "## 3. 강점"),
+        ("risks", "## 4. 리스크/공백"),
+        ("improvements", "## 5. 보완 우선순위"),
+        ("questions", "## 6. 추가 확인 질문"),
+    ):
+        items = data.get(field) or []
+        if items:
+            lines += [title, ""] + _numbered(items) + [""]
+
+    return "\n".join(lines).strip()
+
+
+def to_markdown(result: str) -> str:
+    """저장된 결과를 화면에 보여줄 마크다운으로 변환합니다 (마크다운 결과는 그대로)."""
+    data = parse_result(result)
+    if data is None:
+        return result
+    return render_markdown(data)
+
+
+class IncrementalJSONParser:
+    """Parse a JSON document as it streams in, exposing partially received fields.
+
+    파서 상태(열린 컨테이너, 진행 중인 문자열과 escape)를 청크 사이에 유지하므로
+    ``feed``는 새 청크의 문자만 한 번씩 처리합니다. ``value``는 지금까지 받은 내용으로
+    채워진 dict/list이며, 진행 중인 문자열은 읽을 때 받은 부분까지 채워지고
+    숫자/true/false/null은 끝난 뒤에 채워집니다.
+
+    Example:
+        parser = IncrementalJSONParser()
+        for chunk in chunks:
+            for key in parser.feed(chunk):
+                print(key, parser.value[key])
+    """
+
+    _STRING_STOP = re.compile(r'["\\]')
+    _LITERAL_CHARS = frozenset("0123456789+-.eEtruefalsn")
+
+    def __init__(self):
+        self._value = None
+        # 열린 컨테이너 스택: [container, 대기 중인 key]
+        self._stack = []
+        self._expect_key = False
+        self._string = None  # 진행 중인 문자열의 디코딩된 조각
+        self._string_is_key = False
+        self._string_changed = False
+        self._escape = None  # 청크 경계에서 잘린 escape의 '\\' 뒤 문자
+        self._surrogate = None  # 짝이 올 때까지 보류한 서로게이트 앞쪽 escape
+        self._literal = None
+        self.done = False
+
+    @property
+    def value(self):
+        if self._string_changed:
+            # 진행 중인 문자열은 매 청크가 아니라 읽을 때만 합쳐서 노출
+            text = "".join(self._string)
+            self._string[:] = [text]
+            self._set_current(text)
+            self._string_changed = False
+        return self._value
+
+    def feed(self, chunk: str) -> list:
+        """청크를 처리하고 이번에 완성된 최상위 필드 이름 목록을 반환합니다."""
+        completed = []
+        index = 0
+        length = len(chunk)
+        while index < length:
+            if self._string is not None:
+                index = self._consume_string(chunk, index, completed)
+                continue
+
+            char = chunk[index]
+            if self._literal is not None:
+                if char in self._LITERAL_CHARS:
+                    self._literal.append(char)
+                    index += 1
+                    continue
+                self._finish_value(json.loads("".join(self._literal)), completed)
+                self._literal = None
+
+            index += 1
+            if char in " \t\r\n,:":
+                # 구분자는 컨테이너 종류로 다음 토큰(key/value)을 알 수 있으므로 건너뜀
+                continue
+            if char == '"':
+                self._string = []
+                self._string_is_key = self._expect_key
+                if not self._string_is_key:
+                    self._attach("")
+            elif char in "{[":
+                container = {} if char == "{" else []
+                self._attach(container)
+                self._stack.append([container, None])
+                self._expect_key = char == "{"
+            elif char in "}]":
+                if not self._stack:
+                    raise ValueError(f"예상하지 못한 '{char}'")
+                container, _ = self._stack.pop()
+                self._finish_value(container, completed, attached=True)
+            else:
+                self._literal = [char]
+        return completed
+
+    def _consume_string(self, chunk: str, index: int, completed: list) -> int:
+        if self._escape is not None:
+            return self._consume_escape(chunk, index)
+        match = self._STRING_STOP.search(chunk, index)
+        stop = len(chunk) if match is None else match.start()
+        if stop > index:
+            # escape가 없는 부분은 JSON 원문과 디코딩 결과가 같음 (strict=False)
+            self._append_text(chunk[index:stop])
+        if match is None:
+            return stop
+        if match.group() == "\\":
+            self._escape = ""
+            return match.end()
+
+        self._flush_surrogate()
+        text = "".join(self._string)
+        self._string = None
+        self._string_changed = False
+        if self._string_is_key:
+            self._stack[-1][1] = text
+            self._expect_key = False
+        else:
+            self._set_current(text)
+            self._finish_value(text, completed, attached=True)
+        return match.end()
+
+    def _consume_escape(self, chunk: str, index: int) -> int:
+        """'\\' 뒤의 escape 문자(\\uXXXX는 5자)를 모아 완성되면 디코딩합니다."""
+        escape = self._escape + chunk[index : index + 5 - len(self._escape)]
+        escape = escape[: 5 if escape[0] == "u" else 1]
+        end = index + len(escape) - len(self._escape)
+        if escape[0] == "u" and len(escape) < 5:
+            self._escape = escape
+            return end
+        self._escape = None
+
+        sequence = "\\" + escape
+        if self._surrogate is not None:
+            text = json.loads(f'"{self._surrogate}{sequence}"')
+            self._surrogate = None
+            if len(text) == 1:
+                # 서로게이트 쌍 (이모지 등)
+                self._append_text(text)
+                return end
+            self._append_text(text[0])
+        text = json.loads(f'"{sequence}"')
+        if "\ud800" <= text <= "\udbff":
+            # 뒤쪽 서로게이트가 올 때까지 보류 (받은 부분 노출에서도 제외)
+            self._surrogate = sequence
+        else:
+            self._append_text(text)
+        return end
+
+    def _append_text(self, text: str):
+        self._flush_surrogate()
+        self._string.append(text)
+        self._string_changed = not self._string_is_key
+
+    def _flush_surrogate(self):
+        # 짝 없이 끝난 서로게이트는 json.loads와 같이 그대로 둠
+        if self._surrogate is not None:
+            self._string.append(json.loads(f'"{self._surrogate}"'))
+            self._surrogate = None
+
+    def _attach(self, value):
+        """새 값을 현재 컨테이너에 추가합니다 (컨테이너/문자열은 이후 채워짐)."""
+        if not self._stack:
+            self._value = value
+            return
+        container, key = self._stack[-1]
+        if isinstance(container, dict):
+            container[key] = value
+        else:
+            container.append(value)
+
+    def _set_current(self, value):
+        if not self._stack:
+            self._value = value
+            return
+        container, key = self._stack[-1]
+        if isinstance(container, dict):
+            container[key] = value
+        else:
+            container[-1] = value
+
+    def _finish_value(self, value, completed: list, attached: bool = False):
+        if not attached:
+            self._attach(value)
+        if not self._stack:
+            self.done = True
+            return
+        container, key = self._stack[-1]
+        if isinstance(container, dict):
+            if len(self._stack) == 1:
+                completed.append(key)
+            self._stack[-1][1] = None
+            self._expect_key = True
+        else:
+            self._expect_key = False
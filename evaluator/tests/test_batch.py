@@ -0,0 +1,106 @@
+import io
+import os
+import zipfile
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+from evaluator.batch import prepare_batch, record_from_job
+from evaluator.management.commands.run_evaluation_worker import run_job
+from evaluator.models import EvaluationBatch, EvaluationJob
+
+
+def resumes_zip(files: dict) -> SimpleUploadedFile:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, text in files.items():
+            archive.writestr(name, text)
+    return SimpleUploadedFile("resumes.zip", buffer.getvalue(), content_type="application/zip")
+
+
+@mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test"})
+class BatchCreateViewTests(TestCase):
+    def setUp(self):
+        staff = User.objects.create_user("ops", password="pw", is_staff=True)
+        self.client.force_login(staff)
+
+    def post(self):
+        data = {
+            "provider": "openai",
+            "jd": "Python 백엔드 개발자",
+            "resumes": resumes_zip({"a.txt": "Python Django 3년"}),
+        }
+        return self.client.post("/batch/", data)
+
+    # 파싱 스레드가 테스트 트랜잭션과 별도로 DB 캐시에 쓰지 않도록 파싱 캐시를 끔
+    @override_settings(DOCUMENT_CACHE={"ENABLED": False})
+    def test_upload_is_queued_and_prepared_by_worker(self):
+        response = self.post()
+        self.assertEqual(response.status_code, 202)
+        batch_id = response.json()["batch_id"]
+        # 요청 안에서는 파싱하지 않고 준비 작업만 등록
+        job = EvaluationJob.claim_next()
+        self.assertEqual(job.kind, EvaluationJob.Kind.PREPARE_BATCH)
+        self.assertTrue(self.client.get(f"/batch/{batch_id}/").json()["preparing"])
+
+        run_job(job)
+        status = self.client.get(f"/batch/{batch_id}/").json()
+        self.assertFalse(status["preparing"])
+        self.assertEqual(status["total"], 1)
+        self.assertEqual(status["counts"]["pending"], 1)
+        self.assertEqual(bytes(EvaluationBatch.objects.get(pk=batch_id).archive), b"")
+
+    def test_missing_similarity_dependency_is_reported(self):
+        error = ImportError("유사도 계산에는 numpy, scipy 패키지가 필요합니다")
+        batch_id = self.post().json()["batch_id"]
+        with mock.patch(
+            "evaluator.management.commands.run_evaluation_worker.prepare_batch",
+            side_effect=error,
+        ):
+            run_job(EvaluationJob.claim_next())
+        status = self.client.get(f"/batch/{batch_id}/").json()
+        self.assertTrue(status["finished"])
+        self.assertIn("numpy", status["error"])
+        self.assertEqual(status["total"], 0)
+
+
+@mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test"})
+@override_settings(DOCUMENT_CACHE={"ENABLED": False})
+class PrepareBatchTests(TestCase):
+    def prepare(self):
+        source = resumes_zip({"a.txt": "Python Django 3년"})
+        return prepare_batch("Python 백엔드 개발자", source, "openai", "gpt", "system")[0]
+
+    def test_keyword_hints_change_cache_key(self):
+        # 힌트가 사용자 메시지에 들어가므로 설정을 바꾸면 이전 결과를 재사용하지 않음
+        with override_settings(KEYWORD_MATCH={"ENABLED": True, "HINTS": False}):
+            plain = self.prepare()
+        with override_settings(KEYWORD_MATCH={"ENABLED": True, "HINTS": True}):
+            hinted = self.prepare()
+        self.assertNotEqual(plain.user_message, hinted.user_message)
+        self.assertNotEqual(plain.cache_key, hinted.cache_key)
+
+
+class RecordFromJobTests(TestCase):
+    def make_job(self, **fields) -> EvaluationJob:
+        return EvaluationJob(
+            ip_address="127.0.0.1",
+            provider="openai",
+            name="a.txt",
+            status=EvaluationJob.Status.SUCCEEDED,
+            **fields,
+        )
+
+    def test_triage_job(self):
+        job = self.make_job(result="빠른 평가 45점", score=45, stage=EvaluationJob.Stage.TRIAGE)
+        record = record_from_job(job, "gpt")
+        self.assertEqual(record["stage"], "triage")
+        self.assertEqual(record["score"], 45)
+
+    def test_full_analysis_without_parseable_score(self):
+        job = self.make_job(result="분석 결과 (점수 없음)", score=None)
+        record = record_from_job(job, "gpt")
+        self.assertEqual(record["stage"], "full")
+        self.assertIsNone(record["score"])
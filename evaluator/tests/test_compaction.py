@@ -0,0 +1,54 @@
+from django.test import SimpleTestCase, override_settings
+
+from evaluator.compaction import compact_inputs, remove_overlap, strip_page_artifacts
+from evaluator.file_parser import PAGE_BREAK
+
+
+class RemoveOverlapTests(SimpleTestCase):
+    RESUME = "2019.03 ~ 2021.05 ABC Corp 백엔드 개발\n결제 API 응답시간 40% 개선"
+
+    def test_keeps_lines_that_differ_only_by_numbers(self):
+        career = "2021.06 ~ 2023.01 ABC Corp 백엔드 개발\n결제 API 응답시간 75% 개선"
+        self.assertEqual(remove_overlap(career, self.RESUME), career)
+
+    def test_removes_identical_lines(self):
+        career = "2019.03  ~ 2021.05 abc corp 백엔드 개발\n주문 시스템 MSA 전환 주도"
+        self.assertEqual(remove_overlap(career, self.RESUME), "주문 시스템 MSA 전환 주도")
+
+
+class StripPageArtifactsTests(SimpleTestCase):
+    def test_single_page_text_is_untouched(self):
+        text = "모집 인원\n3\n경력\n5"
+        self.assertEqual(strip_page_artifacts(text), text)
+
+    def test_removes_repeated_headers_and_page_numbers(self):
+        pages = [
+            f"홍길동 이력서\n{index}쪽 첫 줄\n모집 인원\n3\n{index}쪽 본문\n{index}쪽 끝 줄\n{index} / 3"
+            for index in range(1, 4)
+        ]
+        cleaned = strip_page_artifacts(PAGE_BREAK.join(pages))
+        self.assertNotIn("홍길동 이력서", cleaned)
+        self.assertNotIn("/ 3", cleaned)
+        # 페이지 중간의 숫자 줄은 본문으로 남김
+        self.assertEqual(cleaned.count("모집 인원\n3\n"), 3)
+
+    def test_keeps_numbered_content_lines_at_page_edges(self):
+        # 페이지마다 숫자만 다른 경력·성과 줄은 머리글/바닥글이 아님
+        pages = [
+            f"20{10 + index}.03 - 20{12 + index}.05 ABC Corp 백엔드 개발\n"
+            f"주문 시스템 개선\n"
+            f"결제 API 응답시간 {index * 20}% 개선\n"
+            f"{index} / 3"
+            for index in range(1, 4)
+        ]
+        cleaned = strip_page_artifacts(PAGE_BREAK.join(pages))
+        for index in range(1, 4):
+            self.assertIn(f"20{10 + index}.03 - 20{12 + index}.05 ABC Corp", cleaned)
+            self.assertIn(f"응답시간 {index * 20}% 개선", cleaned)
+        self.assertNotIn("/ 3", cleaned)
+
+    @override_settings(INPUT_COMPACTION={"ENABLED": True})
+    def test_job_description_keeps_bare_numbers(self):
+        jd = "모집 인원\n3\n경력\n5"
+        result = compact_inputs(jd, "이력서 본문", provider="openai")
+        self.assertEqual(result.jd, jd)
@@ -0,0 +1,70 @@
+import os
+from datetime import timedelta
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from evaluator.document_cache import cache_key, evict, parse_file_cached
+from evaluator.models import ParsedDocument
+
+MARKDOWN = "# 이력서\n\n**Python** 3년".encode()
+
+
+@override_settings(DOCUMENT_CACHE={"ENABLED": True, "MAX_ENTRIES": 100})
+class DocumentCacheKeyTests(TestCase):
+    def test_same_bytes_as_markdown_and_text_are_cached_separately(self):
+        markdown = parse_file_cached(SimpleUploadedFile("resume.md", MARKDOWN))
+        text = parse_file_cached(SimpleUploadedFile("resume.txt", MARKDOWN))
+        self.assertEqual(ParsedDocument.objects.count(), 2)
+        # 다시 올려도 서로의 항목을 덮어쓰지 않고 각자의 결과를 반환
+        self.assertEqual(parse_file_cached(SimpleUploadedFile("resume.md", MARKDOWN)), markdown)
+        self.assertEqual(parse_file_cached(SimpleUploadedFile("resume.txt", MARKDOWN)), text)
+        self.assertEqual(ParsedDocument.objects.count(), 2)
+
+    def test_pdf_key_depends_on_limits(self):
+        key = cache_key("abc", "pdf")
+        with mock.patch.dict(os.environ, {"PDF_MAX_CHARS": "1000"}):
+            self.assertNotEqual(cache_key("abc", "pdf"), key)
+        with mock.patch.dict(os.environ, {"PDF_MAX_PAGES": "5"}):
+            self.assertNotEqual(cache_key("abc", "pdf"), key)
+        # 추출 결과와 무관한 설정은 키에 영향을 주지 않음
+        with mock.patch.dict(os.environ, {"PDF_WORKERS": "1"}):
+            self.assertEqual(cache_key("abc", "pdf"), key)
+        self.assertEqual(cache_key("abc", "txt"), cache_key("abc", "txt"))
+        self.assertNotEqual(cache_key("abc", "txt"), cache_key("abc", "md"))
+
+
+class EvictTests(TestCase):
+    def store(self, key: str, text: str, age: int):
+        ParsedDocument.objects.create(
+            key=key,
+            kind="txt",
+            parser_version="1",
+            text=text,
+            last_accessed_at=timezone.now() - timedelta(minutes=age),
+        )
+
+    def remaining(self) -> set:
+        return set(ParsedDocument.objects.values_list("key", flat=True))
+
+    def test_evicts_oldest_entries_over_text_budget(self):
+        self.store("old", "a" * 400, age=3)
+        self.store("mid", "b" * 400, age=2)
+        self.store("new", "c" * 400, age=1)
+        # 항목 수는 여유가 있어도 텍스트 총량이 예산을 넘으면 오래된 항목부터 제거
+        self.assertEqual(evict(max_entries=10, max_chars=1000), 1)
+        self.assertEqual(self.remaining(), {"mid", "new"})
+
+    def test_keeps_most_recent_entry_larger_than_budget(self):
+        self.store("old", "a" * 10, age=2)
+        self.store("new", "b" * 500, age=1)
+        evict(max_entries=10, max_chars=100)
+        self.assertEqual(self.remaining(), {"new"})
+
+    def test_entry_count_limit(self):
+        for age in range(3):
+            self.store(f"doc{age}", "x", age=age)
+        evict(max_entries=2)
+        self.assertEqual(self.remaining(), {"doc0", "doc1"})
@@ -0,0 +1,87 @@
+import os
+import signal
+import tempfile
+from pathlib import Path
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+
+from evaluator import file_parser
+from evaluator.file_parser import PDFLimitError, parse_pdf
+
+
+def write_pdf(path: Path, pages: int):
+    import fitz  # PyMuPDF
+
+    doc = fitz.open()
+    for number in range(1, pages + 1):
+        doc.new_page().insert_text((72, 72), f"page {number} Python Django")
+    doc.save(path)
+    doc.close()
+
+
+class ParsePdfTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.pdf_path = Path(cls.directory.name) / "resume.pdf"
+        write_pdf(cls.pdf_path, pages=3)
+
+    @classmethod
+    def tearDownClass(cls):
+        # 추출 워커를 종료해 테스트 프로세스에 남기지 않음
+        file_parser.shutdown_workers()
+        cls.directory.cleanup()
+        super().tearDownClass()
+
+    def test_empty_file_is_rejected(self):
+        with tempfile.TemporaryFile() as empty:
+            with self.assertRaisesMessage(ValueError, "비어 있습니다"):
+                parse_pdf(empty)
+
+    def test_extracts_in_pool_when_time_limited(self):
+        text = parse_pdf(self.pdf_path, timeout=30)
+        self.assertEqual(text.count(file_parser.PAGE_BREAK), 2)
+        self.assertIn("page 3 Python", text)
+
+    def test_without_time_limit_matches_pool_output(self):
+        self.assertEqual(
+            parse_pdf(self.pdf_path, timeout=0), parse_pdf(self.pdf_path, timeout=30)
+        )
+
+    def stopped_workers(self, count: int) -> list:
+        """쉬는 추출 워커 count개를 만들고 SIGSTOP으로 멈춰 추출 중 멈춘 PDF를 흉내냅니다."""
+        file_parser.shutdown_workers()
+        parse_pdf(self.pdf_path, timeout=30, workers=count, parallel_min_pages=1)
+        workers = list(file_parser._idle_workers)
+        self.assertEqual(len(workers), count)
+        for worker in workers:
+            os.kill(worker.process.pid, signal.SIGSTOP)
+        return workers
+
+    def test_timeout_kills_worker_and_recovers(self):
+        # 문서 열기(페이지 수 확인)부터 워커에서 실행되므로 여기서 멈춰도 제한 시간이 적용됨
+        (worker,) = self.stopped_workers(1)
+        with self.assertRaises(PDFLimitError):
+            parse_pdf(self.pdf_path, timeout=0.5, workers=1)
+        self.assertFalse(worker.process.is_alive())
+        self.assertIn("page 1 Python", parse_pdf(self.pdf_path, timeout=30))
+
+    def test_timeout_only_kills_its_own_worker(self):
+        workers = self.stopped_workers(2)
+        with self.assertRaises(PDFLimitError):
+            parse_pdf(self.pdf_path, timeout=0.5, workers=2)
+        alive = [worker for worker in workers if worker.process.is_alive()]
+        self.assertEqual(len(alive), 1)
+        # 다른 워커는 그대로 남아 다음 요청을 처리
+        os.kill(alive[0].process.pid, signal.SIGCONT)
+        self.assertEqual(file_parser._idle_workers, alive)
+        self.assertIn("page 1 Python", parse_pdf(self.pdf_path, timeout=30, workers=1))
+
+    def test_in_memory_upload(self):
+        data = self.pdf_path.read_bytes()
+        upload = SimpleUploadedFile("resume.pdf", data, content_type="application/pdf")
+        self.assertEqual(
+            parse_pdf(upload, timeout=30), parse_pdf(self.pdf_path, timeout=0)
+        )
@@ -0,0 +1,35 @@
+from django.test import SimpleTestCase
+
+from evaluator.keyword_match import extract_requirements, get_alias_index, match_keywords
+
+
+def skills(text: str) -> set[str]:
+    return get_alias_index().skills(text)
+
+
+class AliasIndexTests(SimpleTestCase):
+    def test_alias_ending_like_a_particle(self):
+        self.assertIn("TensorFlow", skills("텐서플로를 사용한 모델 서빙"))
+        self.assertIn("TensorFlow", skills("텐서플로 2.x"))
+
+    def test_particles_are_stripped_from_text(self):
+        self.assertEqual(skills("파이썬으로 개발하고 쿠버네티스를 운영"), {"Python", "Kubernetes"})
+        self.assertIn("React Native", skills("리액트 네이티브로 앱 개발"))
+
+    def test_common_words_are_not_skills(self):
+        self.assertEqual(skills("spring festival by express train, swift ml node"), set())
+
+    def test_common_words_with_casing_or_context(self):
+        self.assertEqual(skills("Spring, Express 기반 API"), {"Spring", "Express"})
+        self.assertEqual(skills("ML 모델 운영"), {"Machine Learning"})
+        self.assertEqual(skills("python, spring, mysql"), {"Python", "Spring", "MySQL"})
+
+    def test_spring_boot_implies_spring(self):
+        self.assertEqual(skills("스프링부트로 결제 서버 개발"), {"Spring Boot", "Spring"})
+
+    def test_implied_skill_satisfies_requirement(self):
+        jd = "자격요건\n- Java, Spring 경험"
+        self.assertEqual(extract_requirements(jd), {"Java": "High", "Spring": "High"})
+        result = match_keywords(jd, "Java와 Spring Boot로 주문 시스템 개발")
+        self.assertEqual(result.score, 100)
+        self.assertEqual(result.missing, [])
@@ -0,0 +1,29 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+
+def metrics_settings(token: str = "") -> dict:
+    return {"ENABLED": True, "SERVER_TIMING": False, "TOKEN": token}
+
+
+@override_settings(DEBUG=False)
+class MetricsViewTests(TestCase):
+    def test_locked_without_token_in_production(self):
+        with self.settings(METRICS=metrics_settings()):
+            self.assertEqual(self.client.get("/metrics").status_code, 401)
+
+    def test_open_in_debug_without_token(self):
+        with self.settings(METRICS=metrics_settings(), DEBUG=True):
+            self.assertEqual(self.client.get("/metrics").status_code, 200)
+
+    def test_bearer_token(self):
+        with self.settings(METRICS=metrics_settings("secret")):
+            self.assertEqual(self.client.get("/metrics").status_code, 401)
+            response = self.client.get("/metrics", headers={"Authorization": "Bearer secret"})
+            self.assertEqual(response.status_code, 200)
+
+    def test_staff_user(self):
+        staff = User.objects.create_user("ops", password="pw", is_staff=True)
+        self.client.force_login(staff)
+        with self.settings(METRICS=metrics_settings("secret")):
+            self.assertEqual(self.client.get("/metrics").status_code, 200)
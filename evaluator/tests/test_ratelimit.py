@@ -0,0 +1,152 @@
+import os
+from unittest import mock
+
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import AsyncClient, TestCase
+
+from evaluator.models import RateLimitCounter, RequestLog
+from evaluator.ratelimit import CacheRateLimiter, DatabaseCounterRateLimiter
+
+IP = "10.0.0.1"
+
+
+def make_limiter(daily_limit: int = 3) -> DatabaseCounterRateLimiter:
+    # 기록 스레드가 테스트 도중 저장하지 않도록 주기를 길게 두고 flush()로 직접 저장
+    return DatabaseCounterRateLimiter(daily_limit=daily_limit, flush_interval=3600)
+
+
+class DatabaseCounterRateLimiterTests(TestCase):
+    """웹 프로세스와 분석 워커처럼 서로 다른 인스턴스가 같은 한도를 공유하는지 확인."""
+
+    def setUp(self):
+        # 남은 횟수 캐시가 테스트 사이에 남지 않도록 비움
+        caches["default"].clear()
+
+    def test_acquire_is_shared_between_instances(self):
+        web, worker = make_limiter(), make_limiter()
+        self.assertTrue(web.acquire(IP))
+        self.assertTrue(worker.acquire(IP))
+        self.assertTrue(web.acquire(IP))
+        self.assertFalse(worker.acquire(IP))
+        self.assertFalse(web.acquire(IP))
+        self.assertEqual(web.remaining(IP), 0)
+        self.assertEqual(worker.get_usage(IP), 3)
+
+    def test_release_from_other_instance_returns_slot(self):
+        web, worker = make_limiter(daily_limit=1), make_limiter(daily_limit=1)
+        self.assertTrue(web.acquire(IP))
+        self.assertFalse(web.acquire(IP))
+        # 웹 프로세스가 예약한 작업을 분석 워커가 실패 처리
+        worker.release(IP)
+        self.assertEqual(web.remaining(IP), 1)
+        self.assertTrue(web.acquire(IP))
+
+    def test_release_does_not_go_below_zero(self):
+        limiter = make_limiter()
+        limiter.acquire(IP)
+        limiter.release(IP)
+        limiter.release(IP)
+        self.assertEqual(limiter.get_usage(IP), 0)
+
+    def test_commit_keeps_reservation_and_logs_request(self):
+        web, worker = make_limiter(daily_limit=2), make_limiter(daily_limit=2)
+        self.assertTrue(web.acquire(IP))
+        worker.commit(IP)
+        self.assertEqual(worker.writer.flush(), 1)
+        self.assertEqual(RequestLog.get_today_count(IP), 1)
+        self.assertEqual(web.get_usage(IP), 1)
+        self.assertEqual(web.remaining(IP), 1)
+
+    def test_counter_starts_from_todays_request_log(self):
+        RequestLog.log_request(IP)
+        RequestLog.log_request(IP)
+        limiter = make_limiter()
+        self.assertEqual(limiter.get_usage(IP), 2)
+        self.assertTrue(limiter.acquire(IP))
+        self.assertFalse(make_limiter().acquire(IP))
+        self.assertEqual(RateLimitCounter.objects.get(ip_address=IP).count, 3)
+
+    def test_page_view_usage_is_served_from_cache(self):
+        limiter = make_limiter()
+        limiter.acquire(IP)
+        self.assertEqual(limiter.get_usage(IP), 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(limiter.remaining(IP), 2)
+        # 같은 프로세스의 반환은 바로 반영
+        limiter.release(IP)
+        self.assertEqual(limiter.remaining(IP), 3)
+
+    def test_ips_are_counted_separately(self):
+        limiter = make_limiter(daily_limit=1)
+        self.assertTrue(limiter.acquire(IP))
+        self.assertTrue(limiter.acquire("10.0.0.2"))
+
+
+class CacheRateLimiterTests(TestCase):
+    def test_refuses_process_local_cache(self):
+        with self.assertRaises(ImproperlyConfigured):
+            CacheRateLimiter(daily_limit=3)
+
+    def test_process_local_cache_allowed_explicitly(self):
+        limiter = CacheRateLimiter(daily_limit=1, flush_interval=3600, allow_local_cache=True)
+        limiter.cache.clear()
+        self.assertTrue(limiter.acquire(IP))
+        self.assertFalse(limiter.acquire(IP))
+        limiter.release(IP)
+        self.assertTrue(limiter.acquire(IP))
+
+
+@mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test"})
+class QuotaAfterCacheTests(TestCase):
+    """한도에 도달한 사용자도 캐시된 결과(한도 미사용)는 받을 수 있어야 함."""
+
+    def post(self):
+        resume = SimpleUploadedFile("resume.txt", "Python Django 3년".encode())
+        data = {"provider": "openai", "jd": "Python 백엔드 개발자", "resume": resume}
+        return self.client.post("/jobs/", data)
+
+    def exhausted(self):
+        return mock.patch(
+            "evaluator.views.get_rate_limiter", return_value=make_limiter(daily_limit=0)
+        )
+
+    def test_cached_result_is_served_at_limit(self):
+        with self.exhausted(), mock.patch(
+            "evaluator.views.aget_cached_result", return_value="## 캐시된 결과"
+        ):
+            response = self.post()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "succeeded")
+
+    def test_cache_miss_is_limited(self):
+        with self.exhausted(), mock.patch(
+            "evaluator.views.aget_cached_result", return_value=None
+        ):
+            response = self.post()
+        self.assertEqual(response.status_code, 429)
+
+
+class FailingStreamClient:
+    served_provider = served_model = None
+
+    async def stream(self, *args):
+        raise RuntimeError("provider down")
+        yield
+
+
+@mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test"})
+class StreamReleaseTests(TestCase):
+    async def test_failed_async_stream_releases_reservation(self):
+        limiter = make_limiter()
+        caches["default"].clear()
+        resume = SimpleUploadedFile("resume.txt", "Python Django 3년".encode())
+        data = {"provider": "openai", "jd": "Python 백엔드 개발자", "resume": resume}
+        with mock.patch("evaluator.views.get_rate_limiter", return_value=limiter), mock.patch(
+            "evaluator.views.get_async_client", return_value=FailingStreamClient()
+        ), mock.patch("evaluator.views.should_triage", return_value=False):
+            response = await AsyncClient().post("/stream/", data)
+            body = b"".join([chunk async for chunk in response.streaming_content])
+        self.assertIn(b"event: error", body)
+        self.assertEqual(await limiter.aremaining("127.0.0.1"), 3)
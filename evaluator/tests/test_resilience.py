@@ -0,0 +1,118 @@
+import asyncio
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+import llm_client
+from llm_client import (
+    AsyncMultiProviderClient,
+    CircuitBreaker,
+    LatencyTracker,
+    LLMClient,
+    MultiProviderClient,
+    ResilientClient,
+)
+
+
+class StatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class StubClient(LLMClient):
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    def generate(self, system_prompt, user_message, response_schema=None):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+def half_open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    return breaker
+
+
+class ResilientClientTests(SimpleTestCase):
+    def run_generate(self, outcomes: dict, breakers: dict, failover: bool = True):
+        with (
+            mock.patch.object(
+                llm_client.registry,
+                "get",
+                side_effect=lambda provider, model: StubClient(outcomes[provider]),
+            ),
+            mock.patch.object(llm_client, "get_circuit_breaker", breakers.__getitem__),
+            mock.patch.object(llm_client, "available_providers", lambda: list(outcomes)),
+        ):
+            client = ResilientClient("claude", failover=failover)
+            return client, client.generate("system", "user")
+
+    def test_non_retryable_error_leaves_half_open_breaker(self):
+        breaker = half_open_breaker()
+        with self.assertRaises(StatusError):
+            self.run_generate({"claude": StatusError(400)}, {"claude": breaker}, failover=False)
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        # 탐색 요청은 끝났으므로 다음 요청이 다시 탐색할 수 있음
+        self.assertTrue(breaker.allow_request())
+
+    def test_reports_failover_provider(self):
+        breakers = {"claude": half_open_breaker(), "openai": CircuitBreaker()}
+        breakers["claude"].state = CircuitBreaker.OPEN
+        breakers["claude"].reset_timeout = 60
+        client, result = self.run_generate({"claude": "a", "openai": "b"}, breakers)
+        self.assertEqual(result, "b")
+        self.assertEqual(client.served_provider, "openai")
+        self.assertEqual(client.served_model, llm_client.get_default_model("openai"))
+
+    def test_reports_requested_provider(self):
+        breakers = {"claude": CircuitBreaker(), "openai": CircuitBreaker()}
+        client, _ = self.run_generate({"claude": "a", "openai": "b"}, breakers)
+        self.assertEqual((client.served_provider, client.served_model), ("claude", client.model))
+
+
+class HedgeLatencyTests(SimpleTestCase):
+    def test_cancelled_hedge_is_recorded_as_lower_bound(self):
+        class SlowOrFast:
+            def __init__(self, provider, failover=False):
+                self.delay = 5.0 if provider == "claude" else 0.05
+
+            async def generate(self, system_prompt, user_message, response_schema=None):
+                await asyncio.sleep(self.delay)
+                return f"slept {self.delay}"
+
+        tracker = LatencyTracker()
+        client = AsyncMultiProviderClient(
+            providers=["claude", "openai"], hedge_delay=0.05, tracker=tracker
+        )
+        with mock.patch.object(llm_client, "AsyncResilientClient", SlowOrFast):
+            result = asyncio.run(client.generate("system", "user"))
+
+        self.assertEqual(result, "slept 0.05")
+        self.assertEqual(client.served_provider, "openai")
+        self.assertGreaterEqual(tracker.percentile("openai", 0.5), 0.05)
+        # 취소된 primary도 취소 시점(약 0.1초)까지의 시간으로 기록됨
+        self.assertGreaterEqual(tracker.percentile("claude", 0.5), 0.09)
+
+    def test_sync_hedge_reports_winning_provider(self):
+        class FailingPrimary:
+            def __init__(self, provider, failover=False):
+                self.provider = provider
+
+            def generate(self, system_prompt, user_message, response_schema=None):
+                if self.provider == "claude":
+                    raise StatusError(529)
+                return "backup"
+
+        client = MultiProviderClient(
+            providers=["claude", "openai"], hedge_delay=5.0, tracker=LatencyTracker()
+        )
+        with mock.patch.object(llm_client, "ResilientClient", FailingPrimary):
+            result = client.generate("system", "user")
+
+        self.assertEqual(result, "backup")
+        # 백업 provider의 응답을 요청한 provider의 캐시 키와 표시로 저장하지 않도록 기록
+        self.assertEqual(client.served_provider, "openai")
+        self.assertEqual(client.served_model, llm_client.DEFAULT_MODELS["openai"])
@@ -0,0 +1,44 @@
+import json
+
+from django.test import SimpleTestCase
+
+from evaluator.structured import IncrementalJSONParser
+
+DOCUMENT = {
+    "scores": {"total": 87, "detail": [1, 2.5, True, None]},
+    "comment": '줄\n바꿈 "따옴표" \\ 탭\t 😀 끝',
+    "questions": ["a", "😀😀"],
+}
+
+
+def feed_in_chunks(raw: str, size: int) -> IncrementalJSONParser:
+    parser = IncrementalJSONParser()
+    for start in range(0, len(raw), size):
+        parser.feed(raw[start : start + size])
+        parser.value  # 진행 중인 문자열 노출도 매번 거치도록 함
+    return parser
+
+
+class IncrementalJSONParserTests(SimpleTestCase):
+    def test_matches_json_loads_for_any_chunking(self):
+        for ensure_ascii in (True, False):
+            raw = json.dumps(DOCUMENT, ensure_ascii=ensure_ascii)
+            for size in (1, 2, 3, 7):
+                parser = feed_in_chunks(raw, size)
+                self.assertTrue(parser.done)
+                self.assertEqual(parser.value, DOCUMENT)
+
+    def test_partial_string_excludes_cut_escapes(self):
+        parser = IncrementalJSONParser()
+        parser.feed('{"comment": "hel\\u00')
+        self.assertEqual(parser.value, {"comment": "hel"})
+        # 서로게이트 쌍의 앞쪽만 받은 경우 뒤쪽이 올 때까지 노출하지 않음
+        parser.feed("e9lo \\ud83d")
+        self.assertEqual(parser.value, {"comment": "helélo "})
+        parser.feed("\\ude00 끝")
+        self.assertEqual(parser.value, {"comment": "helélo 😀 끝"})
+
+    def test_reports_completed_top_level_fields(self):
+        parser = IncrementalJSONParser()
+        self.assertEqual(parser.feed('{"scores": {"total": 87}, "comment": "a'), ["scores"])
+        self.assertEqual(parser.feed('bc"}'), ["comment"])
@@ -0,0 +1,83 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from evaluator.management.commands.run_evaluation_worker import run_job
+from evaluator.models import EvaluationJob
+
+WORKER = "evaluator.management.commands.run_evaluation_worker"
+
+LEASE = timedelta(seconds=60)
+
+
+class JobLeaseTests(TestCase):
+    def claim(self) -> EvaluationJob:
+        EvaluationJob.objects.create(ip_address="127.0.0.1", provider="openai", user_message="m")
+        return EvaluationJob.claim_next()
+
+    def age(self, job: EvaluationJob, seconds: int):
+        EvaluationJob.objects.filter(pk=job.pk).update(
+            heartbeat_at=timezone.now() - timedelta(seconds=seconds)
+        )
+
+    def test_long_running_job_with_heartbeat_is_kept(self):
+        job = self.claim()
+        # 시작한 지 오래됐어도 하트비트가 갱신되고 있으면 다른 워커가 가져가지 않음
+        EvaluationJob.objects.filter(pk=job.pk).update(
+            started_at=timezone.now() - timedelta(hours=1)
+        )
+        self.age(job, 120)
+        self.assertEqual(EvaluationJob.heartbeat([job.pk]), 1)
+        self.assertEqual(EvaluationJob.requeue_stale(LEASE), 0)
+        job.refresh_from_db()
+        self.assertEqual(job.status, EvaluationJob.Status.RUNNING)
+
+    def test_expired_lease_is_requeued(self):
+        job = self.claim()
+        self.age(job, 120)
+        self.assertEqual(EvaluationJob.requeue_stale(LEASE), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, EvaluationJob.Status.PENDING)
+        self.assertIsNone(job.heartbeat_at)
+        self.assertEqual(EvaluationJob.claim_next().pk, job.pk)
+
+
+class StubClient:
+    served_provider = None
+    served_model = None
+
+    def generate(self, system_prompt, user_message, response_schema=None):
+        return "## 종합 평가\n총점: 80점"
+
+
+class RunJobTests(TestCase):
+    def run_with(self, **patches):
+        EvaluationJob.objects.create(
+            ip_address="127.0.0.1", provider="openai", user_message="m", cache_key="k" * 64
+        )
+        job = EvaluationJob.claim_next()
+        limiter = mock.Mock()
+        with mock.patch(f"{WORKER}.get_rate_limiter", return_value=limiter), mock.patch(
+            "llm_client.get_client", return_value=StubClient()
+        ), mock.patch(f"{WORKER}.output_options", return_value=("system", None)), mock.patch(
+            f"{WORKER}.set_cached_result", **patches
+        ):
+            run_job(job)
+        job.refresh_from_db()
+        return job, limiter
+
+    def test_success_commits_quota_and_caches(self):
+        job, limiter = self.run_with()
+        self.assertEqual(job.status, EvaluationJob.Status.SUCCEEDED)
+        limiter.commit.assert_called_once_with("127.0.0.1")
+        limiter.release.assert_not_called()
+
+    def test_cache_failure_does_not_fail_job(self):
+        # 결과 캐시 저장이 실패해도 완료된 작업과 사용한 요청 한도는 그대로 유지
+        with self.assertLogs(WORKER, "ERROR"):
+            job, limiter = self.run_with(side_effect=RuntimeError("cache down"))
+        self.assertEqual(job.status, EvaluationJob.Status.SUCCEEDED)
+        limiter.commit.assert_called_once_with("127.0.0.1")
+        limiter.release.assert_not_called()
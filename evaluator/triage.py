@@ -0,0 +1,180 @@
+"""Two-stage evaluation: quick triage with a small model before the full analysis.
+
+소형 모델(gpt-4o-mini 등)이 JD 핵심 요구사항을 추출하고 대략적인 적합도 점수를 먼저
+매깁니다. 점수가 기준(THRESHOLD) 이상이거나 사용자가 상세 분석을 요청한 경우에만 큰 모델로
+전체 분석을 실행하므로, 배치 선별 시 지연과 토큰 비용이 크게 줄어듭니다.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+
+from .result_cache import (
+    aget_cached_result,
+    aset_cached_result,
+    get_cached_result,
+    make_cache_key,
+    set_cached_result,
+)
+from .structured import IMPORTANCE, VERDICTS, object_schema, table_cell
+
+TRIAGE_PROMPT_PATH = Path(__file__).resolve().parent.parent / "prompt" / "triage.md"
+
+TRIAGE_SCHEMA = {
+    "name": "record_triage",
+    "description": "JD-이력서 1차 선별 결과를 기록합니다.",
+    "schema": object_schema(
+        {
+            "requirements": {
+                "type": "array",
+                "description": "JD 핵심 요구사항 (최대 8개)",
+                "items": object_schema(
+                    {
+                        "requirement": {"type": "string"},
+                        "importance": {"type": "string", "enum": list(IMPORTANCE)},
+                        "verdict": {"type": "string", "enum": list(VERDICTS)},
+                    }
+                ),
+            },
+            "fit_score": {"type": "integer", "description": "대략적인 적합도 (0~100)"},
+            "summary": {"type": "string", "description": "판단 근거 요약 (1~2문장)"},
+        }
+    ),
+}
+
+
+def get_config() -> dict:
+    """settings.TRIAGE 값을 기본값과 합쳐 반환합니다."""
+    config = {"ENABLED": False, "THRESHOLD": 60}
+    config.update(getattr(settings, "TRIAGE", {}))
+    return config
+
+
+@lru_cache(maxsize=1)
+def load_triage_prompt() -> str:
+    return TRIAGE_PROMPT_PATH.read_text(encoding="utf-8")
+
+
+@dataclass
+class TriageResult:
+    """소형 모델의 1차 평가 결과."""
+
+    score: int
+    summary: str = ""
+    requirements: list = field(default_factory=list)
+    provider: str = ""
+    model: str = ""
+    cached: bool = False
+
+    @classmethod
+    def from_json(cls, text: str, provider: str, model: str, cached: bool = False):
+        """모델 응답(JSON)을 해석합니다.
+
+        Raises:
+            ValueError: 스키마에 맞지 않는 응답
+        """
+        data = json.loads(text, strict=False)
+        if not isinstance(data, dict) or not isinstance(data.get("fit_score"), int):
+            raise ValueError("1차 평가 응답을 해석할 수 없습니다.")
+        return cls(
+            score=max(0, min(100, data["fit_score"])),
+            summary=data.get("summary", ""),
+            requirements=data.get("requirements") or [],
+            provider=provider,
+            model=model,
+            cached=cached,
+        )
+
+    def passed(self, threshold: int = None) -> bool:
+        if threshold is None:
+            threshold = get_config()["THRESHOLD"]
+        return self.score >= threshold
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def to_markdown(self, threshold: int = None) -> str:
+        """1차 평가 결과를 마크다운으로 만듭니다 (상세 분석을 생략한 경우의 결과)."""
+        if threshold is None:
+            threshold = get_config()["THRESHOLD"]
+        lines = [
+            f"## 빠른 평가 ({self.model})",
+            "",
+            f"> - **빠른 적합도 점수**: {self.score}/100점",
+        ]
+        if self.summary:
+            lines.append(f"> - **요약**: {self.summary}")
+        lines.append("")
+        if self.requirements:
+            lines += ["| 핵심 요구사항 | 중요도 | 판정 |", "|---------------|--------|------|"]
+            for item in self.requirements:
+                lines.append(
+                    "| "
+                    + " | ".join(
+                        table_cell(item.get(name))
+                        for name in ("requirement", "importance", "verdict")
+                    )
+                    + " |"
+                )
+            lines.append("")
+        if not self.passed(threshold):
+            lines.append(
+                f"빠른 평가 점수가 상세 분석 기준({threshold}점) 미만이어서 상세 분석을 생략했습니다. "
+                "필요하면 '상세 분석 요청'을 선택해 다시 분석하세요."
+            )
+        return "\n".join(lines).strip()
+
+
+def should_triage(full_analysis: bool = False) -> bool:
+    """1차 평가를 거쳐야 하는 요청인지 반환합니다."""
+    return get_config()["ENABLED"] and not full_analysis
+
+
+def run_triage(provider: str, user_message: str, use_cache: bool = True) -> TriageResult:
+    """소형 모델로 1차 평가를 실행합니다 (결과는 분석 결과 캐시에 함께 저장).
+
+    입력은 상세 분석과 같은 user_message를 사용하므로 JD/이력서 압축을 다시 하지 않습니다.
+    """
+    from llm_client import get_client, get_triage_model
+
+    triage_provider, model = get_triage_model(provider)
+    system_prompt = load_triage_prompt()
+    cache_key = make_cache_key(triage_provider, model, system_prompt, user_message, "")
+
+    if use_cache:
+        cached = get_cached_result(cache_key)
+        if cached is not None:
+            return TriageResult.from_json(cached, triage_provider, model, cached=True)
+
+    result = get_client(triage_provider, model).generate(
+        system_prompt, user_message, TRIAGE_SCHEMA
+    )
+    triage = TriageResult.from_json(result, triage_provider, model)
+    set_cached_result(cache_key, triage_provider, model, result)
+    return triage
+
+
+async def arun_triage(
+    provider: str, user_message: str, use_cache: bool = True
+) -> TriageResult:
+    """run_triage()의 비동기 버전 (asyncio 네이티브 LLM 클라이언트 사용)."""
+    from llm_client import get_async_client, get_triage_model
+
+    triage_provider, model = get_triage_model(provider)
+    system_prompt = load_triage_prompt()
+    cache_key = make_cache_key(triage_provider, model, system_prompt, user_message, "")
+
+    if use_cache:
+        cached = await aget_cached_result(cache_key)
+        if cached is not None:
+            return TriageResult.from_json(cached, triage_provider, model, cached=True)
+
+    result = await get_async_client(triage_provider, model).generate(
+        system_prompt, user_message, TRIAGE_SCHEMA
+    )
+    triage = TriageResult.from_json(result, triage_provider, model)
+    await aset_cached_result(cache_key, triage_provider, model, result)
+    return triage
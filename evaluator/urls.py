@@ -2,10 +2,40 @@
 
 from django.urls import path
 
-from .views import EvaluationView
+from .views import (
+    BatchEvaluationCreateView,
+    BatchEvaluationResultsView,
+    BatchEvaluationStatusView,
+    EvaluationDetailView,
+    EvaluationJobCreateView,
+    EvaluationJobStatusView,
+    EvaluationStreamView,
+    EvaluationView,
+    MetricsView,
+)
 
 app_name = "evaluator"
 
 urlpatterns = [
     path("", EvaluationView.as_view(), name="index"),
+    path("stream/", EvaluationStreamView.as_view(), name="stream"),
+    path(
+        "e/<uuid:evaluation_id>/",
+        EvaluationDetailView.as_view(),
+        name="evaluation_detail",
+    ),
+    path("jobs/", EvaluationJobCreateView.as_view(), name="job_create"),
+    path("jobs/<uuid:job_id>/", EvaluationJobStatusView.as_view(), name="job_status"),
+    path("batch/", BatchEvaluationCreateView.as_view(), name="batch_create"),
+    path(
+        "batch/<uuid:batch_id>/",
+        BatchEvaluationStatusView.as_view(),
+        name="batch_status",
+    ),
+    path(
+        "batch/<uuid:batch_id>/results.jsonl",
+        BatchEvaluationResultsView.as_view(),
+        name="batch_results",
+    ),
+    path("metrics", MetricsView.as_view(), name="metrics"),
 ]
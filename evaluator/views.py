@@ -1,26 +1,84 @@
 """Views for the resume evaluator."""
 
+import asyncio
+import hashlib
+import hmac
+import json
 import os
-import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import F
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import render
+from django.template.loader import get_template, render_to_string
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from django.views import View
+from llm_client import (
+    acollect_stream_usage,
+    available_providers,
+    collect_stream_usage,
+    collect_usage,
+    fake_backend_enabled,
+    get_async_client,
+    get_client,
+    get_default_model,
+)
 
-from .forms import EvaluationForm
-from .file_parser import parse_file
-from .models import RequestLog
+from .batch import extract_total_score, record_from_job
+from .compaction import CompactionReport, compact_inputs
+from .document_cache import aparse_file_cached
+from .forms import BatchEvaluationForm, EvaluationForm
+from .keyword_match import KeywordMatch, match_keywords
+from .keyword_match import get_config as get_keyword_config
+from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from .metrics import atimed_stream, current_timings, registry, span, timed_stream
+from .metrics import get_config as get_metrics_config
+from .models import Evaluation, EvaluationBatch, EvaluationJob
+from .ratelimit import get_rate_limiter
+from .rendering import render_result_html
+from .result_cache import (
+    aget_cached_result,
+    aset_cached_result,
+    hash_text,
+    make_cache_key,
+    prompt_version,
+    set_cached_result,
+)
+from .structured import (
+    IncrementalJSONParser,
+    load_evaluation,
+    output_options,
+    parse_result,
+    render_markdown,
+    to_markdown,
+)
+from .triage import arun_triage
+from .triage import get_config as get_triage_config
+from .triage import run_triage, should_triage
 
 # 프로젝트 루트 디렉토리
 BASE_DIR = Path(__file__).resolve().parent.parent
 PROMPT_PATH = BASE_DIR / "prompt" / "prompt.md"
 
-# llm_client 모듈을 임포트할 수 있도록 경로 추가
-if str(BASE_DIR) not in sys.path:
-    sys.path.insert(0, str(BASE_DIR))
-
 # 일일 요청 제한
-DAILY_REQUEST_LIMIT = 3
+DAILY_REQUEST_LIMIT = settings.RATE_LIMIT["DAILY_LIMIT"]
+LIMIT_EXCEEDED_MESSAGE = (
+    f"오늘의 분석 요청 한도({DAILY_REQUEST_LIMIT}회)를 초과했습니다. 내일 다시 이용해주세요."
+)
 
 
 def get_client_ip(request) -> str:
@@ -33,13 +91,42 @@ def get_client_ip(request) -> str:
     return ip
 
 
+def get_permalink_config() -> dict:
+    """settings.PERMALINK 값을 기본값과 합쳐 반환합니다."""
+    config = {"ENABLED": True, "PRERENDER": True, "MAX_AGE": 300}
+    config.update(getattr(settings, "PERMALINK", {}))
+    return config
+
+
+@lru_cache(maxsize=1)
+def permalink_page_version() -> str:
+    """결과 페이지 템플릿과 정적 파일 매니페스트의 해시.
+
+    템플릿이나 CSS/JS가 바뀌면 (collectstatic 후 파일명 해시가 달라지면) ETag가 달라지고
+    미리 렌더링한 HTML도 다시 만듭니다.
+    """
+    origin = get_template(EvaluationView.template_name).origin
+    source = Path(origin.name).read_bytes()
+    source += getattr(staticfiles_storage, "manifest_hash", "").encode()
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+@lru_cache(maxsize=1)
 def load_system_prompt() -> str:
-    """Load the system prompt from file."""
+    """Load the system prompt from file.
+
+    요청마다 파일을 읽지 않도록 프로세스당 한 번만 읽습니다 (prompt.md 수정 후에는 재시작 필요).
+    """
     return PROMPT_PATH.read_text(encoding="utf-8")
 
 
-def build_user_message(jd: str, resume: str, career_description: str = None) -> str:
-    """Build the user message for the LLM."""
+def build_user_message(
+    jd: str, resume: str, career_description: str = None, hints: str = ""
+) -> str:
+    """Build the user message for the LLM.
+
+    hints는 로컬 키워드 매칭 결과(KeywordMatch.to_hints())로, 지정하면 마지막에 덧붙입니다.
+    """
     message = f"""아래 채용공고(JD)와 이력서를 분석해주세요.
 
 ## 채용공고 (JD)
@@ -53,51 +140,194 @@ def build_user_message(jd: str, resume: str, career_description: str = None) ->
         message += f"""
 ## 경력기술서
 {career_description}
+"""
+
+    if hints:
+        message += f"""
+## 키워드 사전 매칭 (참고용)
+{hints}
 """
 
     return message
 
 
+def check_api_key(provider: str) -> str | None:
+    """provider에 필요한 API 키가 없으면 오류 메시지를 반환합니다."""
+    # 부하 테스트용 가짜 백엔드는 API 키가 필요 없음
+    if fake_backend_enabled():
+        return None
+    if provider == "openai" and not os.getenv("OPENAI_API_KEY"):
+        return "OPENAI_API_KEY 환경변수가 설정되지 않았습니다."
+    if provider == "claude" and not os.getenv("ANTHROPIC_API_KEY"):
+        return "ANTHROPIC_API_KEY 환경변수가 설정되지 않았습니다."
+    if provider == "auto" and not available_providers():
+        return "OPENAI_API_KEY 또는 ANTHROPIC_API_KEY 환경변수가 설정되지 않았습니다."
+    return None
+
+
+class EvaluationError(Exception):
+    """평가 요청을 처리할 수 없을 때 발생하는 예외."""
+
+    def __init__(self, message: str = None, form=None):
+        super().__init__(message)
+        self.message = message
+        self.form = form
+
+
+@dataclass
+class PreparedEvaluation:
+    """검증을 마치고 LLM 호출 준비가 끝난 분석 요청."""
+
+    form: EvaluationForm
+    ip_address: str
+    provider: str
+    model: str
+    system_prompt: str
+    user_message: str
+    cache_key: str
+    use_cache: bool = True
+    compaction: CompactionReport = None
+    # 구조화(JSON) 출력 모드의 응답 스키마 (마크다운 모드는 None)
+    response_schema: dict = None
+    # 빠른 평가 점수와 관계없이 상세 분석 실행
+    full_analysis: bool = False
+    # LLM 호출 전 로컬 키워드 매칭 결과 (비활성화 시 None)
+    keyword_match: KeywordMatch = None
+    # 결과 저장용 입력 해시 (prompt_version, jd_hash, resume_hash, career_hash)
+    input_hashes: dict = None
+    # 캐시 키를 만든 입력 (jd, resume, career, hints) — 장애 조치 시 다른 provider의 키 계산용
+    cache_inputs: tuple = ()
+
+    def served_by(self, client) -> tuple[str, str, str]:
+        """실제로 응답한 (provider, model, 캐시 키)를 반환합니다.
+
+        장애 조치로 다른 provider가 응답하면 요청한 provider의 키가 아닌 응답한
+        provider/model의 키로 캐시하고 기록합니다.
+        """
+        provider = client.served_provider or self.provider
+        model = client.served_model or self.model
+        if (provider, model) == (self.provider, self.model):
+            return provider, model, self.cache_key
+        return (
+            provider,
+            model,
+            make_cache_key(provider, model, self.system_prompt, *self.cache_inputs),
+        )
+
+    def keyword_note(self) -> str:
+        return self.keyword_match.summary() if self.keyword_match is not None else ""
+
+    def make_record(
+        self,
+        result: str,
+        provider: str = None,
+        model: str = None,
+        score: int = None,
+        cached: bool = False,
+        usages=(),
+        timings=None,
+        cache_key: str = None,
+    ) -> Evaluation:
+        """결과를 저장할 Evaluation 객체를 만듭니다 (저장은 호출하는 쪽에서)."""
+        record = Evaluation(
+            cache_key=cache_key or self.cache_key,
+            provider=provider or self.provider,
+            model=model or self.model,
+            result=result,
+            evaluation=parse_result(result),
+            score=score if score is not None else extract_total_score(result),
+            cached=cached,
+            keyword_note=self.keyword_note(),
+            compaction_note=self.compaction.summary(),
+            timings=timings.as_dict() if timings is not None else {},
+            **(self.input_hashes or {}),
+        )
+        record.set_usage(usages)
+        return record
+
+
+def save_evaluation(
+    evaluation: PreparedEvaluation, result: str, **kwargs
+) -> Evaluation | None:
+    """결과를 고유 주소로 다시 볼 수 있도록 저장합니다 (PERMALINK 비활성화 시 None).
+
+    캐시 적중 결과는 같은 입력의 기존 기록이 있으면 새로 저장하지 않고 재사용합니다.
+    """
+    if not get_permalink_config()["ENABLED"]:
+        return None
+    if kwargs.get("cached"):
+        existing = Evaluation.latest_for_key(evaluation.cache_key)
+        if existing is not None:
+            return existing
+    record = evaluation.make_record(result, **kwargs)
+    record.save()
+    return record
+
+
+async def asave_evaluation(
+    evaluation: PreparedEvaluation, result: str, **kwargs
+) -> Evaluation | None:
+    """save_evaluation()의 비동기 버전."""
+    if not get_permalink_config()["ENABLED"]:
+        return None
+    if kwargs.get("cached"):
+        existing = await Evaluation.alatest_for_key(evaluation.cache_key)
+        if existing is not None:
+            return existing
+    record = evaluation.make_record(result, **kwargs)
+    await record.asave()
+    return record
+
+
+def permalink_url(record: Evaluation | None) -> str | None:
+    return record.get_absolute_url() if record is not None else None
+
+
 class EvaluationView(View):
-    """Main evaluation view."""
+    """Main evaluation view.
+
+    ASGI 서버(uvicorn 등)에서는 LLM 응답을 기다리는 동안 워커를 점유하지 않도록
+    모든 핸들러가 비동기로 동작합니다.
+    """
 
     template_name = "evaluator/index.html"
 
-    def get_context_data(self, request, **kwargs):
+    async def get_context_data(self, request, **kwargs):
         """공통 컨텍스트 데이터를 반환합니다."""
         ip_address = get_client_ip(request)
-        remaining = RequestLog.get_remaining_requests(ip_address, DAILY_REQUEST_LIMIT)
+        remaining = await get_rate_limiter().aremaining(ip_address)
         return {
             "remaining_requests": remaining,
             "daily_limit": DAILY_REQUEST_LIMIT,
+            "triage_enabled": get_triage_config()["ENABLED"],
+            "result_html": render_result_html(kwargs.get("result", "")),
             **kwargs,
         }
 
-    def get(self, request):
+    async def render_page(self, request, **kwargs):
+        """컨텍스트를 만들어 템플릿을 렌더링합니다."""
+        context = await self.get_context_data(request, **kwargs)
+        with span("render"):
+            return render(request, self.template_name, context)
+
+    async def get(self, request):
         """Display the evaluation form."""
-        form = EvaluationForm()
-        context = self.get_context_data(request, form=form)
-        return render(request, self.template_name, context)
+        return await self.render_page(request, form=EvaluationForm())
 
-    def post(self, request):
-        """Process the evaluation request."""
-        ip_address = get_client_ip(request)
+    async def prepare_evaluation(self, request) -> PreparedEvaluation:
+        """요청을 검증하고 LLM 호출에 필요한 입력을 준비합니다.
 
-        # 요청 제한 확인
-        if not RequestLog.can_make_request(ip_address, DAILY_REQUEST_LIMIT):
-            form = EvaluationForm()
-            context = self.get_context_data(
-                request,
-                form=form,
-                error="오늘의 분석 요청 한도(3회)를 초과했습니다. 내일 다시 이용해주세요.",
-            )
-            return render(request, self.template_name, context)
+        요청 한도는 여기서 확인하지 않습니다. 캐시된 결과는 한도를 쓰지 않으므로 한도에
+        도달한 사용자도 받을 수 있고, 캐시에 없을 때만 reserve_quota가 한도를 확인합니다.
 
+        Raises:
+            EvaluationError: 폼 오류, 파일 파싱 오류 등
+        """
+        ip_address = get_client_ip(request)
         form = EvaluationForm(request.POST, request.FILES)
 
         if not form.is_valid():
-            context = self.get_context_data(request, form=form)
-            return render(request, self.template_name, context)
+            raise EvaluationError(form=form)
 
         provider = form.cleaned_data["provider"]
         jd = form.cleaned_data["jd"]
@@ -105,57 +335,812 @@ class EvaluationView(View):
         career_file = form.cleaned_data.get("career_description")
 
         # API 키 확인
-        if provider == "openai" and not os.getenv("OPENAI_API_KEY"):
-            context = self.get_context_data(
-                request,
-                form=form,
-                error="OPENAI_API_KEY 환경변수가 설정되지 않았습니다.",
-            )
-            return render(request, self.template_name, context)
-        elif provider == "claude" and not os.getenv("ANTHROPIC_API_KEY"):
-            context = self.get_context_data(
-                request,
-                form=form,
-                error="ANTHROPIC_API_KEY 환경변수가 설정되지 않았습니다.",
-            )
-            return render(request, self.template_name, context)
+        api_key_error = check_api_key(provider)
+        if api_key_error:
+            raise EvaluationError(api_key_error, form=form)
 
-        # 파일 파싱
+        # 파일 파싱 (CPU 작업이므로 스레드에서 실행, 같은 파일은 캐시 사용)
         try:
-            resume_text = parse_file(resume_file)
-            career_text = parse_file(career_file) if career_file else None
+            with span("parse"):
+                resume_text = await aparse_file_cached(resume_file)
+                career_text = (
+                    await aparse_file_cached(career_file) if career_file else None
+                )
         except Exception as e:
-            context = self.get_context_data(
-                request,
-                form=form,
-                error=f"파일 파싱 오류: {str(e)}",
+            raise EvaluationError(f"파일 파싱 오류: {str(e)}", form=form)
+
+        # JD 키워드를 원문(압축 전) 이력서에서 찾아 즉시 보여줄 커버리지를 계산
+        keyword_config = get_keyword_config()
+        keyword_match = None
+        if keyword_config["ENABLED"]:
+            with span("keywords"):
+                keyword_match = match_keywords(jd, resume_text, career_text)
+
+        with span("prompt"):
+            model = get_default_model(provider)
+            system_prompt, response_schema = output_options(
+                load_system_prompt(), provider
             )
-            return render(request, self.template_name, context)
 
-        # LLM 클라이언트 임포트 및 실행
+        # 공백/머리글 정리, 중복 제거 후 토큰 예산에 맞게 입력 축소
+        with span("compaction"):
+            compacted = compact_inputs(
+                jd, resume_text, career_text, provider, model, system_prompt
+            )
+        hints = (
+            keyword_match.to_hints()
+            if keyword_match is not None and keyword_config["HINTS"]
+            else ""
+        )
+        return PreparedEvaluation(
+            form=form,
+            ip_address=ip_address,
+            provider=provider,
+            model=model,
+            system_prompt=system_prompt,
+            user_message=build_user_message(
+                compacted.jd,
+                compacted.resume,
+                compacted.career,
+                hints=hints,
+            ),
+            # 힌트도 사용자 메시지에 포함되므로 캐시 키에 함께 반영
+            cache_key=make_cache_key(
+                provider,
+                model,
+                system_prompt,
+                compacted.jd,
+                compacted.resume,
+                compacted.career,
+                hints,
+            ),
+            cache_inputs=(compacted.jd, compacted.resume, compacted.career, hints),
+            use_cache=not form.cleaned_data.get("bypass_cache"),
+            compaction=compacted.report,
+            response_schema=response_schema,
+            full_analysis=bool(form.cleaned_data.get("full_analysis")),
+            keyword_match=keyword_match,
+            input_hashes={
+                "prompt_version": prompt_version(system_prompt),
+                "jd_hash": hash_text(compacted.jd),
+                "resume_hash": hash_text(compacted.resume),
+                "career_hash": hash_text(compacted.career),
+            },
+        )
+
+    async def reserve_quota(self, evaluation: PreparedEvaluation):
+        """LLM 호출 전에 요청 한도 1회를 원자적으로 예약합니다.
+
+        예약은 분석 성공 시 commit, 실패 시 release로 정리해야 합니다.
+
+        Raises:
+            EvaluationError: 요청 한도를 초과한 경우
+        """
+        with span("quota"):
+            acquired = await get_rate_limiter().aacquire(evaluation.ip_address)
+        if not acquired:
+            raise EvaluationError(LIMIT_EXCEEDED_MESSAGE, form=EvaluationForm())
+
+    async def result_response(
+        self, request, evaluation: PreparedEvaluation, result: str, **record_kwargs
+    ):
+        """분석 결과를 저장하고 고유 주소로 리다이렉트합니다 (POST-redirect-GET).
+
+        새로고침하거나 주소를 공유해도 LLM을 다시 호출하지 않습니다.
+        PERMALINK가 꺼져 있으면 결과를 바로 렌더링합니다.
+        """
+        record = await asave_evaluation(
+            evaluation, result, timings=current_timings(), **record_kwargs
+        )
+        if record is not None:
+            response = HttpResponseRedirect(record.get_absolute_url())
+            response.status_code = 303
+            return response
+        return await self.render_page(
+            request,
+            form=EvaluationForm(),
+            result=to_markdown(result),
+            cached=record_kwargs.get("cached", False),
+            compaction_note=evaluation.compaction.summary(),
+            keyword_note=evaluation.keyword_note(),
+        )
+
+    async def post(self, request):
+        """Process the evaluation request."""
         try:
-            from llm_client import get_client
+            evaluation = await self.prepare_evaluation(request)
+        except EvaluationError as e:
+            return await self.render_page(request, form=e.form, error=e.message)
+
+        # 동일 입력의 캐시된 결과가 있으면 LLM 호출 생략
+        if evaluation.use_cache:
+            with span("cache"):
+                result = await aget_cached_result(evaluation.cache_key)
+            if result is not None:
+                return await self.result_response(
+                    request, evaluation, result, cached=True
+                )
 
-            system_prompt = load_system_prompt()
-            user_message = build_user_message(jd, resume_text, career_text)
+        try:
+            await self.reserve_quota(evaluation)
+        except EvaluationError as e:
+            return await self.render_page(request, form=e.form, error=e.message)
 
-            client = get_client(provider)
-            result = client.generate(system_prompt, user_message)
+        limiter = get_rate_limiter()
+        # WSGI에서는 asgiref가 요청마다 새 이벤트 루프를 만들어 루프별 비동기 연결 풀을
+        # 재사용할 수 없으므로, 프로세스 공유 풀을 쓰는 동기 클라이언트를 스레드에서 호출
+        native_async = isinstance(request, ASGIRequest)
+
+        # LLM 호출
+        try:
+            with collect_usage() as usages:
+                # 1차 평가 점수가 기준 미만이면 상세 분석 없이 빠른 평가 결과를 반환
+                if should_triage(evaluation.full_analysis):
+                    with span("triage"):
+                        triage_func = arun_triage if native_async else sync_to_async(run_triage)
+                        triage = await triage_func(
+                            evaluation.provider,
+                            evaluation.user_message,
+                            evaluation.use_cache,
+                        )
+                    if not triage.passed():
+                        await limiter.acommit(evaluation.ip_address)
+                        return await self.result_response(
+                            request,
+                            evaluation,
+                            triage.to_markdown(),
+                            provider=triage.provider,
+                            model=triage.model,
+                            score=triage.score,
+                            usages=usages,
+                        )
 
-            # 성공 시 요청 기록
-            RequestLog.log_request(ip_address)
+                with span("client"):
+                    if native_async:
+                        client = get_async_client(evaluation.provider, evaluation.model)
+                    else:
+                        client = get_client(evaluation.provider, evaluation.model)
+                with span("generate"):
+                    generate = (
+                        client.generate if native_async else sync_to_async(client.generate)
+                    )
+                    result = await generate(
+                        evaluation.system_prompt,
+                        evaluation.user_message,
+                        evaluation.response_schema,
+                    )
+            if evaluation.response_schema is not None:
+                load_evaluation(result)
 
-            context = self.get_context_data(
+            # 성공 시 요청 기록 및 결과 캐시 (응답한 provider/model 기준)
+            await limiter.acommit(evaluation.ip_address)
+            provider, model, cache_key = evaluation.served_by(client)
+            await aset_cached_result(cache_key, provider, model, result)
+            return await self.result_response(
                 request,
-                form=EvaluationForm(),
-                result=result,
+                evaluation,
+                result,
+                provider=provider,
+                model=model,
+                cache_key=cache_key,
+                usages=usages,
             )
-            return render(request, self.template_name, context)
 
         except Exception as e:
-            context = self.get_context_data(
+            await limiter.arelease(evaluation.ip_address)
+            return await self.render_page(
                 request,
-                form=form,
+                form=evaluation.form,
                 error=f"분석 중 오류가 발생했습니다: {str(e)}",
             )
-            return render(request, self.template_name, context)
+
+
+def sse_event(event: str, data) -> str:
+    """Server-Sent Events 형식의 메시지를 만듭니다."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def keywords_event(evaluation: PreparedEvaluation) -> str:
+    """LLM 호출 전에 보내는 로컬 키워드 매칭 결과 이벤트 (비활성화 시 빈 문자열)."""
+    if evaluation.keyword_match is None:
+        return ""
+    return sse_event("keywords", evaluation.keyword_match.to_dict())
+
+
+def triage_event(triage) -> str:
+    """빠른 평가 결과 이벤트 (passed가 false이면 상세 분석 없이 done이 이어짐)."""
+    return sse_event(
+        "triage",
+        {**triage.to_dict(), "passed": triage.passed(), "markdown": triage.to_markdown()},
+    )
+
+
+def structured_events(parser: IncrementalJSONParser, chunk: str) -> str:
+    """구조화 응답 청크를 해석하여 완성된 필드가 생기면 SSE 이벤트를 만듭니다.
+
+    - fields: 이번에 완성된 최상위 필드 값 (점수 등을 바로 사용하려는 클라이언트용)
+    - markdown: 지금까지 받은 필드로 렌더링한 전체 마크다운 (화면 갱신용)
+    """
+    completed = parser.feed(chunk)
+    if not completed:
+        return ""
+    data = parser.value
+    return sse_event("fields", {key: data[key] for key in completed}) + sse_event(
+        "markdown", render_markdown(data)
+    )
+
+
+class EvaluationStreamView(EvaluationView):
+    """Stream the evaluation result as Server-Sent Events.
+
+    검증에 실패하면 JSON 오류(400)를 반환하며, 클라이언트는 일반 폼 제출로
+    되돌아가 오류 화면을 렌더링합니다.
+
+    WSGI에서 비동기 이터레이터를 스트리밍하면 Django가 응답 전체를 버퍼링하므로,
+    ASGI 요청에는 비동기 제너레이터를, WSGI 요청에는 동기 제너레이터를 사용합니다.
+    """
+
+    http_method_names = ["post"]
+
+    async def post(self, request):
+        """Validate the request and stream LLM tokens as they arrive."""
+        try:
+            evaluation = await self.prepare_evaluation(request)
+        except EvaluationError as e:
+            return JsonResponse({"error": e.message}, status=400)
+
+        # 캐시 적중 시 스트리밍 없이 한 번에 응답
+        if evaluation.use_cache:
+            with span("cache"):
+                cached = await aget_cached_result(evaluation.cache_key)
+            if cached is not None:
+                remaining = await get_rate_limiter().aremaining(evaluation.ip_address)
+                record = await asave_evaluation(
+                    evaluation, cached, cached=True, timings=current_timings()
+                )
+                return HttpResponse(
+                    keywords_event(evaluation)
+                    + sse_event("token", to_markdown(cached))
+                    + sse_event(
+                        "done",
+                        {
+                            "remaining_requests": remaining,
+                            "cached": True,
+                            "compaction_note": evaluation.compaction.summary(),
+                            "permalink": permalink_url(record),
+                            "html": render_result_html(to_markdown(cached)),
+                        },
+                    ),
+                    content_type="text/event-stream",
+                )
+
+        try:
+            await self.reserve_quota(evaluation)
+        except EvaluationError as e:
+            return JsonResponse({"error": e.message}, status=429)
+
+        # 응답을 반환한 뒤에 실행되는 생성 단계도 같은 요청의 시간으로 기록
+        timings = current_timings()
+        if isinstance(request, ASGIRequest):
+            events = self.astream_events(evaluation, timings)
+        else:
+            events = self.stream_events(evaluation, timings)
+
+        response = StreamingHttpResponse(events, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # nginx 등 리버스 프록시의 응답 버퍼링 비활성화
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def stream_events(self, evaluation: PreparedEvaluation, timings=None):
+        """LLM 토큰을 SSE 이벤트로 변환하여 반환합니다."""
+        limiter = get_rate_limiter()
+        timings = timings or current_timings()
+        succeeded = False
+
+        # 프록시/브라우저가 첫 바이트를 즉시 받도록 주석 이벤트를 먼저 보냄
+        yield ": stream-start\n\n"
+        yield keywords_event(evaluation)
+
+        try:
+            usages = []
+            if should_triage(evaluation.full_analysis):
+                with timings.span("triage"), collect_usage() as triage_usages:
+                    triage = run_triage(
+                        evaluation.provider, evaluation.user_message, evaluation.use_cache
+                    )
+                usages += triage_usages
+                yield triage_event(triage)
+                if not triage.passed():
+                    limiter.commit(evaluation.ip_address)
+                    succeeded = True
+                    record = save_evaluation(
+                        evaluation,
+                        triage.to_markdown(),
+                        provider=triage.provider,
+                        model=triage.model,
+                        score=triage.score,
+                        usages=usages,
+                        timings=timings,
+                    )
+                    yield sse_event(
+                        "done",
+                        {
+                            "remaining_requests": limiter.remaining(evaluation.ip_address),
+                            "compaction_note": evaluation.compaction.summary(),
+                            "permalink": permalink_url(record),
+                            "html": render_result_html(triage.to_markdown()),
+                        },
+                    )
+                    return
+
+            with timings.span("client"):
+                client = get_client(evaluation.provider, evaluation.model)
+            parser = IncrementalJSONParser()
+            tokens = []
+            for token in collect_stream_usage(
+                timed_stream(
+                    client.stream(
+                        evaluation.system_prompt,
+                        evaluation.user_message,
+                        evaluation.response_schema,
+                    ),
+                    timings,
+                ),
+                usages,
+            ):
+                tokens.append(token)
+                if evaluation.response_schema is None:
+                    yield sse_event("token", token)
+                elif event := structured_events(parser, token):
+                    yield event
+            result = "".join(tokens)
+            if evaluation.response_schema is not None:
+                yield sse_event("markdown", render_markdown(load_evaluation(result)))
+
+            # 성공 시 요청 기록 및 결과 캐시 (응답한 provider/model 기준)
+            limiter.commit(evaluation.ip_address)
+            succeeded = True
+            provider, model, cache_key = evaluation.served_by(client)
+            set_cached_result(cache_key, provider, model, result)
+            record = save_evaluation(
+                evaluation,
+                result,
+                provider=provider,
+                model=model,
+                cache_key=cache_key,
+                usages=usages,
+                timings=timings,
+            )
+            remaining = limiter.remaining(evaluation.ip_address)
+            yield sse_event(
+                "done",
+                {
+                    "remaining_requests": remaining,
+                    "compaction_note": evaluation.compaction.summary(),
+                    "permalink": permalink_url(record),
+                    "html": render_result_html(to_markdown(result)),
+                },
+            )
+
+        except Exception as e:
+            yield sse_event("error", f"분석 중 오류가 발생했습니다: {str(e)}")
+        finally:
+            # 오류나 클라이언트 연결 종료로 끝나지 못한 요청은 예약을 반환
+            if not succeeded:
+                limiter.release(evaluation.ip_address)
+
+    async def astream_events(self, evaluation: PreparedEvaluation, timings=None):
+        """LLM 토큰을 SSE 이벤트로 변환하여 반환합니다 (비동기)."""
+        limiter = get_rate_limiter()
+        timings = timings or current_timings()
+        succeeded = False
+
+        yield ": stream-start\n\n"
+        yield keywords_event(evaluation)
+
+        try:
+            usages = []
+            if should_triage(evaluation.full_analysis):
+                with timings.span("triage"), collect_usage() as triage_usages:
+                    triage = await arun_triage(
+                        evaluation.provider, evaluation.user_message, evaluation.use_cache
+                    )
+                usages += triage_usages
+                yield triage_event(triage)
+                if not triage.passed():
+                    await limiter.acommit(evaluation.ip_address)
+                    succeeded = True
+                    record = await asave_evaluation(
+                        evaluation,
+                        triage.to_markdown(),
+                        provider=triage.provider,
+                        model=triage.model,
+                        score=triage.score,
+                        usages=usages,
+                        timings=timings,
+                    )
+                    yield sse_event(
+                        "done",
+                        {
+                            "remaining_requests": await limiter.aremaining(
+                                evaluation.ip_address
+                            ),
+                            "compaction_note": evaluation.compaction.summary(),
+                            "permalink": permalink_url(record),
+                            "html": render_result_html(triage.to_markdown()),
+                        },
+                    )
+                    return
+
+            with timings.span("client"):
+                client = get_async_client(evaluation.provider, evaluation.model)
+            parser = IncrementalJSONParser()
+            tokens = []
+            async for token in acollect_stream_usage(
+                atimed_stream(
+                    client.stream(
+                        evaluation.system_prompt,
+                        evaluation.user_message,
+                        evaluation.response_schema,
+                    ),
+                    timings,
+                ),
+                usages,
+            ):
+                tokens.append(token)
+                if evaluation.response_schema is None:
+                    yield sse_event("token", token)
+                elif event := structured_events(parser, token):
+                    yield event
+            result = "".join(tokens)
+            if evaluation.response_schema is not None:
+                yield sse_event("markdown", render_markdown(load_evaluation(result)))
+
+            # 성공 시 요청 기록 및 결과 캐시 (응답한 provider/model 기준)
+            await limiter.acommit(evaluation.ip_address)
+            succeeded = True
+            provider, model, cache_key = evaluation.served_by(client)
+            await aset_cached_result(cache_key, provider, model, result)
+            record = await asave_evaluation(
+                evaluation,
+                result,
+                provider=provider,
+                model=model,
+                cache_key=cache_key,
+                usages=usages,
+                timings=timings,
+            )
+            remaining = await limiter.aremaining(evaluation.ip_address)
+            yield sse_event(
+                "done",
+                {
+                    "remaining_requests": remaining,
+                    "compaction_note": evaluation.compaction.summary(),
+                    "permalink": permalink_url(record),
+                    "html": render_result_html(to_markdown(result)),
+                },
+            )
+
+        except Exception as e:
+            yield sse_event("error", f"분석 중 오류가 발생했습니다: {str(e)}")
+        finally:
+            # 오류나 클라이언트 연결 종료로 끝나지 못한 요청은 예약을 반환
+            # (DB 연산이므로 스레드에서 실행하고, 연결 종료로 취소되어도 끝까지 실행되도록 shield)
+            if not succeeded:
+                await asyncio.shield(limiter.arelease(evaluation.ip_address))
+
+
+class EvaluationDetailView(View):
+    """Serve a saved evaluation at its permalink.
+
+    저장된 결과는 바뀌지 않으므로 ETag/Last-Modified로 조건부 요청(304)을 지원하고,
+    PRERENDER가 켜져 있으면 처음 렌더링한 페이지를 저장해 두었다가 그대로 반환합니다.
+    다시 방문해도 LLM 호출 없이 기본 키 조회 한 번이면 됩니다.
+    """
+
+    template_name = EvaluationView.template_name
+
+    def get_context_data(self, record: Evaluation) -> dict:
+        # 요청마다 달라지는 값(CSRF 토큰, 남은 횟수)이 없어야 미리 렌더링한 페이지를 재사용할 수 있음
+        return {
+            "evaluation": record,
+            "result": to_markdown(record.result),
+            "result_html": render_result_html(to_markdown(record.result)),
+            "cached": True,
+            "permalink": record.get_absolute_url(),
+            "keyword_note": record.keyword_note,
+            "compaction_note": record.compaction_note,
+        }
+
+    async def get(self, request, evaluation_id):
+        """Return the saved result page (or 304 Not Modified)."""
+        try:
+            record = await Evaluation.objects.aget(pk=evaluation_id)
+        except Evaluation.DoesNotExist:
+            raise Http404("분석 결과를 찾을 수 없습니다.")
+
+        config = get_permalink_config()
+        version = permalink_page_version()
+        etag = record.etag(version)
+        last_modified = int(record.created_at.timestamp())
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            if config["PRERENDER"] and record.html and record.html_version == version:
+                html = record.html
+            else:
+                with span("render"):
+                    html = render_to_string(
+                        self.template_name, self.get_context_data(record)
+                    )
+                if config["PRERENDER"]:
+                    await record.aset_html(html, version)
+            response = HttpResponse(html)
+
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        # 이력서 분석 내용이 공유 캐시(CDN 등)에 남지 않도록 private
+        patch_cache_control(response, private=True, max_age=config["MAX_AGE"])
+        return response
+
+
+class EvaluationJobCreateView(EvaluationView):
+    """Enqueue an evaluation and return its job id immediately (202 Accepted).
+
+    실제 LLM 호출은 ``run_evaluation_worker`` 명령이 처리하므로, 웹 요청 지연은
+    LLM 응답 속도와 무관하게 일정합니다.
+    """
+
+    http_method_names = ["post"]
+
+    async def post(self, request):
+        """Validate the request and enqueue it for the background worker."""
+        try:
+            evaluation = await self.prepare_evaluation(request)
+        except EvaluationError as e:
+            return JsonResponse({"error": e.message}, status=400)
+
+        ip_address = evaluation.ip_address
+        # 작업을 기다리는 동안 보여줄 수 있도록 로컬 키워드 매칭 결과를 함께 반환
+        keywords = (
+            evaluation.keyword_match.to_dict()
+            if evaluation.keyword_match is not None
+            else None
+        )
+
+        # 캐시된 결과가 있으면 완료된 작업으로 바로 등록
+        cached = None
+        if evaluation.use_cache:
+            cached = await aget_cached_result(evaluation.cache_key)
+        if cached is not None:
+            job = await EvaluationJob.acreate_finished(
+                ip_address, evaluation.provider, evaluation.user_message, cached
+            )
+            return JsonResponse(
+                {
+                    "job_id": str(job.id),
+                    "status": job.status,
+                    "status_url": reverse("evaluator:job_status", args=[job.id]),
+                    "keywords": keywords,
+                },
+                status=200,
+            )
+
+        # 등록 시점에 한도를 예약하여 동시 제출로 한도를 넘지 않도록 함
+        # (워커가 성공 시 commit, 실패 시 release)
+        try:
+            await self.reserve_quota(evaluation)
+        except EvaluationError as e:
+            return JsonResponse({"error": e.message}, status=429)
+
+        job = await EvaluationJob.aenqueue(
+            ip_address,
+            evaluation.provider,
+            evaluation.user_message,
+            cache_key=evaluation.cache_key,
+        )
+        return JsonResponse(
+            {
+                "job_id": str(job.id),
+                "status": job.status,
+                "status_url": reverse("evaluator:job_status", args=[job.id]),
+                "keywords": keywords,
+            },
+            status=202,
+        )
+
+
+class EvaluationJobStatusView(View):
+    """Return the status (and result, once finished) of a queued evaluation."""
+
+    async def get(self, request, job_id):
+        """Poll the job status."""
+        try:
+            job = await EvaluationJob.objects.aget(pk=job_id)
+        except EvaluationJob.DoesNotExist:
+            raise Http404("작업을 찾을 수 없습니다.")
+
+        data = {
+            "job_id": str(job.id),
+            "status": job.status,
+            "created_at": job.created_at.isoformat(),
+            "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        }
+        if job.status == EvaluationJob.Status.SUCCEEDED:
+            data["result"] = to_markdown(job.result)
+            evaluation = parse_result(job.result)
+            if evaluation is not None:
+                data["evaluation"] = evaluation
+        elif job.status == EvaluationJob.Status.FAILED:
+            data["error"] = job.error
+
+        response = JsonResponse(data)
+        if not job.is_finished:
+            # 클라이언트에게 다음 폴링 시점을 알려줌
+            response["Retry-After"] = "2"
+        return response
+
+
+class BatchEvaluationCreateView(View):
+    """Register a batch of resumes (zip) against one JD (202 Accepted).
+
+    업로드한 zip은 그대로 저장하고 바로 응답합니다. ``run_evaluation_worker``가 준비 작업에서
+    이력서를 파싱·압축해 이력서별 EvaluationJob을 등록하고, 워커의 --concurrency가 동시 LLM
+    호출 수를 제한합니다. 일일 요청 한도 대신 관리자(staff) 로그인이 필요합니다.
+    """
+
+    http_method_names = ["post"]
+
+    async def post(self, request):
+        """Store the uploaded resumes and enqueue the batch preparation."""
+        user = await request.auser()
+        if not user.is_staff:
+            return JsonResponse(
+                {"error": "배치 분석은 관리자 계정으로 로그인해야 사용할 수 있습니다."},
+                status=403,
+            )
+
+        form = BatchEvaluationForm(request.POST, request.FILES)
+        if not form.is_valid():
+            return JsonResponse(
+                {"error": "입력값을 확인해주세요.", "errors": form.errors}, status=400
+            )
+
+        provider = form.cleaned_data["provider"]
+        api_key_error = check_api_key(provider)
+        if api_key_error:
+            return JsonResponse({"error": api_key_error}, status=400)
+
+        batch = await EvaluationJob.aenqueue_batch(
+            get_client_ip(request),
+            provider,
+            form.cleaned_data["jd"],
+            await sync_to_async(form.cleaned_data["resumes"].read)(),
+            use_cache=not form.cleaned_data.get("bypass_cache"),
+        )
+        return JsonResponse(
+            {
+                "batch_id": str(batch.id),
+                "status_url": reverse("evaluator:batch_status", args=[batch.id]),
+                "results_url": reverse("evaluator:batch_results", args=[batch.id]),
+            },
+            status=202,
+        )
+
+
+class BatchEvaluationStatusView(View):
+    """Return progress and the score ranking of a batch."""
+
+    async def get(self, request, batch_id):
+        """Poll the batch progress."""
+        user = await request.auser()
+        if not user.is_staff:
+            raise Http404("배치를 찾을 수 없습니다.")
+        try:
+            batch = await EvaluationBatch.objects.aget(pk=batch_id)
+        except EvaluationBatch.DoesNotExist:
+            raise Http404("배치를 찾을 수 없습니다.")
+
+        preparation = await batch.jobs.filter(
+            kind=EvaluationJob.Kind.PREPARE_BATCH
+        ).only("status", "error").afirst()
+        jobs = [
+            job
+            async for job in batch.jobs.filter(kind=EvaluationJob.Kind.EVALUATE)
+            .only("id", "name", "status", "score", "error")
+            .order_by(F("score").desc(nulls_last=True), "name")
+        ]
+        counts = {status: 0 for status in EvaluationJob.Status.values}
+        for job in jobs:
+            counts[job.status] += 1
+
+        # 워커가 zip을 파싱해 이력서별 작업을 등록하기 전에는 "preparing"
+        prepared = preparation is None or preparation.is_finished
+        finished = prepared and all(job.is_finished for job in jobs)
+        response = JsonResponse(
+            {
+                "batch_id": str(batch.id),
+                "provider": batch.provider,
+                "preparing": not prepared,
+                "error": (
+                    preparation.error
+                    if preparation is not None
+                    and preparation.status == EvaluationJob.Status.FAILED
+                    else ""
+                ),
+                "total": len(jobs),
+                "counts": counts,
+                "finished": finished,
+                "ranking": [
+                    {
+                        "rank": rank,
+                        "name": job.name,
+                        "status": job.status,
+                        "score": job.score,
+                        "error": job.error,
+                        "status_url": reverse("evaluator:job_status", args=[job.id]),
+                    }
+                    for rank, job in enumerate(jobs, start=1)
+                ],
+                "results_url": reverse("evaluator:batch_results", args=[batch.id]),
+            }
+        )
+        if not finished:
+            response["Retry-After"] = "5"
+        return response
+
+
+class BatchEvaluationResultsView(View):
+    """Download finished results of a batch as JSONL (request_id/title/body)."""
+
+    async def get(self, request, batch_id):
+        """Return one JSON line per finished resume, in completion order."""
+        user = await request.auser()
+        if not user.is_staff:
+            raise Http404("배치를 찾을 수 없습니다.")
+        try:
+            batch = await EvaluationBatch.objects.aget(pk=batch_id)
+        except EvaluationBatch.DoesNotExist:
+            raise Http404("배치를 찾을 수 없습니다.")
+
+        model = get_default_model(batch.provider)
+        lines = [
+            json.dumps(record_from_job(job, model), ensure_ascii=False) + "\n"
+            async for job in batch.jobs.filter(
+                kind=EvaluationJob.Kind.EVALUATE,
+                status__in=[EvaluationJob.Status.SUCCEEDED, EvaluationJob.Status.FAILED],
+            ).order_by("finished_at", "name")
+        ]
+        response = HttpResponse("".join(lines), content_type="application/x-ndjson")
+        response["Content-Disposition"] = f'attachment; filename="batch-{batch.id}.jsonl"'
+        return response
+
+
+class MetricsView(View):
+    """Expose latency histograms and LLM/cache counters in Prometheus text format.
+
+    토큰 사용량, provider 오류, 지연 시간이 노출되므로 스태프 계정으로 로그인했거나
+    METRICS_TOKEN과 같은 ``Authorization: Bearer <token>`` 헤더를 보낸 요청만 허용합니다.
+    DEBUG 모드에서 METRICS_TOKEN이 없으면 로컬 개발용으로 누구나 볼 수 있습니다.
+    """
+
+    def get(self, request):
+        config = get_metrics_config()
+        if not config["ENABLED"]:
+            raise Http404("메트릭이 비활성화되어 있습니다.")
+        if not self.is_authorized(request, config["TOKEN"]):
+            return HttpResponse("인증이 필요합니다.", status=401)
+        return HttpResponse(registry.render(), content_type=METRICS_CONTENT_TYPE)
+
+    @staticmethod
+    def is_authorized(request, token: str) -> bool:
+        if request.user.is_staff:
+            return True
+        if token:
+            expected = f"Bearer {token}"
+            provided = request.headers.get("Authorization", "")
+            return hmac.compare_digest(provided.encode(), expected.encode())
+        return settings.DEBUG
@@ -0,0 +1,106 @@
+"""Gunicorn deployment profile for LLM-bound traffic.
+
+분석 요청은 대부분의 시간을 LLM 응답 대기에 쓰므로 기본 sync 워커(워커당 요청 1개)로는
+동시 요청 수만큼 프로세스가 필요합니다. 이 설정은 CPU 수만큼의 워커에 스레드(gthread) 또는
+이벤트 루프(uvicorn)로 동시 요청을 나눠 담습니다.
+
+    gunicorn                             # WSGI + gthread (기본값)
+    GUNICORN_PROFILE=asgi gunicorn       # ASGI + uvicorn 워커
+
+프로젝트 루트에서 실행하면 gunicorn이 이 파일을 자동으로 읽습니다 (다른 위치에서는 -c 지정).
+모든 값은 GUNICORN_* 환경변수로 덮어쓸 수 있으며, 명령행 옵션이 환경변수보다 우선합니다.
+"""
+
+import math
+import os
+
+from llm_client import get_http_config, warm_up
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _env_flag(name: str, default: str = "True") -> bool:
+    return os.getenv(name, default).lower() in ("true", "1", "yes")
+
+
+def cpu_count() -> int:
+    """이 프로세스가 쓸 수 있는 CPU 수 (컨테이너 CPU 제한/affinity 반영)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+profile = os.getenv("GUNICORN_PROFILE", "gthread").lower()
+if profile not in ("gthread", "asgi"):
+    raise ValueError(f"GUNICORN_PROFILE은 gthread 또는 asgi여야 합니다: {profile}")
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+# 워커 수: PDF 파싱·결과 렌더링 같은 CPU 작업이 GIL에 막히지 않도록 CPU당 하나
+# (max_requests 재시작으로 한 워커가 종료 대기 중이어도 요청을 받도록 최소 2개)
+workers = _env_int("GUNICORN_WORKERS", max(2, cpu_count()))
+
+# 서버 전체에서 동시에 처리할 분석 요청 수 (대부분 LLM 응답 대기)
+concurrency = _env_int("GUNICORN_CONCURRENCY", 64)
+per_worker = math.ceil(concurrency / workers)
+
+if profile == "asgi":
+    wsgi_app = "config.asgi:application"
+    worker_class = "config.workers.DrainingUvicornWorker"
+    # 워커당 동시 연결 한도 (초과 시 503), 이벤트 루프 하나가 대기 중인 요청을 모두 처리
+    worker_connections = _env_int("GUNICORN_WORKER_CONNECTIONS", per_worker * 4)
+else:
+    wsgi_app = "config.wsgi:application"
+    worker_class = "gthread"
+    # SSE 스트림은 생성이 끝날 때까지 스레드 하나를 점유하므로 스레드 수 = 워커당 동시 요청 수
+    threads = _env_int("GUNICORN_THREADS", max(4, per_worker))
+    worker_connections = _env_int("GUNICORN_WORKER_CONNECTIONS", max(1000, threads * 2))
+
+# PyMuPDF 등으로 늘어난 메모리를 주기적으로 회수 (워커들이 동시에 재시작하지 않도록 지터)
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 1000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", max_requests // 10)
+
+# LLM 호출 한 번의 최대 시간(LLM_HTTP_TIMEOUT + 연결 타임아웃)보다 길게 잡아
+# 응답을 기다리는 워커를 멈춘 것으로 오인해 죽이거나, 종료 시 진행 중인 분석을 끊지 않음
+_llm_http = get_http_config()
+llm_timeout = math.ceil(_llm_http["timeout"] + _llm_http["connect_timeout"])
+timeout = _env_int("GUNICORN_TIMEOUT", llm_timeout + 30)
+# SIGTERM/SIGHUP/max_requests 재시작 시 새 연결은 받지 않고 진행 중인 분석이 끝나기를 기다리는 시간
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", llm_timeout + 30)
+keepalive = _env_int("GUNICORN_KEEPALIVE", 5)
+
+# 앱(SDK, PyMuPDF, 템플릿)을 마스터에서 한 번 불러와 워커가 fork로 물려받음
+preload_app = _env_flag("GUNICORN_PRELOAD")
+
+# 하트비트 파일을 메모리 파일시스템에 두어 디스크 I/O 지연으로 워커가 죽지 않게 함 (Docker 등)
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    # fork 시 초기화된 LLM 연결 풀을 워커에서 다시 만들어 첫 요청의 생성 비용을 없앰
+    # (ASGI 워커의 비동기 클라이언트는 이벤트 루프에 묶여 있어 첫 요청 시 생성)
+    if preload_app and profile == "gthread" and _env_flag("LLM_WARMUP"):
+        warm_up()
+
+
+def when_ready(server):
+    server.log.info(
+        "프로필 %s: 워커 %d개 × %s, 동시 요청 목표 %d, timeout %ds, graceful_timeout %ds, "
+        "max_requests %d±%d",
+        profile,
+        workers,
+        f"스레드 {threads}개" if profile == "gthread" else f"연결 {worker_connections}개",
+        concurrency,
+        timeout,
+        graceful_timeout,
+        max_requests,
+        max_requests_jitter,
+    )
+
@@ -1,22 +1,366 @@
 """LLM Client module supporting Claude and OpenAI APIs."""
 
+import asyncio
+import contextvars
+import email.utils
+import hashlib
+import importlib.util
+import json
+import logging
+import math
 import os
+import random
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import AsyncIterator, Iterator
+
+logger = logging.getLogger(__name__)
+
+# provider별 기본 모델
+DEFAULT_MODELS = {
+    "claude": "claude-sonnet-4-20250514",
+    "openai": "gpt-4o",
+}
+
+# 빠른 1차 평가(triage)에 사용하는 provider별 소형 모델
+TRIAGE_MODELS = {
+    "claude": "claude-3-5-haiku-20241022",
+    "openai": "gpt-4o-mini",
+}
+
+# provider별 API 키 환경변수
+API_KEY_ENV = {
+    "claude": "ANTHROPIC_API_KEY",
+    "openai": "OPENAI_API_KEY",
+}
+
+# 여러 provider를 함께 사용하는 가상 provider와 동작 모드
+MULTI_PROVIDER_MODES = {
+    "auto": "hedged",
+    "compare": "compare",
+}
+
+
+@dataclass
+class TokenUsage:
+    """Token counts reported by the provider API for one call."""
+
+    provider: str
+    model: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    # 프롬프트 캐시에서 읽은 입력 토큰 (과금/지연이 크게 줄어드는 부분)
+    cached_input_tokens: int = 0
+    # 프롬프트 캐시에 새로 기록한 입력 토큰 (Claude)
+    cache_write_tokens: int = 0
+
+
+class UsageTracker:
+    """Aggregate token usage per provider for the current process."""
+
+    FIELDS = (
+        "input_tokens",
+        "output_tokens",
+        "cached_input_tokens",
+        "cache_write_tokens",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = defaultdict(lambda: dict.fromkeys(("calls",) + self.FIELDS, 0))
+
+    def record(self, usage: TokenUsage):
+        with self._lock:
+            totals = self._totals[usage.provider]
+            totals["calls"] += 1
+            for name in self.FIELDS:
+                totals[name] += getattr(usage, name)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {provider: dict(totals) for provider, totals in self._totals.items()}
+
+
+usage_tracker = UsageTracker()
+
+# collect_usage() 블록 안에서 발생한 호출의 사용량을 모으는 목록
+_usage_collector = contextvars.ContextVar("llm_usage_collector", default=None)
+
+
+@contextmanager
+def collect_usage():
+    """Collect the TokenUsage of LLM calls made inside the block.
+
+    Example:
+        with collect_usage() as usages:
+            client.generate(system_prompt, user_message)
+        cached = sum(usage.cached_input_tokens for usage in usages)
+    """
+    usages = []
+    token = _usage_collector.set(usages)
+    try:
+        yield usages
+    finally:
+        _usage_collector.reset(token)
+
+
+def collect_stream_usage(tokens: Iterator[str], usages: list) -> Iterator[str]:
+    """Pass a token stream through, appending the TokenUsage recorded while it runs.
+
+    collect_usage() 블록을 yield 너머로 유지하지 않도록 다음 토큰을 받는 동안에만 엽니다.
+    """
+    iterator = iter(tokens)
+    while True:
+        with collect_usage() as collected:
+            token = next(iterator, None)
+        usages.extend(collected)
+        if token is None:
+            return
+        yield token
+
+
+async def acollect_stream_usage(
+    tokens: AsyncIterator[str], usages: list
+) -> AsyncIterator[str]:
+    """Asyncio version of :func:`collect_stream_usage`."""
+    iterator = aiter(tokens)
+    while True:
+        with collect_usage() as collected:
+            token = await anext(iterator, None)
+        usages.extend(collected)
+        if token is None:
+            return
+        yield token
+
+
+def record_usage(usage: TokenUsage):
+    """Record usage in the process totals and the active collect_usage() block."""
+    usage_tracker.record(usage)
+    collector = _usage_collector.get()
+    if collector is not None:
+        collector.append(usage)
+    logger.debug("LLM 토큰 사용량: %s", asdict(usage))
+
+
+class ErrorTracker:
+    """Count failed provider calls per provider and error kind for the current process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = defaultdict(int)
+
+    def record(self, provider: str, exc: Exception):
+        with self._lock:
+            self._counts[(provider, error_kind(exc))] += 1
+
+    def snapshot(self) -> dict:
+        """{(provider, kind): count}"""
+        with self._lock:
+            return dict(self._counts)
+
+
+error_tracker = ErrorTracker()
+
+
+def error_kind(exc: Exception) -> str:
+    """HTTP 상태 코드가 있으면 "http_529", 없으면 예외 클래스 이름."""
+    status_code = getattr(exc, "status_code", None)
+    if status_code is not None:
+        return f"http_{status_code}"
+    return type(exc).__name__
+
+
+def _claude_usage(model: str, usage) -> TokenUsage:
+    cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+    cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+    return TokenUsage(
+        provider="claude",
+        model=model,
+        # Claude의 input_tokens는 캐시되지 않은 부분만 세므로 OpenAI와 같은 기준으로 합산
+        input_tokens=(getattr(usage, "input_tokens", 0) or 0) + cache_read + cache_write,
+        output_tokens=getattr(usage, "output_tokens", 0) or 0,
+        cached_input_tokens=cache_read,
+        cache_write_tokens=cache_write,
+    )
+
+
+def _openai_usage(model: str, usage) -> TokenUsage:
+    details = getattr(usage, "prompt_tokens_details", None)
+    return TokenUsage(
+        provider="openai",
+        model=model,
+        input_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+        output_tokens=getattr(usage, "completion_tokens", 0) or 0,
+        cached_input_tokens=getattr(details, "cached_tokens", 0) or 0,
+    )
+
+
+def prompt_caching_enabled() -> bool:
+    return os.getenv("LLM_PROMPT_CACHE", "True").lower() in ("true", "1", "yes")
+
+
+def claude_system(system_prompt: str):
+    """Claude 시스템 프롬프트를 프롬프트 캐시 대상 블록으로 감쌉니다.
+
+    시스템 프롬프트는 모든 요청에서 같으므로 캐시 적중 시 입력 처리 비용과 지연이 줄어듭니다.
+    """
+    if not prompt_caching_enabled():
+        return system_prompt
+    return [
+        {
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
+
+@lru_cache(maxsize=8)
+def _prompt_hash(system_prompt: str) -> str:
+    return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+
+
+def openai_request(
+    system_prompt: str, user_message: str, response_schema: dict = None
+) -> dict:
+    """OpenAI 요청의 메시지와 캐시/출력 형식 옵션을 만듭니다.
+
+    OpenAI는 앞부분이 같은 요청을 자동으로 캐시하므로, 변하지 않는 시스템 프롬프트를
+    항상 맨 앞에 두고 요청마다 달라지는 내용은 뒤에 둡니다. prompt_cache_key는 같은
+    프롬프트의 요청이 같은 캐시로 라우팅되도록 돕습니다.
+
+    response_schema가 있으면 Structured Outputs(json_schema, strict)로 응답을
+    스키마에 맞는 JSON으로 제한합니다.
+    """
+    request = {
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ],
+    }
+    if response_schema is not None:
+        request["response_format"] = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": response_schema["name"],
+                "strict": True,
+                "schema": response_schema["schema"],
+            },
+        }
+    if prompt_caching_enabled():
+        # 구버전 SDK에서도 동작하도록 extra_body로 전달
+        request["extra_body"] = {
+            "prompt_cache_key": f"fitup-{_prompt_hash(system_prompt)}"
+        }
+    return request
+
+
+def claude_tool_options(response_schema: dict = None) -> dict:
+    """Claude가 response_schema를 입력 스키마로 하는 도구를 반드시 호출하도록 합니다.
+
+    도구 입력(JSON)이 곧 구조화된 응답이며, 스트리밍 시 input_json_delta로 전달됩니다.
+    도구 정의는 시스템 프롬프트보다 앞에 오므로 프롬프트 캐시 prefix에 함께 포함됩니다.
+    """
+    if response_schema is None:
+        return {}
+    return {
+        "tools": [
+            {
+                "name": response_schema["name"],
+                "description": response_schema.get("description", ""),
+                "input_schema": response_schema["schema"],
+            }
+        ],
+        "tool_choice": {"type": "tool", "name": response_schema["name"]},
+    }
+
+
+def claude_output(content) -> str:
+    """Claude 응답 content에서 텍스트(또는 도구 입력 JSON)를 꺼냅니다."""
+    for block in content:
+        if block.type == "tool_use":
+            return json.dumps(block.input, ensure_ascii=False)
+    return "".join(block.text for block in content if block.type == "text")
+
+
+def _claude_delta_text(event) -> str | None:
+    # 텍스트 응답은 text_delta, 도구 입력(구조화 응답)은 input_json_delta로 전달됨
+    if event.type != "content_block_delta":
+        return None
+    if event.delta.type == "text_delta":
+        return event.delta.text
+    if event.delta.type == "input_json_delta":
+        return event.delta.partial_json
+    return None
 
 
 class LLMClient(ABC):
     """Abstract base class for LLM clients."""
 
+    # 마지막 응답을 실제로 생성한 provider/model (None이면 요청한 provider/model)
+    served_provider = None
+    served_model = None
+
+    @abstractmethod
+    def generate(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> str:
+        """Generate a response from the LLM.
+
+        response_schema({"name", "description", "schema"})가 있으면 JSON Schema에
+        맞는 JSON 문자열을 반환합니다.
+        """
+        pass
+
+    def stream(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> Iterator[str]:
+        """Yield the response text incrementally as it is generated.
+
+        스트리밍을 지원하지 않는 클라이언트는 전체 응답을 한 번에 반환합니다.
+        """
+        yield self.generate(system_prompt, user_message, response_schema)
+
+
+class AsyncLLMClient(ABC):
+    """Abstract base class for asyncio-native LLM clients."""
+
+    served_provider = None
+    served_model = None
+
     @abstractmethod
-    def generate(self, system_prompt: str, user_message: str) -> str:
+    async def generate(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> str:
         """Generate a response from the LLM."""
         pass
 
+    async def stream(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> AsyncIterator[str]:
+        """Yield the response text incrementally as it is generated.
+
+        스트리밍을 지원하지 않는 클라이언트는 전체 응답을 한 번에 반환합니다.
+        """
+        yield await self.generate(system_prompt, user_message, response_schema)
+
 
 class ClaudeClient(LLMClient):
     """Anthropic Claude API client."""
 
-    def __init__(self, model: str = "claude-sonnet-4-20250514"):
+    def __init__(
+        self,
+        model: str = DEFAULT_MODELS["claude"],
+        http_client=None,
+        max_retries: int = 2,
+    ):
         try:
             from anthropic import Anthropic
         except ImportError:
@@ -26,17 +370,39 @@ class ClaudeClient(LLMClient):
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY 환경변수를 설정해주세요.")
 
-        self.client = Anthropic(api_key=api_key)
+        self.client = Anthropic(
+            api_key=api_key, http_client=http_client, max_retries=max_retries
+        )
         self.model = model
 
-    def generate(self, system_prompt: str, user_message: str) -> str:
+    def generate(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> str:
         response = self.client.messages.create(
             model=self.model,
             max_tokens=8192,
-            system=system_prompt,
+            system=claude_system(system_prompt),
             messages=[{"role": "user", "content": user_message}],
+            **claude_tool_options(response_schema),
         )
-        return response.content[0].text
+        record_usage(_claude_usage(self.model, response.usage))
+        return claude_output(response.content)
+
+    def stream(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> Iterator[str]:
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=8192,
+            system=claude_system(system_prompt),
+            messages=[{"role": "user", "content": user_message}],
+            **claude_tool_options(response_schema),
+        ) as stream:
+            for event in stream:
+                text = _claude_delta_text(event)
+                if text:
+                    yield text
+            record_usage(_claude_usage(self.model, stream.get_final_message().usage))
 
 
 class OpenAIClient(LLMClient):
@@ -51,7 +417,12 @@ class OpenAIClient(LLMClient):
         "gpt-3.5-turbo": 4096,
     }
 
-    def __init__(self, model: str = "gpt-4o"):
+    def __init__(
+        self,
+        model: str = DEFAULT_MODELS["openai"],
+        http_client=None,
+        max_retries: int = 2,
+    ):
         try:
             from openai import OpenAI
         except ImportError:
@@ -61,35 +432,1473 @@ class OpenAIClient(LLMClient):
         if not api_key:
             raise ValueError("OPENAI_API_KEY 환경변수를 설정해주세요.")
 
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(
+            api_key=api_key, http_client=http_client, max_retries=max_retries
+        )
         self.model = model
         self.max_tokens = self.MAX_TOKENS_MAP.get(model, 4096)
 
-    def generate(self, system_prompt: str, user_message: str) -> str:
+    def generate(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> str:
         response = self.client.chat.completions.create(
             model=self.model,
             max_tokens=self.max_tokens,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message},
-            ],
+            **openai_request(system_prompt, user_message, response_schema),
         )
+        if response.usage is not None:
+            record_usage(_openai_usage(self.model, response.usage))
         return response.choices[0].message.content
 
+    def stream(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> Iterator[str]:
+        response = self.client.chat.completions.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            **openai_request(system_prompt, user_message, response_schema),
+            stream=True,
+            # 마지막 청크로 토큰 사용량(캐시 적중 포함)을 받음
+            stream_options={"include_usage": True},
+        )
+        try:
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if getattr(chunk, "usage", None) is not None:
+                    record_usage(_openai_usage(self.model, chunk.usage))
+        finally:
+            response.close()
+
+
+class AsyncClaudeClient(AsyncLLMClient):
+    """Anthropic Claude API client backed by ``AsyncAnthropic``."""
+
+    def __init__(
+        self,
+        model: str = DEFAULT_MODELS["claude"],
+        http_client=None,
+        max_retries: int = 2,
+    ):
+        try:
+            from anthropic import AsyncAnthropic
+        except ImportError:
+            raise ImportError("anthropic 패키지가 필요합니다: pip install anthropic")
+
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY 환경변수를 설정해주세요.")
+
+        self.client = AsyncAnthropic(
+            api_key=api_key, http_client=http_client, max_retries=max_retries
+        )
+        self.model = model
+
+    async def generate(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> str:
+        response = await self.client.messages.create(
+            model=self.model,
+            max_tokens=8192,
+            system=claude_system(system_prompt),
+            messages=[{"role": "user", "content": user_message}],
+            **claude_tool_options(response_schema),
+        )
+        record_usage(_claude_usage(self.model, response.usage))
+        return claude_output(response.content)
+
+    async def stream(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> AsyncIterator[str]:
+        async with self.client.messages.stream(
+            model=self.model,
+            max_tokens=8192,
+            system=claude_system(system_prompt),
+            messages=[{"role": "user", "content": user_message}],
+            **claude_tool_options(response_schema),
+        ) as stream:
+            async for event in stream:
+                text = _claude_delta_text(event)
+                if text:
+                    yield text
+            message = await stream.get_final_message()
+            record_usage(_claude_usage(self.model, message.usage))
+
+
+class AsyncOpenAIClient(AsyncLLMClient):
+    """OpenAI API client backed by ``AsyncOpenAI``."""
+
+    def __init__(
+        self,
+        model: str = DEFAULT_MODELS["openai"],
+        http_client=None,
+        max_retries: int = 2,
+    ):
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            raise ImportError("openai 패키지가 필요합니다: pip install openai")
+
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY 환경변수를 설정해주세요.")
+
+        self.client = AsyncOpenAI(
+            api_key=api_key, http_client=http_client, max_retries=max_retries
+        )
+        self.model = model
+        self.max_tokens = OpenAIClient.MAX_TOKENS_MAP.get(model, 4096)
+
+    async def generate(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> str:
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            **openai_request(system_prompt, user_message, response_schema),
+        )
+        if response.usage is not None:
+            record_usage(_openai_usage(self.model, response.usage))
+        return response.choices[0].message.content
+
+    async def stream(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> AsyncIterator[str]:
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            **openai_request(system_prompt, user_message, response_schema),
+            stream=True,
+            # 마지막 청크로 토큰 사용량(캐시 적중 포함)을 받음
+            stream_options={"include_usage": True},
+        )
+        try:
+            async for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if getattr(chunk, "usage", None) is not None:
+                    record_usage(_openai_usage(self.model, chunk.usage))
+        finally:
+            await response.close()
+
+
+# 오프라인 부하 테스트용 가짜 provider (실제 API를 호출하지 않고 기록된 응답을 재생)
+FAKE_PROVIDER = "fake"
+FAKE_MODEL = "fake-replay"
+
+# 재생할 응답이 없을 때 사용하는 기본 응답
+FAKE_DEFAULT_RESPONSE = """## 종합 평가
+
+> - **총점**: 72/100점
+> - **요약**: 가짜 LLM 백엔드의 응답입니다 (부하 테스트용).
+
+| 항목 | 점수 |
+|------|------|
+| 자격요건 | 33/45 |
+| 우대사항 | 14/20 |
+| 기술스택 | 15/20 |
+| 컬쳐핏·업무방식 | 7/10 |
+| 기타 | 3/5 |
+"""
+
+
+def _env_flag(name: str, default: str = "False") -> bool:
+    return os.getenv(name, default).lower() in ("true", "1", "yes")
+
+
+def get_fake_config() -> dict:
+    """Read the fake/replay backend settings from the environment."""
+    return {
+        # 모든 provider(claude/openai/auto)를 가짜 백엔드로 대체
+        "enabled": _env_flag("LLM_FAKE_BACKEND"),
+        # 재생할 응답 JSONL (줄마다 body/result/response/text 중 하나, 배치 결과 형식)
+        "responses_path": os.getenv("LLM_FAKE_RESPONSES", ""),
+        # 첫 토큰까지의 지연과 전체 응답 시간 분포 (parse_distribution 형식)
+        "ttft": os.getenv("LLM_FAKE_TTFT", "lognormal:0.8,0.3"),
+        "latency": os.getenv("LLM_FAKE_LATENCY", "lognormal:12,0.4"),
+        # 재시도 대상 오류(529 overloaded)로 실패시킬 비율 (0~1)
+        "error_rate": float(os.getenv("LLM_FAKE_ERROR_RATE", 0)),
+        "error_status": int(os.getenv("LLM_FAKE_ERROR_STATUS", 529)),
+        # 스트리밍 청크당 글자 수
+        "chunk_chars": int(os.getenv("LLM_FAKE_CHUNK_CHARS", 8)),
+        "seed": os.getenv("LLM_FAKE_SEED"),
+    }
+
+
+def fake_backend_enabled() -> bool:
+    return get_fake_config()["enabled"]
+
+
+def uses_fake_backend(provider: str) -> bool:
+    """Return True when calls for the provider are served by the fake backend."""
+    return provider == FAKE_PROVIDER or fake_backend_enabled()
+
+
+def parse_distribution(spec: str):
+    """Parse a latency distribution spec into a sampler returning seconds.
+
+    지원 형식:
+        fixed:2            항상 2초
+        uniform:1,5        1~5초 균등 분포
+        lognormal:8,0.5    중앙값 8초, 로그 표준편차 0.5 (LLM 응답 시간에 가까운 긴 꼬리)
+        exponential:3      평균 3초 지수 분포
+
+    Raises:
+        ValueError: 알 수 없는 형식
+    """
+    name, _, params = spec.partition(":")
+    try:
+        values = [float(value) for value in params.split(",") if value.strip()]
+    except ValueError:
+        raise ValueError(f"지연 분포 형식이 올바르지 않습니다: {spec}")
+    samplers = {
+        ("fixed", 1): lambda rng: values[0],
+        ("uniform", 2): lambda rng: rng.uniform(values[0], values[1]),
+        ("lognormal", 2): lambda rng: rng.lognormvariate(math.log(values[0]), values[1]),
+        ("exponential", 1): lambda rng: rng.expovariate(1.0 / values[0]),
+    }
+    sampler = samplers.get((name.strip().lower(), len(values)))
+    if sampler is None:
+        raise ValueError(f"지연 분포 형식이 올바르지 않습니다: {spec}")
+    return lambda rng: max(0.0, sampler(rng))
+
+
+@lru_cache(maxsize=4)
+def load_fake_responses(path: str) -> tuple:
+    """Load recorded responses for replay (one JSON object or string per line).
+
+    배치 분석 결과(results.jsonl)나 요청 기록처럼 body/result/response/text 필드를 가진
+    JSONL을 그대로 사용할 수 있습니다. 구조화 결과(evaluation 필드)가 있으면 함께 보관합니다.
+    """
+    if not path:
+        return ()
+    responses = []
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if isinstance(record, str):
+                responses.append({"text": record, "evaluation": None})
+                continue
+            text = next(
+                (record[key] for key in ("body", "result", "response", "text") if record.get(key)),
+                None,
+            )
+            if text is not None:
+                responses.append({"text": text, "evaluation": record.get("evaluation")})
+    return tuple(responses)
+
+
+def example_from_schema(schema: dict):
+    """Build a minimal value that satisfies a JSON Schema (for fake structured output)."""
+    if "enum" in schema:
+        return schema["enum"][0]
+    kind = schema.get("type")
+    if kind == "object":
+        return {
+            name: example_from_schema(prop)
+            for name, prop in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        return [example_from_schema(schema.get("items", {}))]
+    if kind == "integer":
+        return 70
+    if kind == "number":
+        return 70.0
+    if kind == "boolean":
+        return True
+    return "가짜 응답"
+
+
+class FakeAPIError(Exception):
+    """Simulated provider error (retryable like an overloaded API by default)."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"가짜 LLM 백엔드 오류 (HTTP {status_code})")
+        self.status_code = status_code
+
+
+@dataclass
+class FakeCall:
+    """Plan of one simulated call: what to return, when, and whether it fails."""
+
+    text: str
+    ttft: float
+    latency: float
+    error: FakeAPIError = None
+
+    def chunks(self, size: int) -> list:
+        size = max(1, size)
+        return [self.text[i : i + size] for i in range(0, len(self.text), size)] or [""]
+
+
+class _FakeMixin:
+    """Shared sampling of the sync and async fake clients."""
+
+    def __init__(self, model: str = FAKE_MODEL, provider: str = FAKE_PROVIDER, **kwargs):
+        self.config = get_fake_config()
+        self.model = model
+        self.provider = provider
+        seed = self.config["seed"]
+        self.rng = random.Random(int(seed) if seed is not None else None)
+        self._rng_lock = threading.Lock()
+        self.sample_ttft = parse_distribution(self.config["ttft"])
+        self.sample_latency = parse_distribution(self.config["latency"])
+        self.responses = load_fake_responses(self.config["responses_path"])
+
+    def plan(self, response_schema: dict = None) -> FakeCall:
+        with self._rng_lock:
+            ttft = self.sample_ttft(self.rng)
+            latency = max(ttft, self.sample_latency(self.rng))
+            failed = self.rng.random() < self.config["error_rate"]
+            record = self.rng.choice(self.responses) if self.responses else None
+
+        if response_schema is None:
+            text = record["text"] if record else FAKE_DEFAULT_RESPONSE
+        elif (
+            record
+            and record["evaluation"] is not None
+            and response_schema["name"] == "record_evaluation"
+        ):
+            text = json.dumps(record["evaluation"], ensure_ascii=False)
+        else:
+            text = json.dumps(
+                example_from_schema(response_schema["schema"]), ensure_ascii=False
+            )
+        error = FakeAPIError(self.config["error_status"]) if failed else None
+        return FakeCall(text=text, ttft=ttft, latency=latency, error=error)
+
+    def record(self, system_prompt: str, user_message: str, text: str):
+        # 한국어/영문 혼합 텍스트를 대략 3글자당 1토큰으로 계산
+        record_usage(
+            TokenUsage(
+                provider=self.provider,
+                model=self.model,
+                input_tokens=(len(system_prompt) + len(user_message)) // 3,
+                output_tokens=len(text) // 3,
+            )
+        )
+
+    def intervals(self, call: FakeCall) -> list:
+        """(청크, 청크 전 대기 시간) 목록. 첫 청크는 TTFT, 나머지는 남은 시간을 균등 분배."""
+        chunks = call.chunks(self.config["chunk_chars"])
+        rest = (call.latency - call.ttft) / max(1, len(chunks) - 1)
+        return [(chunk, call.ttft if i == 0 else rest) for i, chunk in enumerate(chunks)]
+
+
+class FakeClient(_FakeMixin, LLMClient):
+    """Replay recorded responses with simulated latency, errors and streaming."""
+
+    def generate(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> str:
+        call = self.plan(response_schema)
+        if call.error is not None:
+            time.sleep(call.ttft)
+            raise call.error
+        time.sleep(call.latency)
+        self.record(system_prompt, user_message, call.text)
+        return call.text
+
+    def stream(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> Iterator[str]:
+        call = self.plan(response_schema)
+        if call.error is not None:
+            time.sleep(call.ttft)
+            raise call.error
+        for chunk, delay in self.intervals(call):
+            time.sleep(delay)
+            yield chunk
+        self.record(system_prompt, user_message, call.text)
+
+
+class AsyncFakeClient(_FakeMixin, AsyncLLMClient):
+    """Asyncio version of :class:`FakeClient`."""
+
+    async def generate(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> str:
+        call = self.plan(response_schema)
+        if call.error is not None:
+            await asyncio.sleep(call.ttft)
+            raise call.error
+        await asyncio.sleep(call.latency)
+        self.record(system_prompt, user_message, call.text)
+        return call.text
+
+    async def stream(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> AsyncIterator[str]:
+        call = self.plan(response_schema)
+        if call.error is not None:
+            await asyncio.sleep(call.ttft)
+            raise call.error
+        for chunk, delay in self.intervals(call):
+            await asyncio.sleep(delay)
+            yield chunk
+        self.record(system_prompt, user_message, call.text)
+
+
+def get_default_model(provider: str) -> str:
+    """Return the model used when no override is given for the provider.
+
+    가짜 백엔드를 사용하면 결과 캐시가 실제 모델의 결과와 섞이지 않도록 FAKE_MODEL을 반환합니다.
+    """
+    if uses_fake_backend(provider):
+        return FAKE_MODEL
+    if provider in MULTI_PROVIDER_MODES:
+        return "+".join(DEFAULT_MODELS[name] for name in sorted(DEFAULT_MODELS))
+    try:
+        return DEFAULT_MODELS[provider]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 provider입니다: {provider}")
+
+
+def get_triage_model(provider: str) -> tuple[str, str]:
+    """Return (provider, model) of the small model used for the quick triage pass.
+
+    auto/compare처럼 여러 provider를 쓰는 모드는 API 키가 있는 provider 중
+    가장 저렴한 OpenAI 소형 모델을 우선 사용합니다.
+    """
+    if provider in MULTI_PROVIDER_MODES:
+        available = available_providers()
+        provider = "openai" if "openai" in available or not available else available[0]
+    if uses_fake_backend(provider):
+        return provider, FAKE_MODEL
+    try:
+        return provider, TRIAGE_MODELS[provider]
+    except KeyError:
+        raise ValueError(f"지원하지 않는 provider입니다: {provider}")
 
-def get_client(provider: str, model: str = None) -> LLMClient:
-    """Get an LLM client based on the provider.
+
+def get_http_config() -> dict:
+    """Read HTTP connection pool settings for the provider SDKs from the environment."""
+    return {
+        "max_connections": int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", 100)),
+        "max_keepalive_connections": int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", 20)),
+        "keepalive_expiry": float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY", 60)),
+        "timeout": float(os.getenv("LLM_HTTP_TIMEOUT", 600)),
+        "connect_timeout": float(os.getenv("LLM_HTTP_CONNECT_TIMEOUT", 10)),
+        # HTTP/2는 h2 패키지가 설치된 경우에만 사용 (pip install h2)
+        "http2": os.getenv("LLM_HTTP2", "True").lower() in ("true", "1", "yes")
+        and importlib.util.find_spec("h2") is not None,
+    }
+
+
+# provider별 SDK 모듈명
+SDK_MODULES = {
+    "claude": "anthropic",
+    "openai": "openai",
+}
+
+
+def build_http_client(provider: str, is_async: bool = False):
+    """Build a pooled HTTP client shared by every request of one LLM client.
+
+    SDK가 제공하는 ``DefaultHttpxClient``를 기반으로 하여 SDK 기본 설정
+    (리다이렉트, TCP keep-alive 등)은 유지하고 연결 풀/타임아웃만 조정합니다.
+    """
+    import httpx
+
+    sdk = importlib.import_module(SDK_MODULES[provider])
+    client_class = sdk.DefaultAsyncHttpxClient if is_async else sdk.DefaultHttpxClient
+
+    config = get_http_config()
+    limits = httpx.Limits(
+        max_connections=config["max_connections"],
+        max_keepalive_connections=config["max_keepalive_connections"],
+        keepalive_expiry=config["keepalive_expiry"],
+    )
+    timeout = httpx.Timeout(config["timeout"], connect=config["connect_timeout"])
+    return client_class(limits=limits, timeout=timeout, http2=config["http2"])
+
+
+def create_client(
+    provider: str, model: str = None, http_client=None, max_retries: int = 2
+) -> LLMClient:
+    """Construct a new LLM client based on the provider.
 
     Args:
-        provider: 'claude' or 'openai'
+        provider: 'claude', 'openai' or 'fake' (LLM_FAKE_BACKEND이면 모두 가짜 백엔드)
         model: Optional model name override
+        http_client: Optional ``httpx.Client`` to share a connection pool
+        max_retries: SDK 자체 재시도 횟수
 
     Returns:
         LLMClient instance
     """
+    model = model or get_default_model(provider)
+    if uses_fake_backend(provider):
+        return FakeClient(model=model, provider=provider)
+    kwargs = {"model": model, "http_client": http_client, "max_retries": max_retries}
     if provider == "claude":
-        return ClaudeClient(model=model) if model else ClaudeClient()
+        return ClaudeClient(**kwargs)
     elif provider == "openai":
-        return OpenAIClient(model=model) if model else OpenAIClient()
+        return OpenAIClient(**kwargs)
     else:
         raise ValueError(f"지원하지 않는 provider입니다: {provider}")
+
+
+def create_async_client(
+    provider: str, model: str = None, http_client=None, max_retries: int = 2
+) -> AsyncLLMClient:
+    """Construct a new asyncio-native LLM client based on the provider."""
+    model = model or get_default_model(provider)
+    if uses_fake_backend(provider):
+        return AsyncFakeClient(model=model, provider=provider)
+    kwargs = {"model": model, "http_client": http_client, "max_retries": max_retries}
+    if provider == "claude":
+        return AsyncClaudeClient(**kwargs)
+    elif provider == "openai":
+        return AsyncOpenAIClient(**kwargs)
+    else:
+        raise ValueError(f"지원하지 않는 provider입니다: {provider}")
+
+
+class ClientRegistry:
+    """Process-wide registry keeping one long-lived client per (provider, model).
+
+    SDK 임포트, 환경변수 조회, httpx 연결 풀 생성이 요청마다 반복되지 않고
+    keep-alive 연결(TLS 세션)이 요청 간에 재사용됩니다.
+
+    비동기 클라이언트의 연결 풀은 이벤트 루프에 묶여 있으므로 루프별로 따로 보관합니다.
+    WSGI 서버에서는 asgiref가 요청마다 새 루프를 만들어 비동기 풀이 재사용되지 않으므로,
+    WSGI 요청은 동기 클라이언트(프로세스 공유 풀)를 사용해야 합니다 (views 참고).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    def get(self, provider: str, model: str = None) -> LLMClient:
+        """Return the shared client for (provider, model), creating it on first use."""
+        key = (provider, model or get_default_model(provider))
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    # 재시도는 ResilientClient가 담당하므로 SDK 재시도는 끔
+                    http_client = (
+                        None
+                        if uses_fake_backend(provider)
+                        else build_http_client(provider)
+                    )
+                    client = create_client(*key, http_client=http_client, max_retries=0)
+                    self._clients[key] = client
+        return client
+
+    def get_async(self, provider: str, model: str = None) -> AsyncLLMClient:
+        """Return the shared async client for (provider, model) on the running loop."""
+        key = (provider, model or get_default_model(provider))
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                client = create_async_client(
+                    *key,
+                    http_client=(
+                        None
+                        if uses_fake_backend(provider)
+                        else build_http_client(provider, is_async=True)
+                    ),
+                    max_retries=0,
+                )
+                clients[key] = client
+        return client
+
+    def reset(self):
+        """Forget every cached client (e.g. in a freshly forked worker process).
+
+        부모 프로세스의 소켓을 자식이 닫지 않도록 close() 없이 참조만 버립니다.
+        """
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._async_clients = weakref.WeakKeyDictionary()
+
+
+registry = ClientRegistry()
+
+# fork된 워커가 부모의 연결 풀을 공유하지 않도록 자식 프로세스에서 초기화
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=registry.reset)
+
+
+def warm_up(providers=None) -> list:
+    """Create pooled clients for every provider whose API key is configured.
+
+    앱 시작 시 호출하여 SDK 임포트와 클라이언트 생성 비용을 첫 요청에서 제거합니다.
+
+    Returns:
+        준비된 provider 목록
+    """
+    warmed = []
+    for provider in providers or API_KEY_ENV:
+        if provider not in available_providers():
+            continue
+        try:
+            registry.get(provider)
+            warmed.append(provider)
+        except Exception:
+            logger.warning("LLM 클라이언트 준비 실패: %s", provider, exc_info=True)
+    return warmed
+
+
+class ProviderUnavailableError(Exception):
+    """Raised when every provider is failing or its circuit breaker is open."""
+
+
+def get_resilience_config() -> dict:
+    """Read retry, retry-budget and circuit-breaker settings from the environment."""
+    return {
+        "max_retries": int(os.getenv("LLM_MAX_RETRIES", 2)),
+        "base_delay": float(os.getenv("LLM_RETRY_BASE_DELAY", 1.0)),
+        "max_delay": float(os.getenv("LLM_RETRY_MAX_DELAY", 30.0)),
+        "failover": os.getenv("LLM_FAILOVER", "True").lower() in ("true", "1", "yes"),
+    }
+
+
+# 재시도 대상 HTTP 상태 코드 (529: Anthropic overloaded)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+def is_retryable(exc: Exception) -> bool:
+    """Return True for rate limits, overload, server errors and timeouts."""
+    status_code = getattr(exc, "status_code", None)
+    if status_code is not None:
+        return status_code in RETRYABLE_STATUS_CODES
+    # SDK 연결/타임아웃 오류 (APIConnectionError, APITimeoutError)
+    names = {cls.__name__ for cls in type(exc).__mro__}
+    return bool(names & {"APIConnectionError", "APITimeoutError", "TimeoutError"})
+
+
+def get_retry_after(exc: Exception) -> float | None:
+    """Return the server-requested delay (seconds) from ``Retry-After`` headers."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        retry_at = email.utils.parsedate_to_datetime(retry_after)
+        return max(0.0, retry_at.timestamp() - time.time()) if retry_at else None
+
+
+def backoff_delay(attempt: int, exc: Exception, config: dict) -> float:
+    """Full-jitter exponential backoff that honours ``Retry-After``."""
+    retry_after = get_retry_after(exc)
+    if retry_after is not None:
+        return min(retry_after, config["max_delay"])
+    ceiling = min(config["max_delay"], config["base_delay"] * 2 ** attempt)
+    return random.uniform(0, ceiling)
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a fraction of overall request volume.
+
+    요청마다 ratio만큼 토큰이 쌓이고 재시도마다 1개를 사용합니다. 장애 중에
+    재시도가 트래픽을 몇 배로 증폭시키는 것을 막습니다.
+    """
+
+    def __init__(self, ratio: float = 0.2, initial: float = 10.0, capacity: float = 100.0):
+        self._lock = threading.Lock()
+        self.ratio = ratio
+        self.capacity = capacity
+        self.tokens = initial
+
+    def deposit(self):
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """Per-provider circuit breaker with half-open probing.
+
+    - closed: 정상. 연속 실패가 failure_threshold에 도달하면 open
+    - open: 요청 차단. reset_timeout이 지나면 half-open
+    - half-open: 한 번에 하나의 탐색 요청만 허용. 성공하면 closed, 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self._lock = threading.Lock()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started_at = 0.0
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if now - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # 취소 등으로 결과가 기록되지 않은 탐색 요청은 reset_timeout 후 만료
+            if self._probe_in_flight and now - self._probe_started_at < self.reset_timeout:
+                return False
+            self._probe_in_flight = True
+            self._probe_started_at = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_ignored(self):
+        """provider 상태와 무관한 오류(400, 인증 등): 상태는 그대로 두고 탐색 요청만 끝냅니다."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+retry_budget = RetryBudget(ratio=float(os.getenv("LLM_RETRY_BUDGET_RATIO", 0.2)))
+circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Return the process-wide circuit breaker of the provider."""
+    with _circuit_breakers_lock:
+        if provider not in circuit_breakers:
+            circuit_breakers[provider] = CircuitBreaker(
+                failure_threshold=int(os.getenv("LLM_BREAKER_FAILURES", 5)),
+                reset_timeout=float(os.getenv("LLM_BREAKER_RESET", 30)),
+            )
+        return circuit_breakers[provider]
+
+
+class _ResilientMixin:
+    """Shared provider ordering for the sync and async resilient clients."""
+
+    def __init__(self, provider: str, model: str = None, failover: bool = None):
+        self.config = get_resilience_config()
+        self.provider = provider
+        self.model = model or get_default_model(provider)
+        if failover is None:
+            failover = self.config["failover"]
+        # 실제로 응답한 provider/model (장애 조치 시 요청한 것과 다름)
+        self.served_provider = provider
+        self.served_model = self.model
+        # 요청한 provider 다음에 API 키가 있는 나머지 provider로 장애 조치
+        self.providers = [provider]
+        if failover:
+            self.providers += [p for p in available_providers() if p != provider]
+
+    def _model_for(self, provider: str) -> str:
+        return self.model if provider == self.provider else get_default_model(provider)
+
+    def _served_by(self, provider: str):
+        self.served_provider = provider
+        self.served_model = self._model_for(provider)
+
+    def _unavailable(self) -> ProviderUnavailableError:
+        return ProviderUnavailableError(
+            "AI 서비스가 일시적으로 응답하지 않습니다. 잠시 후 다시 시도해주세요."
+        )
+
+    def _should_retry(self, attempt: int, exc: Exception) -> bool:
+        return (
+            is_retryable(exc)
+            and attempt < self.config["max_retries"]
+            and retry_budget.try_withdraw()
+        )
+
+
+class ResilientClient(_ResilientMixin, LLMClient):
+    """Wrap provider clients with retries, a retry budget and circuit breakers.
+
+    재시도 가능한 오류(429/529/5xx/타임아웃)는 지터가 적용된 지수 백오프로
+    재시도하며 ``Retry-After`` 헤더를 따릅니다. provider의 서킷 브레이커가 열려
+    있거나 재시도가 모두 실패하면 다른 provider로 자동 전환합니다.
+    스트리밍은 첫 토큰을 받기 전까지만 재시도/전환합니다.
+    """
+
+    def generate(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> str:
+        retry_budget.deposit()
+        error = None
+        for provider in self.providers:
+            breaker = get_circuit_breaker(provider)
+            attempt = 0
+            while breaker.allow_request():
+                try:
+                    client = registry.get(provider, self._model_for(provider))
+                    result = client.generate(
+                        system_prompt, user_message, response_schema
+                    )
+                except Exception as e:
+                    error_tracker.record(provider, e)
+                    if not is_retryable(e):
+                        breaker.record_ignored()
+                        raise
+                    breaker.record_failure()
+                    error = e
+                    if not self._should_retry(attempt, e):
+                        break
+                    time.sleep(backoff_delay(attempt, e, self.config))
+                    attempt += 1
+                else:
+                    breaker.record_success()
+                    self._served_by(provider)
+                    return result
+        raise self._unavailable() from error
+
+    def stream(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> Iterator[str]:
+        retry_budget.deposit()
+        error = None
+        for provider in self.providers:
+            breaker = get_circuit_breaker(provider)
+            attempt = 0
+            while breaker.allow_request():
+                client = registry.get(provider, self._model_for(provider))
+                started = False
+                try:
+                    for token in client.stream(
+                        system_prompt, user_message, response_schema
+                    ):
+                        if not started:
+                            started = True
+                            self._served_by(provider)
+                        yield token
+                except Exception as e:
+                    error_tracker.record(provider, e)
+                    if started or not is_retryable(e):
+                        if is_retryable(e):
+                            breaker.record_failure()
+                        else:
+                            breaker.record_ignored()
+                        raise
+                    breaker.record_failure()
+                    error = e
+                    if not self._should_retry(attempt, e):
+                        break
+                    time.sleep(backoff_delay(attempt, e, self.config))
+                    attempt += 1
+                else:
+                    breaker.record_success()
+                    return
+        raise self._unavailable() from error
+
+
+class AsyncResilientClient(_ResilientMixin, AsyncLLMClient):
+    """Asyncio version of :class:`ResilientClient`."""
+
+    async def generate(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> str:
+        retry_budget.deposit()
+        error = None
+        for provider in self.providers:
+            breaker = get_circuit_breaker(provider)
+            attempt = 0
+            while breaker.allow_request():
+                try:
+                    client = registry.get_async(provider, self._model_for(provider))
+                    result = await client.generate(
+                        system_prompt, user_message, response_schema
+                    )
+                except Exception as e:
+                    error_tracker.record(provider, e)
+                    if not is_retryable(e):
+                        breaker.record_ignored()
+                        raise
+                    breaker.record_failure()
+                    error = e
+                    if not self._should_retry(attempt, e):
+                        break
+                    await asyncio.sleep(backoff_delay(attempt, e, self.config))
+                    attempt += 1
+                else:
+                    breaker.record_success()
+                    self._served_by(provider)
+                    return result
+        raise self._unavailable() from error
+
+    async def stream(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> AsyncIterator[str]:
+        retry_budget.deposit()
+        error = None
+        for provider in self.providers:
+            breaker = get_circuit_breaker(provider)
+            attempt = 0
+            while breaker.allow_request():
+                client = registry.get_async(provider, self._model_for(provider))
+                started = False
+                try:
+                    async for token in client.stream(
+                        system_prompt, user_message, response_schema
+                    ):
+                        if not started:
+                            started = True
+                            self._served_by(provider)
+                        yield token
+                except Exception as e:
+                    error_tracker.record(provider, e)
+                    if started or not is_retryable(e):
+                        if is_retryable(e):
+                            breaker.record_failure()
+                        else:
+                            breaker.record_ignored()
+                        raise
+                    breaker.record_failure()
+                    error = e
+                    if not self._should_retry(attempt, e):
+                        break
+                    await asyncio.sleep(backoff_delay(attempt, e, self.config))
+                    attempt += 1
+                else:
+                    breaker.record_success()
+                    return
+        raise self._unavailable() from error
+
+
+def available_providers() -> list:
+    """Return the providers whose API key is configured.
+
+    가짜 백엔드를 사용하면 API 키 없이 모든 provider를 사용할 수 있습니다.
+    """
+    if fake_backend_enabled():
+        return list(API_KEY_ENV)
+    return [provider for provider, env in API_KEY_ENV.items() if os.getenv(env)]
+
+
+class LatencyTracker:
+    """Keep a sliding window of recent per-provider latencies.
+
+    헤지 요청의 대기 시간을 최근 응답 시간의 백분위수(p90 등)에 맞춰 조정하는 데 사용합니다.
+    """
+
+    def __init__(self, window: int = 200):
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=window))
+
+    def record(self, provider: str, seconds: float):
+        with self._lock:
+            self._samples[provider].append(seconds)
+
+    def percentile(self, provider: str, q: float) -> float | None:
+        """Return the q-th percentile (0~1) of recent latencies, or None without samples."""
+        with self._lock:
+            samples = sorted(self._samples[provider])
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(q * len(samples)) - 1))
+        return samples[index]
+
+
+latency_tracker = LatencyTracker()
+
+
+class _MultiProviderMixin:
+    """Shared configuration of the sync and async multi-provider clients."""
+
+    # 지연 시간 표본이 없을 때 두 번째 provider를 호출하기까지의 대기 시간(초)
+    DEFAULT_HEDGE_DELAY = 20.0
+    MIN_HEDGE_DELAY = 2.0
+
+    def __init__(
+        self,
+        providers=None,
+        mode: str = "hedged",
+        hedge_delay: float = None,
+        hedge_percentile: float = 0.9,
+        tracker: LatencyTracker = None,
+    ):
+        if mode not in ("hedged", "compare"):
+            raise ValueError(f"지원하지 않는 모드입니다: {mode}")
+        self.tracker = tracker or latency_tracker
+        if providers is None:
+            # 최근 중앙값 응답 시간이 빠른 provider를 우선 호출
+            providers = sorted(
+                available_providers(),
+                key=lambda name: self.tracker.percentile(name, 0.5) or 0.0,
+            )
+        if not providers:
+            raise ValueError("OPENAI_API_KEY 또는 ANTHROPIC_API_KEY 환경변수를 설정해주세요.")
+        self.providers = list(providers)
+        self.mode = mode
+        self.fixed_hedge_delay = hedge_delay
+        self.hedge_percentile = hedge_percentile
+        self.model = "+".join(DEFAULT_MODELS[name] for name in self.providers)
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait on the primary provider before firing the hedge request."""
+        if self.fixed_hedge_delay is not None:
+            return self.fixed_hedge_delay
+        observed = self.tracker.percentile(self.providers[0], self.hedge_percentile)
+        if observed is None:
+            return self.DEFAULT_HEDGE_DELAY
+        return max(self.MIN_HEDGE_DELAY, observed)
+
+    def _served_by(self, provider: str):
+        # 헤지에서 채택된 provider/model을 기록 (결과 캐시 키와 표시에 사용)
+        self.served_provider = provider
+        self.served_model = DEFAULT_MODELS[provider]
+
+    @staticmethod
+    def format_comparison(results: dict) -> str:
+        """Combine per-provider results into a single markdown document."""
+        sections = []
+        for provider, result in results.items():
+            title = f"# {provider} ({DEFAULT_MODELS[provider]}) 분석 결과"
+            if isinstance(result, Exception):
+                result = f"> 분석 중 오류가 발생했습니다: {result}"
+            sections.append(f"{title}\n\n{result}")
+        return "\n\n---\n\n".join(sections)
+
+
+# 헤지/비교 요청을 실행하는 공유 스레드 풀
+_multi_provider_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("LLM_MULTI_PROVIDER_THREADS", 32)),
+    thread_name_prefix="llm-multi",
+)
+
+
+class MultiProviderClient(_MultiProviderMixin, LLMClient):
+    """Run one request against several providers.
+
+    - ``hedged``: 첫 provider가 hedge_delay 안에 응답하지 않으면 두 번째 provider를
+      호출하고 먼저 성공한 응답을 반환합니다.
+    - ``compare``: 모든 provider를 동시에 호출하고 결과를 모두 반환합니다.
+
+    동기 HTTP 호출은 도중에 중단할 수 없으므로, 진 쪽 요청은 결과만 버려집니다.
+    실제 취소가 필요하면 :class:`AsyncMultiProviderClient`를 사용하세요.
+    """
+
+    def _call(
+        self,
+        provider: str,
+        system_prompt: str,
+        user_message: str,
+        response_schema: dict = None,
+    ) -> str:
+        started = time.monotonic()
+        client = ResilientClient(provider, failover=False)
+        result = client.generate(system_prompt, user_message, response_schema)
+        self.tracker.record(provider, time.monotonic() - started)
+        return result
+
+    def compare(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> dict:
+        """Run every provider concurrently and return {provider: result or exception}."""
+        futures = {
+            provider: _multi_provider_executor.submit(
+                self._call, provider, system_prompt, user_message, response_schema
+            )
+            for provider in self.providers
+        }
+        results = {}
+        for provider, future in futures.items():
+            try:
+                results[provider] = future.result()
+            except Exception as e:
+                results[provider] = e
+        return results
+
+    def generate(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> str:
+        if self.mode == "compare":
+            return self.format_comparison(
+                self.compare(system_prompt, user_message, response_schema)
+            )
+
+        def submit(provider):
+            return _multi_provider_executor.submit(
+                self._call, provider, system_prompt, user_message, response_schema
+            )
+
+        futures = {submit(self.providers[0]): self.providers[0]}
+        pending = set(futures)
+        backups = iter(self.providers[1:])
+        timeout = self.hedge_delay()
+        error = None
+
+        while True:
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    error = e
+                    continue
+                for other in pending:
+                    other.cancel()
+                self._served_by(futures[future])
+                return result
+
+            # 시간 초과 또는 실패 시 다음 provider로 헤지
+            backup = next(backups, None)
+            if backup is not None:
+                future = submit(backup)
+                futures[future] = backup
+                pending.add(future)
+            elif not pending:
+                raise error
+            else:
+                timeout = None
+
+
+class AsyncMultiProviderClient(_MultiProviderMixin, AsyncLLMClient):
+    """Asyncio version of :class:`MultiProviderClient`.
+
+    진 쪽 요청은 태스크 취소로 즉시 연결을 끊습니다. 스트리밍 시에는 첫 토큰을
+    먼저 보낸 provider를 채택합니다.
+    """
+
+    async def _call(
+        self,
+        provider: str,
+        system_prompt: str,
+        user_message: str,
+        response_schema: dict = None,
+    ) -> str:
+        started = time.monotonic()
+        client = AsyncResilientClient(provider, failover=False)
+        try:
+            result = await client.generate(system_prompt, user_message, response_schema)
+        except asyncio.CancelledError:
+            # 헤지에서 진 요청은 취소 시점까지의 시간을 하한으로 기록
+            # (이긴 요청만 기록하면 느린 응답이 빠져 헤지 대기 시간이 짧게 치우침)
+            self.tracker.record(provider, time.monotonic() - started)
+            raise
+        self.tracker.record(provider, time.monotonic() - started)
+        return result
+
+    async def compare(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> dict:
+        """Run every provider concurrently and return {provider: result or exception}."""
+        results = await asyncio.gather(
+            *(
+                self._call(p, system_prompt, user_message, response_schema)
+                for p in self.providers
+            ),
+            return_exceptions=True,
+        )
+        return dict(zip(self.providers, results))
+
+    async def _race(self, start, discard=None):
+        """Start ``start(provider)`` coroutines with hedging and return the first winner.
+
+        Args:
+            start: provider 이름을 받아 코루틴을 반환하는 함수
+            discard: 동시에 성공했지만 채택되지 않은 결과를 정리하는 코루틴 함수
+
+        Returns:
+            (provider, result) 튜플
+        """
+        backups = iter(self.providers[1:])
+        tasks = {asyncio.create_task(start(self.providers[0])): self.providers[0]}
+        timeout = self.hedge_delay()
+        error = None
+
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    provider = tasks.pop(task)
+                    if task.exception() is None:
+                        return provider, task.result()
+                    error = task.exception()
+
+                backup = next(backups, None)
+                if backup is not None:
+                    tasks[asyncio.create_task(start(backup))] = backup
+                elif not tasks:
+                    raise error
+                else:
+                    timeout = None
+        finally:
+            # 진 쪽 요청 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif discard and not task.cancelled() and task.exception() is None:
+                    await discard(task.result())
+
+    async def generate(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> str:
+        if self.mode == "compare":
+            return self.format_comparison(
+                await self.compare(system_prompt, user_message, response_schema)
+            )
+
+        provider, result = await self._race(
+            lambda provider: self._call(
+                provider, system_prompt, user_message, response_schema
+            )
+        )
+        self._served_by(provider)
+        return result
+
+    async def stream(
+        self, system_prompt: str, user_message: str, response_schema: dict = None
+    ) -> AsyncIterator[str]:
+        if self.mode == "compare":
+            yield await self.generate(system_prompt, user_message, response_schema)
+            return
+
+        started = time.monotonic()
+
+        async def first_token(provider):
+            first_started = time.monotonic()
+            client = AsyncResilientClient(provider, failover=False)
+            iterator = client.stream(system_prompt, user_message, response_schema)
+            try:
+                return iterator, await anext(iterator)
+            except BaseException as e:
+                if isinstance(e, asyncio.CancelledError):
+                    # 진 쪽 스트림도 취소 시점까지의 시간을 하한으로 기록
+                    self.tracker.record(provider, time.monotonic() - first_started)
+                await iterator.aclose()
+                raise
+
+        async def close(result):
+            await result[0].aclose()
+
+        provider, (iterator, token) = await self._race(first_token, discard=close)
+        self._served_by(provider)
+        try:
+            yield token
+            async for token in iterator:
+                yield token
+        finally:
+            await iterator.aclose()
+        self.tracker.record(provider, time.monotonic() - started)
+
+
+def get_client(provider: str, model: str = None) -> LLMClient:
+    """Get the shared LLM client for the provider.
+
+    Args:
+        provider: 'claude', 'openai', 'auto'(헤지) or 'compare'(비교)
+        model: Optional model name override (단일 provider에만 적용)
+
+    Returns:
+        LLMClient instance
+    """
+    if provider in MULTI_PROVIDER_MODES:
+        return MultiProviderClient(mode=MULTI_PROVIDER_MODES[provider])
+    return ResilientClient(provider, model)
+
+
+def get_async_client(provider: str, model: str = None) -> AsyncLLMClient:
+    """Get the shared asyncio-native LLM client for the provider.
+
+    Must be called from a running event loop.
+
+    Args:
+        provider: 'claude', 'openai', 'auto'(헤지) or 'compare'(비교)
+        model: Optional model name override (단일 provider에만 적용)
+
+    Returns:
+        AsyncLLMClient instance
+    """
+    if provider in MULTI_PROVIDER_MODES:
+        return AsyncMultiProviderClient(mode=MULTI_PROVIDER_MODES[provider])
+    return AsyncResilientClient(provider, model)
+
+
+# 비동기 Batches API 상태 (provider별 상태값을 정규화)
+BATCH_STATUS_MAP = {
+    "claude": {
+        "in_progress": "in_progress",
+        "canceling": "in_progress",
+        "ended": "ended",
+    },
+    "openai": {
+        "validating": "in_progress",
+        "in_progress": "in_progress",
+        "finalizing": "in_progress",
+        "cancelling": "in_progress",
+        "completed": "ended",
+        "failed": "failed",
+        "expired": "ended",
+        "cancelled": "ended",
+    },
+}
+
+
+def _batch_sdk_client(provider: str, model: str = None):
+    if provider not in BATCH_STATUS_MAP:
+        raise ValueError(f"Batches API를 지원하지 않는 provider입니다: {provider}")
+    if uses_fake_backend(provider):
+        raise ValueError("가짜 LLM 백엔드는 Batches API를 지원하지 않습니다.")
+    # 드물게 호출되는 오프라인 작업이므로 SDK 기본 재시도를 사용하는 별도 클라이언트 사용
+    return create_client(provider, model or DEFAULT_MODELS[provider]).client
+
+
+def create_provider_batch(
+    provider: str,
+    model: str,
+    system_prompt: str,
+    requests: list,
+    response_schema: dict = None,
+) -> str:
+    """Submit requests to the provider's asynchronous Batches API (약 50% 저렴).
+
+    결과는 보통 수 분~수 시간 안에, 최대 24시간 안에 준비됩니다.
+
+    Args:
+        requests: (custom_id, user_message) 목록. custom_id는 영문/숫자/-/_ 64자 이내
+
+    Returns:
+        provider의 배치 ID
+    """
+    client = _batch_sdk_client(provider, model)
+
+    if provider == "claude":
+        batch = client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": {
+                        "model": model,
+                        "max_tokens": 8192,
+                        "system": claude_system(system_prompt),
+                        "messages": [{"role": "user", "content": user_message}],
+                        **claude_tool_options(response_schema),
+                    },
+                }
+                for custom_id, user_message in requests
+            ]
+        )
+        return batch.id
+
+    lines = []
+    for custom_id, user_message in requests:
+        body = {
+            "model": model,
+            "max_tokens": OpenAIClient.MAX_TOKENS_MAP.get(model, 4096),
+            **openai_request(system_prompt, user_message, response_schema),
+        }
+        # Batches API 요청 본문에는 extra_body 대신 필드를 직접 넣음
+        body.update(body.pop("extra_body", {}))
+        lines.append(
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": body,
+                },
+                ensure_ascii=False,
+            )
+        )
+    input_file = client.files.create(
+        file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    return batch.id
+
+
+def get_provider_batch_status(provider: str, batch_id: str) -> str:
+    """Return 'in_progress', 'ended' or 'failed' for a submitted batch."""
+    client = _batch_sdk_client(provider)
+    if provider == "claude":
+        status = client.messages.batches.retrieve(batch_id).processing_status
+    else:
+        status = client.batches.retrieve(batch_id).status
+    return BATCH_STATUS_MAP[provider].get(status, "in_progress")
+
+
+def iter_provider_batch_results(
+    provider: str, batch_id: str, model: str = None
+) -> Iterator[tuple]:
+    """Yield (custom_id, text, error) for every request of an ended batch."""
+    client = _batch_sdk_client(provider, model)
+
+    if provider == "claude":
+        for entry in client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                message = entry.result.message
+                record_usage(_claude_usage(message.model, message.usage))
+                yield entry.custom_id, claude_output(message.content), None
+            else:
+                error = getattr(entry.result, "error", None) or entry.result.type
+                yield entry.custom_id, None, str(error)
+        return
+
+    batch = client.batches.retrieve(batch_id)
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        for line in client.files.content(file_id).text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            body = response.get("body") or {}
+            if response.get("status_code") == 200 and body.get("choices"):
+                usage = body.get("usage") or {}
+                record_usage(
+                    TokenUsage(
+                        provider="openai",
+                        model=body.get("model", model or ""),
+                        input_tokens=usage.get("prompt_tokens", 0),
+                        output_tokens=usage.get("completion_tokens", 0),
+                        cached_input_tokens=(
+                            usage.get("prompt_tokens_details") or {}
+                        ).get("cached_tokens", 0),
+                    )
+                )
+                yield entry["custom_id"], body["choices"][0]["message"]["content"], None
+            else:
+                error = entry.get("error") or body.get("error") or response
+                yield entry["custom_id"], None, json.dumps(error, ensure_ascii=False)